@@ -4,6 +4,9 @@ Generates data-driven insights from demographic analysis
 """
 
 import os
+import json
+import hashlib
+from pathlib import Path
 from typing import Dict, List, Optional
 import pandas as pd
 from openai import AzureOpenAI
@@ -12,8 +15,18 @@ from openai import AzureOpenAI
 class AIInsightsGenerator:
     """Generate AI-powered insights using Azure OpenAI"""
 
+    SYSTEM_PROMPT = "You are an expert election data analyst who provides concise, data-driven insights in plain text format without any markdown."
+    STRATEGIST_SYSTEM_PROMPT = "You are an expert election strategist who provides concise, data-driven insights in plain text format without any markdown."
+
+    # Bump when insight post-processing changes so stale cached insights are not reused
+    INSIGHT_VERSION = '1'
+
+    # Cached insights kept on disk; least recently used entries beyond this are evicted
+    CACHE_MAX_ENTRIES = 1024
+
     def __init__(self, api_key: Optional[str] = None, endpoint: Optional[str] = None,
-                 deployment_name: Optional[str] = None, api_version: Optional[str] = None):
+                 deployment_name: Optional[str] = None, api_version: Optional[str] = None,
+                 cache_dir: Optional[str] = None):
         """
         Initialize Azure OpenAI client
 
@@ -22,12 +35,12 @@ class AIInsightsGenerator:
             endpoint: Azure OpenAI endpoint (or set AZURE_OPENAI_ENDPOINT env var)
             deployment_name: Deployment name (or set AZURE_OPENAI_DEPLOYMENT env var)
             api_version: API version (or set AZURE_OPENAI_API_VERSION env var)
+            cache_dir: Directory for cached insights (defaults to data/cache/ai)
         """
         # Try to load from config file first
         config_file = os.path.join(os.path.dirname(__file__), '../../../config.json')
         config_file = os.path.abspath(config_file)
         if os.path.exists(config_file):
-            import json
             with open(config_file, 'r') as f:
                 config = json.load(f)
                 azure_config = config.get('azure_openai', {})
@@ -52,6 +65,55 @@ class AIInsightsGenerator:
             api_version=self.api_version,
             azure_endpoint=self.endpoint
         )
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(__file__).resolve().parents[2] / 'data' / 'cache' / 'ai'
+
+    def _complete(self, prompt: str, system_prompt: str = SYSTEM_PROMPT) -> str:
+        """Run a chat completion, reusing the stored insight for an identical request"""
+        request = {
+            'model': self.deployment_name,
+            'messages': [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.7,
+            'max_tokens': 600
+        }
+
+        # Exact-match cache keyed by the full request and insight version, so re-runs skip the API call
+        key_source = json.dumps(request, sort_keys=True) + self.INSIGHT_VERSION
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        cache_path = self.cache_dir / f"{key}.txt"
+        try:
+            insight = cache_path.read_text(encoding='utf-8')
+            # Touch the entry so eviction treats it as recently used
+            os.utime(cache_path)
+            return insight
+        except OSError:
+            pass
+
+        response = self.client.chat.completions.create(**request)
+        insight = response.choices[0].message.content.strip()
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(insight, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+            self._evict_cache()
+        except OSError as e:
+            print(f"  Could not cache AI insight: {e}")
+
+        return insight
+
+    def _evict_cache(self):
+        """Drop least recently used cache entries beyond CACHE_MAX_ENTRIES"""
+        entries = list(self.cache_dir.glob('*.txt'))
+        if len(entries) <= self.CACHE_MAX_ENTRIES:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.CACHE_MAX_ENTRIES]:
+            entry.unlink(missing_ok=True)
 
     def generate_religious_demographic_insight(self, religion_data: Dict) -> str:
         """
@@ -77,17 +139,7 @@ Be specific, data-driven, and avoid generic advice like "conduct meetings". Focu
 
 IMPORTANT: Output plain text only. Do NOT use markdown formatting (no **, *, _, ##, bullets, etc.). Write in clear prose."""
 
-        response = self.client.chat.completions.create(
-            model=self.deployment_name,
-            messages=[
-                {"role": "system", "content": "You are an expert election data analyst who provides concise, data-driven insights in plain text format without any markdown."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content.strip()
+        return self._complete(prompt)
 
     def generate_age_demographic_insight(self, age_data: Dict) -> str:
         """
@@ -113,17 +165,7 @@ Be specific and data-focused.
 
 IMPORTANT: Output plain text only. Do NOT use markdown formatting (no **, *, _, ##, bullets, etc.). Write in clear prose."""
 
-        response = self.client.chat.completions.create(
-            model=self.deployment_name,
-            messages=[
-                {"role": "system", "content": "You are an expert election data analyst who provides concise, data-driven insights in plain text format without any markdown."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content.strip()
+        return self._complete(prompt)
 
     def generate_gender_insight(self, gender_data: Dict) -> str:
         """
@@ -148,17 +190,7 @@ Provide data-driven observations about gender dynamics and their electoral signi
 
 IMPORTANT: Output plain text only. Do NOT use markdown formatting (no **, *, _, ##, bullets, etc.). Write in clear prose."""
 
-        response = self.client.chat.completions.create(
-            model=self.deployment_name,
-            messages=[
-                {"role": "system", "content": "You are an expert election data analyst who provides concise, data-driven insights in plain text format without any markdown."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content.strip()
+        return self._complete(prompt)
 
     def generate_household_insight(self, household_stats: Dict, large_households: List) -> str:
         """
@@ -185,17 +217,7 @@ Provide data-driven observations about household voting patterns and their strat
 
 IMPORTANT: Output plain text only. Do NOT use markdown formatting (no **, *, _, ##, bullets, etc.). Write in clear prose."""
 
-        response = self.client.chat.completions.create(
-            model=self.deployment_name,
-            messages=[
-                {"role": "system", "content": "You are an expert election data analyst who provides concise, data-driven insights in plain text format without any markdown."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content.strip()
+        return self._complete(prompt)
 
     def generate_cross_demographic_insight(self, cross_data: Dict) -> str:
         """
@@ -220,17 +242,7 @@ Be specific and data-focused.
 
 IMPORTANT: Output plain text only. Do NOT use markdown formatting (no **, *, _, ##, bullets, etc.). Write in clear prose."""
 
-        response = self.client.chat.completions.create(
-            model=self.deployment_name,
-            messages=[
-                {"role": "system", "content": "You are an expert election data analyst who provides concise, data-driven insights in plain text format without any markdown."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content.strip()
+        return self._complete(prompt)
 
     def generate_geographic_insight(self, geographic_data: Dict) -> str:
         """
@@ -255,17 +267,7 @@ Be specific and data-focused.
 
 IMPORTANT: Output plain text only. Do NOT use markdown formatting (no **, *, _, ##, bullets, etc.). Write in clear prose."""
 
-        response = self.client.chat.completions.create(
-            model=self.deployment_name,
-            messages=[
-                {"role": "system", "content": "You are an expert election data analyst who provides concise, data-driven insights in plain text format without any markdown."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content.strip()
+        return self._complete(prompt)
 
     def generate_anomaly_insight(self, anomalies: List[Dict]) -> str:
         """
@@ -289,17 +291,7 @@ Explain what these outliers reveal about the electorate and their strategic impl
 
 IMPORTANT: Output plain text only. Do NOT use markdown formatting (no **, *, _, ##, bullets, etc.). Write in clear prose."""
 
-        response = self.client.chat.completions.create(
-            model=self.deployment_name,
-            messages=[
-                {"role": "system", "content": "You are an expert election data analyst who provides concise, data-driven insights in plain text format without any markdown."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content.strip()
+        return self._complete(prompt)
 
     def generate_comprehensive_strategy_insight(self, all_data: Dict) -> str:
         """
@@ -325,17 +317,7 @@ Be specific, data-driven, and actionable.
 
 IMPORTANT: Output plain text only. Do NOT use markdown formatting (no **, *, _, ##, bullets, etc.). Write in clear prose."""
 
-        response = self.client.chat.completions.create(
-            model=self.deployment_name,
-            messages=[
-                {"role": "system", "content": "You are an expert election strategist who provides concise, data-driven insights in plain text format without any markdown."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=600
-        )
-
-        return response.choices[0].message.content.strip()
+        return self._complete(prompt, self.STRATEGIST_SYSTEM_PROMPT)
 
     # Helper methods for formatting data
 
@@ -9,6 +9,7 @@ from typing import Dict, List, Tuple, Optional
 from collections import Counter
 import re
 import builtins
+import functools
 
 class DemographicAnalyzer:
     """Analyze demographic patterns in voter data"""
@@ -25,13 +26,30 @@ class DemographicAnalyzer:
             self.data[['Gender', 'Age']] = self.data['Gender / Age'].str.extract(r'([MF])\s*/\s*(\d+)')
             self.data['Age'] = pd.to_numeric(self.data['Age'], errors='coerce')
 
-            # Fix age anomalies (e.g., age > 150)
-            self.data.loc[self.data['Age'] > 150, 'Age'] = np.nan
+            # Fix age anomalies (e.g., age > 150) as float ages; whole-column assignments never write
+            # into a frame shared with the caller
+            ages = self.data['Age'].astype('float64')
+            self.data['Age'] = ages.mask(ages > 150)
 
             # Fill missing ages with median
             median_age = self.data['Age'].median()
             if pd.notna(median_age):
-                self.data['Age'].fillna(median_age, inplace=True)
+                self.data['Age'] = self.data['Age'].fillna(median_age)
+
+    @functools.cached_property
+    def _sorted_ages(self) -> np.ndarray:
+        """Non-missing ages sorted once, so each age-range count is two binary searches"""
+        return np.sort(self.data['Age'].dropna().to_numpy(dtype=float))
+
+    def _count_ages(self, low: float, high: float = np.inf) -> int:
+        """Number of voters with low <= Age <= high"""
+        ages = self._sorted_ages
+        return int(np.searchsorted(ages, high, side='right') - np.searchsorted(ages, low, side='left'))
+
+    @functools.cached_property
+    def _religion_counts(self) -> pd.Series:
+        """Religion value counts shared by the distribution, vote bank and swing checks"""
+        return self.data['religion'].value_counts()
 
     def get_basic_stats(self) -> Dict:
         """Get basic demographic statistics"""
@@ -68,22 +86,23 @@ class DemographicAnalyzer:
         age_data = self.data['Age'].dropna()
 
         # Age groups
+        count = self._count_ages
         age_groups = {
-            'youth_18_30': int(((age_data >= 18) & (age_data <= 30)).sum()),
-            'middle_31_60': int(((age_data >= 31) & (age_data <= 60)).sum()),
-            'senior_60_plus': int((age_data > 60).sum()),
-            'first_time_18_21': int(((age_data >= 18) & (age_data <= 21)).sum()),
-            'elderly_65_plus': int((age_data >= 65).sum())
+            'youth_18_30': count(18, 30),
+            'middle_31_60': count(31, 60),
+            'senior_60_plus': int(len(self._sorted_ages) - np.searchsorted(self._sorted_ages, 60, side='right')),
+            'first_time_18_21': count(18, 21),
+            'elderly_65_plus': count(65)
         }
 
         # Generational breakdown
         current_year = 2025
         generations = {
-            'gen_z_18_29': int(((age_data >= 18) & (age_data <= 29)).sum()),
-            'millennials_30_44': int(((age_data >= 30) & (age_data <= 44)).sum()),
-            'gen_x_45_59': int(((age_data >= 45) & (age_data <= 59)).sum()),
-            'boomers_60_74': int(((age_data >= 60) & (age_data <= 74)).sum()),
-            'silent_75_plus': int((age_data >= 75).sum())
+            'gen_z_18_29': count(18, 29),
+            'millennials_30_44': count(30, 44),
+            'gen_x_45_59': count(45, 59),
+            'boomers_60_74': count(60, 74),
+            'silent_75_plus': count(75)
         }
 
         total_age_data = len(age_data)
@@ -103,7 +122,7 @@ class DemographicAnalyzer:
         if 'religion' not in self.data.columns:
             return {'error': 'Religion data not available'}
 
-        religion_counts = self.data['religion'].value_counts()
+        religion_counts = self._religion_counts
         total = int(religion_counts.sum())
 
         distribution = {}
@@ -277,7 +296,7 @@ class DemographicAnalyzer:
 
         # Religion-based
         if 'religion' in self.data.columns:
-            for religion, count in self.data['religion'].value_counts().items():
+            for religion, count in self._religion_counts.items():
                 if count >= self.total_voters * 0.15:  # At least 15% to be significant
                     vote_banks.append({
                         'type': 'religion',
@@ -288,7 +307,7 @@ class DemographicAnalyzer:
 
         # Age-based
         if 'Age' in self.data.columns:
-            youth = int(((self.data['Age'] >= 18) & (self.data['Age'] <= 35)).sum())
+            youth = self._count_ages(18, 35)
             if youth >= self.total_voters * 0.25:
                 vote_banks.append({
                     'type': 'age',
@@ -305,15 +324,15 @@ class DemographicAnalyzer:
 
         # Middle-aged voters often considered swing
         if 'Age' in self.data.columns:
-            middle_aged = self.data[(self.data['Age'] >= 35) & (self.data['Age'] <= 55)]
+            middle_aged = self._count_ages(35, 55)
             swing_groups['middle_aged_35_55'] = {
-                'count': len(middle_aged),
-                'percentage': round(len(middle_aged) / self.total_voters * 100, 2)
+                'count': middle_aged,
+                'percentage': round(middle_aged / self.total_voters * 100, 2)
             }
 
         # Religious minorities in diverse areas
         if 'religion' in self.data.columns:
-            religion_counts = self.data['religion'].value_counts()
+            religion_counts = self._religion_counts
             if len(religion_counts) > 1:
                 for religion in religion_counts.index[1:]:  # All except majority
                     if religion_counts[religion] >= self.total_voters * 0.05:  # At least 5%
@@ -3,6 +3,7 @@ Election Strategic Insights Module
 Provides strategic classification and campaign recommendations for polling stations
 """
 
+import functools
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
@@ -22,6 +23,11 @@ class ElectionInsights:
             self.data[['Gender', 'Age']] = self.data['Gender / Age'].str.extract(r'([MF])\s*/\s*(\d+)')
             self.data['Age'] = pd.to_numeric(self.data['Age'], errors='coerce')
 
+    @functools.cached_property
+    def _religion_counts(self) -> pd.Series:
+        """Voters per religion, most common first (shared by the classification, scenario and action methods)"""
+        return self.data['religion'].value_counts()
+
     def classify_polling_station(self) -> Dict:
         """
         Classify polling station as SAFE BASE, SWING, or CONTESTED
@@ -31,7 +37,7 @@ class ElectionInsights:
 
         # Get religion distribution
         if 'religion' in self.data.columns:
-            religion_counts = self.data['religion'].value_counts()
+            religion_counts = self._religion_counts
             total = religion_counts.sum()
 
             # Calculate percentages
@@ -93,7 +99,7 @@ class ElectionInsights:
         if 'religion' not in self.data.columns:
             return {'error': 'Religion data not available for scenario calculation'}
 
-        religion_counts = self.data['religion'].value_counts()
+        religion_counts = self._religion_counts
         total = self.total_voters
 
         # Target vote share needed to win (50% + 1)
@@ -357,7 +363,7 @@ class ElectionInsights:
 
         # Get basic stats for decision making
         if 'religion' in self.data.columns:
-            religion_counts = self.data['religion'].value_counts()
+            religion_counts = self._religion_counts
             dominant_religion = religion_counts.index[0] if len(religion_counts) > 0 else None
 
             if dominant_religion:
@@ -113,7 +113,7 @@ class GeographicAnalyzer:
         if 'house_address' not in self.data.columns or 'religion' not in self.data.columns:
             return [{'error': 'Missing required columns'}]
 
-        df = self.data.copy()
+        df = self.data[['house_address', 'religion']].copy()
         df['house_number'] = df['house_address'].apply(self._extract_house_number)
         df = df[df['house_number'].notna()]
 
@@ -121,33 +121,23 @@ class GeographicAnalyzer:
         enclaves = []
         window_size = 50  # Analyze in windows of 50 house numbers
 
-        min_house = df['house_number'].min()
-        max_house = df['house_number'].max()
-
-        current = min_house
-        while current < max_house:
-            window_data = df[(df['house_number'] >= current) & (df['house_number'] < current + window_size)]
-
-            if len(window_data) >= 20:  # Minimum 20 voters to be significant
-                religion_counts = window_data['religion'].value_counts()
-
-                if len(religion_counts) > 0:
-                    dominant = religion_counts.index[0]
-                    dominant_count = religion_counts.iloc[0]
-                    dominant_pct = round(dominant_count / len(window_data) * 100, 1)
-
-                    # If > 70% of one religion, it's an enclave
-                    if dominant_pct >= 70:
-                        enclaves.append({
-                            'house_range': f"{int(current)}-{int(current + window_size)}",
-                            'religion': dominant,
-                            'total_voters': len(window_data),
-                            'dominant_count': int(dominant_count),
-                            'dominance_percentage': dominant_pct,
-                            'diversity_index': self._calculate_diversity_index(religion_counts)
-                        })
-
-            current += window_size
+        # Minimum 20 voters to be significant
+        for current, window_voters, religion_counts in self._window_religion_counts(df, window_size, min_voters=20):
+            if len(religion_counts) > 0:
+                dominant = religion_counts.index[0]
+                dominant_count = religion_counts.iloc[0]
+                dominant_pct = round(dominant_count / window_voters * 100, 1)
+
+                # If > 70% of one religion, it's an enclave
+                if dominant_pct >= 70:
+                    enclaves.append({
+                        'house_range': f"{int(current)}-{int(current + window_size)}",
+                        'religion': dominant,
+                        'total_voters': window_voters,
+                        'dominant_count': int(dominant_count),
+                        'dominance_percentage': dominant_pct,
+                        'diversity_index': self._calculate_diversity_index(religion_counts)
+                    })
 
         # Sort by dominance
         enclaves.sort(key=lambda x: x['dominance_percentage'], reverse=True)
@@ -164,49 +154,38 @@ class GeographicAnalyzer:
         if 'house_address' not in self.data.columns or 'religion' not in self.data.columns:
             return [{'error': 'Missing required columns'}]
 
-        df = self.data.copy()
+        df = self.data[['house_address', 'religion']].copy()
         df['house_number'] = df['house_address'].apply(self._extract_house_number)
         df = df[df['house_number'].notna()]
 
         mixed_areas = []
         window_size = 50
 
-        min_house = df['house_number'].min()
-        max_house = df['house_number'].max()
-
-        current = min_house
-        while current < max_house:
-            window_data = df[(df['house_number'] >= current) & (df['house_number'] < current + window_size)]
-
-            if len(window_data) >= 20:
-                religion_counts = window_data['religion'].value_counts()
-
-                if len(religion_counts) >= 2:  # At least 2 religions present
-                    # Calculate diversity
-                    diversity_index = self._calculate_diversity_index(religion_counts)
+        for current, window_voters, religion_counts in self._window_religion_counts(df, window_size, min_voters=20):
+            if len(religion_counts) >= 2:  # At least 2 religions present
+                # Calculate diversity
+                diversity_index = self._calculate_diversity_index(religion_counts)
 
-                    # High diversity if no religion > 60% and diversity index > 0.5
-                    max_pct = (religion_counts.iloc[0] / len(window_data)) * 100
+                # High diversity if no religion > 60% and diversity index > 0.5
+                max_pct = (religion_counts.iloc[0] / window_voters) * 100
 
-                    if max_pct < 60 and diversity_index > 0.5:
-                        religion_breakdown = {
-                            rel: {
-                                'count': int(count),
-                                'percentage': round(count / len(window_data) * 100, 1)
-                            }
-                            for rel, count in religion_counts.items()
+                if max_pct < 60 and diversity_index > 0.5:
+                    religion_breakdown = {
+                        rel: {
+                            'count': int(count),
+                            'percentage': round(count / window_voters * 100, 1)
                         }
+                        for rel, count in religion_counts.items()
+                    }
 
-                        mixed_areas.append({
-                            'house_range': f"{int(current)}-{int(current + window_size)}",
-                            'total_voters': len(window_data),
-                            'religions_present': len(religion_counts),
-                            'diversity_index': round(diversity_index, 3),
-                            'religion_breakdown': religion_breakdown,
-                            'strategic_importance': 'HIGH - Swing area with diverse demographics'
-                        })
-
-            current += window_size
+                    mixed_areas.append({
+                        'house_range': f"{int(current)}-{int(current + window_size)}",
+                        'total_voters': window_voters,
+                        'religions_present': len(religion_counts),
+                        'diversity_index': round(diversity_index, 3),
+                        'religion_breakdown': religion_breakdown,
+                        'strategic_importance': 'HIGH - Swing area with diverse demographics'
+                    })
 
         # Sort by diversity index
         mixed_areas.sort(key=lambda x: x['diversity_index'], reverse=True)
@@ -329,6 +308,53 @@ class GeographicAnalyzer:
             'religion_diversity': len(religion_counts)
         }
 
+    def _window_religion_counts(self, df: pd.DataFrame, window_size: int,
+                                min_voters: int) -> List[Tuple[float, int, pd.Series]]:
+        """
+        Religion counts for every house number window, from one grouped pass
+
+        Windows are [start, start + window_size) stepping up from the lowest house number
+        and stopping before the highest one.
+
+        Args:
+            df: DataFrame with house_number and religion columns
+            window_size: Width of each window in house numbers
+            min_voters: Skip windows with fewer voters than this
+
+        Returns:
+            List of (window start, voters in window, religion counts) tuples in window
+            order; counts are ordered like value_counts (most common first, ties by
+            first appearance)
+        """
+        if len(df) == 0:
+            return []
+
+        min_house = df['house_number'].min()
+        n_windows = int(np.ceil((df['house_number'].max() - min_house) / window_size))
+
+        # Window index for every voter, dropping the highest house number if it starts a new window
+        window = ((df['house_number'] - min_house) // window_size).astype(np.int64)
+        in_range = window < n_windows
+        window = window[in_range]
+        window_voters = np.bincount(window.to_numpy(), minlength=n_windows)
+
+        # Count each (window, religion) pair, then order religions by count within each window
+        pairs = pd.DataFrame({'window': window, 'religion': df['religion'][in_range]})
+        counts = pairs.groupby(['window', 'religion'], sort=False).size().reset_index(name='count')
+        counts = counts.sort_values(['window', 'count'], ascending=[True, False], kind='stable')
+
+        count_windows = counts['window'].to_numpy()
+        religions = counts['religion'].to_numpy()
+        religion_totals = counts['count'].to_numpy()
+
+        windows = []
+        for w in np.flatnonzero(window_voters >= min_voters):
+            start, end = np.searchsorted(count_windows, [w, w + 1])
+            religion_counts = pd.Series(religion_totals[start:end], index=religions[start:end])
+            windows.append((min_house + w * window_size, int(window_voters[w]), religion_counts))
+
+        return windows
+
     def _define_house_number_regions(self, df: pd.DataFrame) -> Dict[str, Tuple[float, float]]:
         """
         Define house number regions (Low, Mid, High)
@@ -3,17 +3,53 @@ Household-based Family Analysis Module for Election Insights
 Identifies influential households based on house address (OldWard No/ House No.)
 """
 
+import copy
+import functools
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from collections import Counter, defaultdict
 
+
+def _cached_result(method):
+    """Memoize an analyzer method per instance, keyed on its call arguments (callers get their own copy)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Reprocess and drop cached results if the underlying frame was replaced
+        if self._data_version != id(self.data):
+            self._preprocess_data()
+            self._cache.clear()
+            self._data_version = id(self.data)
+
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return copy.deepcopy(self._cache[key])
+
+    return wrapper
+
+
 class HouseholdAnalyzer:
     """Analyze households and influential families based on house address"""
 
+    # Campaign strategy fragments: by size bucket (<5, 5-9, 10+) and by household type
+    SIZE_STRATEGIES = (
+        "Door-to-door canvassing",
+        "Personal home visit by campaign team",
+        "High-priority personal visit by senior leader"
+    )
+    HOUSEHOLD_TYPE_STRATEGIES = {
+        "Joint Family": "Focus on family head/eldest member",
+        "Extended Family": "Focus on family head/eldest member",
+        "Large Joint Family": "Focus on family head/eldest member",
+        "Multi-Family House": "Multiple touchpoints for different families"
+    }
+
     def __init__(self, data: pd.DataFrame):
         self.data = data
         self._preprocess_data()
+        self._cache = {}
+        self._data_version = id(self.data)
 
     def _preprocess_data(self):
         """Preprocess data for household analysis"""
@@ -28,13 +64,43 @@ class HouseholdAnalyzer:
         else:
             self.data['house_address'] = self.data['OldWard No/ House No.']
 
-        # Extract age and gender if needed
+        # Create household identifier using house_address + first 2 letters of house name
+        self.data['household_id'] = self.data.apply(self._create_household_id, axis=1)
+
+        # Filter out blank/'N/A'/'Unknown' addresses once for all household groupings
+        addresses = self.data['house_address']
+        invalid_address = (
+            addresses.isna()
+            | addresses.astype(str).str.strip().isin(['', 'N/A'])
+            | addresses.astype(str).str.contains('Unknown', na=False)
+        )
+        self._valid_address = ~invalid_address
+        self._valid_data = self.data[self._valid_address]
+
+        # Age/gender extraction and the household grouping are deferred until a method needs them
+        for name in ('_valid_data_with_age', '_household_groups', '_household_sizes'):
+            self.__dict__.pop(name, None)
+
+    @functools.cached_property
+    def _valid_data_with_age(self) -> pd.DataFrame:
+        """Valid-address rows with Gender and Age extracted (computed on first use)"""
         if 'Gender / Age' in self.data.columns and 'Age' not in self.data.columns:
             self.data[['Gender', 'Age']] = self.data['Gender / Age'].str.extract(r'([MF])\s*/\s*(\d+)')
+            # Float ages (NaN when missing): this frame is the caller's, so it keeps the plain numeric dtype
             self.data['Age'] = pd.to_numeric(self.data['Age'], errors='coerce')
 
-        # Create household identifier using house_address + first 2 letters of house name
-        self.data['household_id'] = self.data.apply(self._create_household_id, axis=1)
+        # Re-slice so columns added to the shared frame since preprocessing are included
+        return self.data[self._valid_address]
+
+    @functools.cached_property
+    def _household_groups(self):
+        """Valid-address rows grouped by household, shared by every household query"""
+        return self._valid_data.groupby('household_id')
+
+    @functools.cached_property
+    def _household_sizes(self) -> pd.Series:
+        """Voter count per valid household (computed on first use)"""
+        return self._household_groups.size()
 
     def _get_first_two_letters(self, house_name: str) -> str:
         """Extract first 2 letters from house name (uppercase, letters only)"""
@@ -66,6 +132,20 @@ class HouseholdAnalyzer:
 
         return f"{house_address}|{first_two}"
 
+    def _display_addresses(self, data: pd.DataFrame) -> pd.Series:
+        """Build 'house_address (most common house name)' display strings per household"""
+        house_addresses = data.groupby('household_id')['house_address'].first()
+        if 'House Name' not in data.columns:
+            return house_addresses
+
+        # Most common house name per household (ties broken alphabetically, like mode())
+        name_counts = data.groupby(['household_id', 'House Name']).size().reset_index(name='count')
+        name_counts = name_counts.sort_values(['household_id', 'count', 'House Name'], ascending=[True, False, True])
+        house_names = name_counts.drop_duplicates('household_id').set_index('household_id')['House Name']
+        house_names = house_names.reindex(house_addresses.index).fillna('N/A')
+
+        return house_addresses.astype(str) + ' (' + house_names.astype(str) + ')'
+
     def _extract_house_number(self, house_address: str) -> Optional[int]:
         """Extract numeric house number from address (e.g., '039/1515' -> 1515)"""
         try:
@@ -123,32 +203,34 @@ class HouseholdAnalyzer:
                 'label': f'High Numbers ({int(mid_boundary)+1}-{max_house})'
             }
 
+    @_cached_result
     def get_top_influential_households(self, top_n: int = 20) -> List[Dict]:
         """
         Get top N influential households based on voter count
         Returns list of households with all member details
         """
-        # Group by household_id (house_address + first 2 letters of house name)
-        house_groups = self.data.groupby('household_id')
-
-        # Calculate household sizes
-        house_sizes = house_groups.size().sort_values(ascending=False)
+        # Households are grouped by household_id (house_address + first 2 letters of house name)
+        house_groups = self._household_groups
 
-        # Filter out 'Unknown' or invalid addresses
-        house_sizes = house_sizes[~house_sizes.index.str.contains('Unknown', na=False)]
+        # Get top N households by size (partial selection, no full sort)
+        top_houses = self._household_sizes.nlargest(top_n)
 
-        # Get top N households
-        top_houses = house_sizes.head(top_n)
+        # Classify all top households in one vectorized pass
+        if "Guardian's Name" in self.data.columns:
+            guardian_counts = house_groups["Guardian's Name"].nunique().reindex(top_houses.index)
+        else:
+            guardian_counts = pd.Series(1, index=top_houses.index)
+        household_types = self._determine_household_types(top_houses, guardian_counts)
 
         influential_households = []
         total_voters = len(self.data)
 
         for household_id, member_count in top_houses.items():
             # Get all members of this household
-            household_data = self.data[self.data['household_id'] == household_id]
+            household_data = self._valid_data_with_age[self._valid_data_with_age['household_id'] == household_id]
 
             # Extract original house address and most common house name
-            house_address = household_data['house_address'].iloc[0] if len(household_data) > 0 else 'Unknown'
+            house_address = household_data['house_address'].iat[0]
             if 'House Name' in household_data.columns:
                 house_name = household_data['House Name'].mode()[0] if len(household_data['House Name'].mode()) > 0 else 'N/A'
             else:
@@ -161,17 +243,19 @@ class HouseholdAnalyzer:
             religion_comp = household_data['religion'].value_counts().to_dict() if 'religion' in household_data.columns else {}
 
             # Identify potential head of household (eldest member)
-            if 'Age' in household_data.columns:
-                eldest_idx = household_data['Age'].idxmax()
-                head_of_house = household_data.loc[eldest_idx, 'Name'] if pd.notna(eldest_idx) else 'Unknown'
+            if 'Age' not in household_data.columns:
+                head_of_house = household_data['Name'].iat[0]
+            elif household_data['Age'].notna().any():
+                head_of_house = household_data.loc[household_data['Age'].idxmax(), 'Name']
             else:
-                head_of_house = household_data.iloc[0]['Name'] if len(household_data) > 0 else 'Unknown'
+                # No known ages (idxmax raises on an all-missing nullable column)
+                head_of_house = 'Unknown'
 
             # Get unique guardians in the household
-            unique_guardians = household_data["Guardian's Name"].nunique() if "Guardian's Name" in household_data.columns else 1
+            unique_guardians = guardian_counts[household_id]
 
             # Determine household type
-            household_type = self._determine_household_type(member_count, unique_guardians)
+            household_type = household_types[household_id]
 
             # Calculate voting power
             voting_power = round(member_count / total_voters * 100, 2)
@@ -201,31 +285,57 @@ class HouseholdAnalyzer:
 
     def _extract_household_members(self, household_data: pd.DataFrame) -> List[Dict]:
         """Extract all members of a household with their details"""
-        members = []
-
         # Sort by age (eldest first) if available
         if 'Age' in household_data.columns:
-            household_data = household_data.sort_values('Age', ascending=False, na_position='last')
+            household_data = household_data.sort_values('Age', ascending=False, na_position='last', kind='stable')
 
-        for idx, row in household_data.iterrows():
+        # Index guardian names once so relationship checks are set lookups
+        if "Guardian's Name" in household_data.columns:
+            guardian_names = frozenset(household_data["Guardian's Name"].dropna())
+        else:
+            guardian_names = frozenset()
+
+        # Pull each column out once instead of materializing a Series per row
+        member_count = len(household_data)
+
+        def column(name: str, default) -> list:
+            if name in household_data.columns:
+                return household_data[name].tolist()
+            return [default] * member_count
+
+        serial_column = 'Serial No.' if 'Serial No.' in household_data.columns else 'New SEC ID No.'
+        ages = [int(age) if pd.notna(age) else 'N/A' for age in column('Age', None)]
+
+        members = [None] * member_count
+        columns = zip(
+            column(serial_column, 'N/A'),
+            column('Name', 'Unknown'),
+            column("Guardian's Name", 'N/A'),
+            ages,
+            column('Gender', 'N/A'),
+            column('religion', 'N/A'),
+            column('House Name', 'N/A')
+        )
+
+        for i, (serial_no, name, guardian, age, gender, religion, house_name) in enumerate(columns):
             member = {
-                'serial_no': row.get('Serial No.', row.get('New SEC ID No.', 'N/A')),
-                'name': row.get('Name', 'Unknown'),
-                'guardian': row.get("Guardian's Name", 'N/A'),
-                'age': int(row.get('Age', 0)) if pd.notna(row.get('Age')) else 'N/A',
-                'gender': row.get('Gender', 'N/A'),
-                'religion': row.get('religion', 'N/A'),
-                'house_name': row.get('House Name', 'N/A')
+                'serial_no': serial_no,
+                'name': name,
+                'guardian': guardian,
+                'age': age,
+                'gender': gender,
+                'religion': religion,
+                'house_name': house_name
             }
 
             # Determine relationship based on age and guardian
-            member['relationship'] = self._infer_relationship(member, household_data)
+            member['relationship'] = self._infer_relationship(member, guardian_names)
 
-            members.append(member)
+            members[i] = member
 
         return members
 
-    def _infer_relationship(self, member: Dict, household_data: pd.DataFrame) -> str:
+    def _infer_relationship(self, member: Dict, guardian_names: frozenset) -> str:
         """Infer family relationship based on age and guardian patterns"""
         # Simple heuristic-based relationship inference
         if member['age'] != 'N/A':
@@ -234,7 +344,7 @@ class HouseholdAnalyzer:
             # Check if this person is a guardian for others
             is_guardian = False
             if member['name'] != 'Unknown':
-                is_guardian = (household_data["Guardian's Name"] == member['name']).any()
+                is_guardian = member['name'] in guardian_names
 
             if is_guardian:
                 if age >= 45:
@@ -250,61 +360,61 @@ class HouseholdAnalyzer:
 
         return "Member"
 
-    def _determine_household_type(self, member_count: int, unique_guardians: int) -> str:
-        """Determine the type of household based on size and guardian patterns"""
-        if member_count == 1:
-            return "Single Person"
-        elif member_count == 2:
-            return "Couple/Small"
-        elif member_count <= 4:
-            return "Nuclear Family"
-        elif member_count <= 6:
-            if unique_guardians == 1:
-                return "Joint Family"
-            else:
-                return "Extended Family"
-        elif member_count <= 10:
-            if unique_guardians <= 2:
-                return "Large Joint Family"
-            else:
-                return "Multi-Family House"
-        else:
-            return "Very Large Household"
+    def _determine_household_types(self, sizes: pd.Series, unique_guardians: pd.Series) -> pd.Series:
+        """Determine household types from sizes and guardian patterns (vectorized)"""
+        member_counts = sizes.to_numpy()
+        guardians = unique_guardians.to_numpy()
+
+        conditions = [
+            member_counts == 1,
+            member_counts == 2,
+            member_counts <= 4,
+            (member_counts <= 6) & (guardians == 1),
+            member_counts <= 6,
+            (member_counts <= 10) & (guardians <= 2),
+            member_counts <= 10
+        ]
+        choices = [
+            "Single Person",
+            "Couple/Small",
+            "Nuclear Family",
+            "Joint Family",
+            "Extended Family",
+            "Large Joint Family",
+            "Multi-Family House"
+        ]
+
+        types = np.select(conditions, choices, default="Very Large Household")
+        return pd.Series(types, index=sizes.index)
 
     def _generate_household_strategy(self, member_count: int, religion_comp: Dict, household_type: str) -> str:
         """Generate campaign strategy for the household"""
-        strategies = []
-
         # Size-based strategy
-        if member_count >= 10:
-            strategies.append("High-priority personal visit by senior leader")
-        elif member_count >= 5:
-            strategies.append("Personal home visit by campaign team")
-        else:
-            strategies.append("Door-to-door canvassing")
+        size_bucket = 2 if member_count >= 10 else 1 if member_count >= 5 else 0
+        strategies = [self.SIZE_STRATEGIES[size_bucket]]
 
         # Type-based strategy
-        if "Joint" in household_type or "Extended" in household_type:
-            strategies.append("Focus on family head/eldest member")
-        elif "Multi-Family" in household_type:
-            strategies.append("Multiple touchpoints for different families")
+        type_strategy = self.HOUSEHOLD_TYPE_STRATEGIES.get(household_type)
+        if type_strategy:
+            strategies.append(type_strategy)
 
-        # Religion-based strategy
+        # Religion-based strategy (religion_comp comes from value_counts, so it is sorted descending)
         if len(religion_comp) > 1:
             strategies.append("Secular/inclusive messaging")
         elif religion_comp:
-            dominant_religion = max(religion_comp, key=religion_comp.get)
+            dominant_religion = next(iter(religion_comp))
             strategies.append(f"Community-specific outreach ({dominant_religion})")
 
         return " | ".join(strategies)
 
+    @_cached_result
     def get_household_statistics(self) -> Dict:
         """Get comprehensive household statistics"""
-        house_groups = self.data.groupby('household_id')
-        house_sizes = house_groups.size()
+        valid_houses = self._household_sizes
 
-        # Filter out invalid addresses
-        valid_houses = house_sizes[~house_sizes.index.str.contains('Unknown', na=False)]
+        # Bucket all household sizes in a single pass: 1, 2-3, 4-5, 6-10, 10+
+        size_buckets = np.digitize(valid_houses.to_numpy(), [2, 4, 6, 11])
+        bucket_counts = np.bincount(size_buckets, minlength=5)
 
         stats = {
             'total_households': len(valid_houses),
@@ -316,11 +426,11 @@ class HouseholdAnalyzer:
                 'size': int(valid_houses.max()) if len(valid_houses) > 0 else 0
             },
             'household_size_distribution': {
-                'single_person': int((valid_houses == 1).sum()),
-                'small_2_3': int(((valid_houses >= 2) & (valid_houses <= 3)).sum()),
-                'medium_4_5': int(((valid_houses >= 4) & (valid_houses <= 5)).sum()),
-                'large_6_10': int(((valid_houses >= 6) & (valid_houses <= 10)).sum()),
-                'very_large_10_plus': int((valid_houses > 10).sum())
+                'single_person': int(bucket_counts[0]),
+                'small_2_3': int(bucket_counts[1]),
+                'medium_4_5': int(bucket_counts[2]),
+                'large_6_10': int(bucket_counts[3]),
+                'very_large_10_plus': int(bucket_counts[4])
             }
         }
 
@@ -334,48 +444,47 @@ class HouseholdAnalyzer:
 
         return stats
 
+    @_cached_result
     def get_top_large_households(self, min_size: int = 5, top_n: int = 20) -> pd.DataFrame:
         """Get top N households with minimum size (for table display)"""
-        house_groups = self.data.groupby('household_id')
-
-        # Get household sizes and filter
-        house_data = []
-        for household_id, group in house_groups:
-            if 'Unknown' in household_id:
-                continue
-
-            size = len(group)
-            if size >= min_size:
-                # Extract house address and house name
-                house_address = group['house_address'].iloc[0] if len(group) > 0 else 'Unknown'
-                if 'House Name' in group.columns:
-                    house_name = group['House Name'].mode()[0] if len(group['House Name'].mode()) > 0 else 'N/A'
-                else:
-                    house_name = 'N/A'
+        house_sizes = self._household_sizes
 
-                # Get majority religion
-                if 'religion' in group.columns:
-                    religion_counts = group['religion'].value_counts()
-                    majority_religion = religion_counts.index[0] if len(religion_counts) > 0 else 'Unknown'
-                else:
-                    majority_religion = 'N/A'
+        # Filter small households before aggregating details
+        house_sizes = house_sizes[house_sizes >= min_size]
 
-                house_data.append({
-                    'House Address': f"{house_address} ({house_name})",
-                    'Voters': size,
-                    'Religion (Majority)': majority_religion
-                })
+        if len(house_sizes) == 0:
+            return pd.DataFrame()
 
-        # Convert to DataFrame and sort
-        df = pd.DataFrame(house_data)
-        if len(df) > 0:
-            df = df.sort_values('Voters', ascending=False).head(top_n)
+        large_data = self._valid_data[self._valid_data['household_id'].isin(house_sizes.index)]
+        large_groups = large_data.groupby('household_id')
 
-        return df
+        display_addresses = self._display_addresses(large_data).reindex(house_sizes.index)
 
+        # Get majority religion
+        if 'religion' in large_data.columns:
+            majority_religions = large_groups['religion'].agg(
+                lambda s: s.value_counts().index[0] if s.notna().any() else 'Unknown'
+            ).reindex(house_sizes.index)
+        else:
+            majority_religions = pd.Series('N/A', index=house_sizes.index)
+
+        df = pd.DataFrame({
+            'House Address': display_addresses,
+            'Voters': house_sizes,
+            'Religion (Majority)': majority_religions
+        }).reset_index(drop=True)
+
+        return df.nlargest(top_n, 'Voters')
+
+    @_cached_result
     def identify_special_households(self) -> Dict:
         """Identify special types of households for targeted strategies"""
-        house_groups = self.data.groupby('household_id')
+        house_sizes = self._household_sizes
+        house_sizes = house_sizes[house_sizes >= 2]
+
+        data = self._valid_data_with_age[self._valid_data_with_age['household_id'].isin(house_sizes.index)]
+        house_groups = data.groupby('household_id')
+        display_addresses = self._display_addresses(data)
 
         special = {
             'inter_religious': [],
@@ -386,70 +495,68 @@ class HouseholdAnalyzer:
             'multi_family': []
         }
 
-        for household_id, group in house_groups:
-            if 'Unknown' in household_id or len(group) < 2:
-                continue
+        # Inter-religious households
+        if 'religion' in data.columns:
+            religion_counts = house_groups['religion'].nunique()
+            religion_breakdown = data.groupby(['household_id', 'religion']).size()
+            for household_id in religion_counts.index[religion_counts > 1]:
+                special['inter_religious'].append({
+                    'address': display_addresses[household_id],
+                    'size': int(house_sizes[household_id]),
+                    'religions': religion_breakdown.loc[household_id].sort_values(ascending=False).to_dict()
+                })
 
-            # Extract house address for display
-            house_address = group['house_address'].iloc[0] if len(group) > 0 else 'Unknown'
-            if 'House Name' in group.columns:
-                house_name = group['House Name'].mode()[0] if len(group['House Name'].mode()) > 0 else 'N/A'
-                display_address = f"{house_address} ({house_name})"
-            else:
-                display_address = house_address
-
-            # Inter-religious households
-            if 'religion' in group.columns:
-                religions = group['religion'].nunique()
-                if religions > 1:
-                    special['inter_religious'].append({
-                        'address': display_address,
-                        'size': len(group),
-                        'religions': group['religion'].value_counts().to_dict()
-                    })
+        if 'Age' in data.columns:
+            # Missing ages never satisfy an age condition
+            age_flags = pd.DataFrame({
+                'youth': data['Age'].between(18, 35),
+                'senior': data['Age'] >= 60,
+                'first_timer': data['Age'].between(18, 21)
+            }).fillna(False).astype(bool).groupby(data['household_id'])
 
             # Youth concentrated (>50% under 35)
-            if 'Age' in group.columns:
-                youth_pct = ((group['Age'] >= 18) & (group['Age'] <= 35)).mean()
-                if youth_pct > 0.5 and len(group) >= 3:
-                    special['youth_concentrated'].append({
-                        'address': display_address,
-                        'size': len(group),
-                        'youth_percentage': round(youth_pct * 100, 1)
-                    })
-
-                # Senior only households
-                if (group['Age'] >= 60).all() and len(group) >= 1:
-                    special['senior_only'].append({
-                        'address': display_address,
-                        'size': len(group)
-                    })
-
-                # First-time voter households
-                first_timers = ((group['Age'] >= 18) & (group['Age'] <= 21)).sum()
-                if first_timers >= 2:
-                    special['first_time_voters'].append({
-                        'address': display_address,
-                        'size': len(group),
-                        'first_time_voters': int(first_timers)
-                    })
-
-            # Women only households
-            if 'Gender' in group.columns:
-                if (group['Gender'] == 'F').all() and len(group) >= 2:
-                    special['women_only'].append({
-                        'address': display_address,
-                        'size': len(group)
-                    })
-
-            # Multi-family (multiple guardians)
-            if "Guardian's Name" in group.columns:
-                unique_guardians = group["Guardian's Name"].nunique()
-                if unique_guardians >= 3:
-                    special['multi_family'].append({
-                        'address': display_address,
-                        'size': len(group),
-                        'families': int(unique_guardians)
-                    })
-
-        return special
\ No newline at end of file
+            youth_pct = age_flags['youth'].mean()
+            for household_id in youth_pct.index[(youth_pct > 0.5) & (house_sizes >= 3)]:
+                special['youth_concentrated'].append({
+                    'address': display_addresses[household_id],
+                    'size': int(house_sizes[household_id]),
+                    'youth_percentage': round(youth_pct[household_id] * 100, 1)
+                })
+
+            # Senior only households
+            senior_only = age_flags['senior'].all()
+            for household_id in senior_only.index[senior_only]:
+                special['senior_only'].append({
+                    'address': display_addresses[household_id],
+                    'size': int(house_sizes[household_id])
+                })
+
+            # First-time voter households
+            first_timers = age_flags['first_timer'].sum()
+            for household_id in first_timers.index[first_timers >= 2]:
+                special['first_time_voters'].append({
+                    'address': display_addresses[household_id],
+                    'size': int(house_sizes[household_id]),
+                    'first_time_voters': int(first_timers[household_id])
+                })
+
+        # Women only households
+        if 'Gender' in data.columns:
+            women_only = (data['Gender'] == 'F').groupby(data['household_id']).all()
+            for household_id in women_only.index[women_only]:
+                special['women_only'].append({
+                    'address': display_addresses[household_id],
+                    'size': int(house_sizes[household_id])
+                })
+
+        # Multi-family (multiple guardians)
+        if "Guardian's Name" in data.columns:
+            guardian_counts = house_groups["Guardian's Name"].nunique()
+            for household_id in guardian_counts.index[guardian_counts >= 3]:
+                special['multi_family'].append({
+                    'address': display_addresses[household_id],
+                    'size': int(house_sizes[household_id]),
+                    'families': int(guardian_counts[household_id])
+                })
+
+        return special
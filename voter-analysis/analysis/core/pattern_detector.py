@@ -7,15 +7,60 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 
 class PatternDetector:
     """Detect patterns and anomalies in voter demographics"""
 
     def __init__(self, data: pd.DataFrame):
-        self.data = data
+        # Shallow copy so the dtype conversions below don't leak into the caller's frame
+        self.data = data.copy(deep=False)
         self.total_voters = len(data)
 
+        # Numeric ages as floats, so fractional values survive and missing ones are NaN
+        if 'Age' in self.data.columns:
+            self.data['Age'] = pd.to_numeric(self.data['Age'], errors='coerce').astype('float64')
+
+        # Frame-wide age statistics and sorted ages (for bucket counts) shared by the age detectors
+        self._age_stats = None
+        self._sorted_ages = None
+        if 'Age' in self.data.columns:
+            # Missing statistics (no ages, or a single age for std) come back as NaN
+            self._age_stats = self.data['Age'].agg(['mean', 'std']).to_dict()
+            self._sorted_ages = np.sort(self.data['Age'].dropna().to_numpy())
+
+        # Religion and gender counts shared by the religion/gender detectors
+        self._religion_counts = self.data['religion'].value_counts() if 'religion' in self.data.columns else None
+        self._gender_counts = self.data['Gender'].value_counts() if 'Gender' in self.data.columns else None
+
+        # Group households once on categorical codes and share the grouping across detectors
+        self._household_groups = None
+        self._household_sizes = None
+        self._display_addresses = None
+        if 'household_id' in self.data.columns:
+            self.data['household_id'] = self.data['household_id'].astype('category')
+            self._household_groups = self.data.groupby('household_id', observed=True)
+            self._household_sizes = self._household_groups.size()
+
+            # Display string per household, "address (most common house name)", looked up by the detectors
+            if 'house_address' in self.data.columns:
+                self._display_addresses = self._household_groups['house_address'].first()
+                if 'House Name' in self.data.columns:
+                    house_names = self._most_common_house_names().reindex(self._display_addresses.index)
+                    self._display_addresses = (
+                        self._display_addresses.astype(str) + ' (' + house_names.fillna('N/A').astype(str) + ')'
+                    )
+
+                # Plain dict: concurrent first lookups on a CategoricalIndex race while pandas builds its engine
+                self._display_addresses = self._display_addresses.to_dict()
+
+    def _most_common_house_names(self) -> pd.Series:
+        """Most common house name per household (ties broken alphabetically, like mode())"""
+        name_counts = self.data.groupby(['household_id', 'House Name'], observed=True).size().reset_index(name='count')
+        name_counts = name_counts.sort_values(['household_id', 'count', 'House Name'], ascending=[True, False, True])
+        return name_counts.drop_duplicates('household_id').set_index('household_id')['House Name']
+
     def detect_age_anomalies(self) -> List[Dict]:
         """
         Detect unusual age patterns and outliers
@@ -29,9 +74,11 @@ class PatternDetector:
         anomalies = []
 
         # Calculate age statistics
-        mean_age = self.data['Age'].mean()
-        std_age = self.data['Age'].std()
-        median_age = self.data['Age'].median()
+        std_age = self._age_stats['std']
+
+        # Too few voters (or no age spread to measure) for the distribution checks to mean anything
+        if self.total_voters < 20 or pd.isna(std_age):
+            return anomalies
 
         # Check for high variance
         if std_age > 20:
@@ -43,29 +90,33 @@ class PatternDetector:
                 'implication': 'Diverse age groups require multi-generational outreach strategies'
             })
 
+        # Bucket sizes are differences of binary-search positions in the sorted ages
+        ages = self._sorted_ages
+
         # Check for age gaps
-        age_distribution = self.data['Age'].value_counts().sort_index()
-        for age in range(20, 70, 10):
-            age_range = self.data[(self.data['Age'] >= age) & (self.data['Age'] < age + 10)]
-            if len(age_range) < self.total_voters * 0.05:  # Less than 5%
+        gap_edges = np.arange(20, 80, 10)
+        gap_counts = np.diff(np.searchsorted(ages, gap_edges))
+        for age, count in zip(gap_edges[:-1], gap_counts):
+            if count < self.total_voters * 0.05:  # Less than 5%
                 anomalies.append({
                     'type': 'age_gap',
                     'category': 'age',
-                    'description': f'Underrepresented age group: {age}-{age+10} years ({len(age_range)} voters)',
+                    'description': f'Underrepresented age group: {age}-{age+10} years ({count} voters)',
                     'severity': 'low',
                     'implication': 'Potential voter registration gap or demographic shift'
                 })
 
         # Check for unusually high concentration
-        for age_group in [(18, 25), (25, 35), (35, 50), (50, 65), (65, 100)]:
-            group_data = self.data[(self.data['Age'] >= age_group[0]) & (self.data['Age'] < age_group[1])]
-            percentage = len(group_data) / self.total_voters * 100
+        group_edges = [18, 25, 35, 50, 65, 100]
+        group_counts = np.diff(np.searchsorted(ages, group_edges))
+        for low, high, count in zip(group_edges[:-1], group_edges[1:], group_counts):
+            percentage = count / self.total_voters * 100
 
             if percentage > 35:  # More than 35% in one age group
                 anomalies.append({
                     'type': 'age_concentration',
                     'category': 'age',
-                    'description': f'High concentration in {age_group[0]}-{age_group[1]} age group: {len(group_data)} voters ({percentage:.1f}%)',
+                    'description': f'High concentration in {low}-{high} age group: {count} voters ({percentage:.1f}%)',
                     'severity': 'high',
                     'implication': 'Age-specific messaging will be highly effective'
                 })
@@ -84,29 +135,20 @@ class PatternDetector:
 
         anomalies = []
 
-        # Group by household
-        household_sizes = self.data.groupby('household_id').size()
+        household_sizes = self._household_sizes
 
         # Very large households (10+ voters)
         very_large = household_sizes[household_sizes >= 10]
-        if len(very_large) > 0:
-            for household_id, size in very_large.items():
-                # Extract house address and house name from household_id
-                household_data = self.data[self.data['household_id'] == household_id]
-                house_address = household_data['house_address'].iloc[0] if len(household_data) > 0 else 'Unknown'
-                if 'House Name' in household_data.columns:
-                    house_name = household_data['House Name'].mode()[0] if len(household_data['House Name'].mode()) > 0 else 'N/A'
-                    display_address = f"{house_address} ({house_name})"
-                else:
-                    display_address = house_address
+        for household_id, size in very_large.items():
+            display_address = self._display_addresses[household_id]
 
-                anomalies.append({
-                    'type': 'very_large_household',
-                    'category': 'household',
-                    'description': f'Exceptionally large household at {display_address}: {size} voters',
-                    'severity': 'high',
-                    'implication': 'High-value target - winning this household = multiple votes'
-                })
+            anomalies.append({
+                'type': 'very_large_household',
+                'category': 'household',
+                'description': f'Exceptionally large household at {display_address}: {size} voters',
+                'severity': 'high',
+                'implication': 'High-value target - winning this household = multiple votes'
+            })
 
         # Check for single-voter dominance
         single_voter_households = len(household_sizes[household_sizes == 1])
@@ -135,7 +177,7 @@ class PatternDetector:
 
         patterns = []
 
-        religion_counts = self.data['religion'].value_counts()
+        religion_counts = self._religion_counts
         total = religion_counts.sum()
 
         # Check for extreme dominance (>85%)
@@ -184,39 +226,65 @@ class PatternDetector:
 
         mixed_households = []
 
-        for household_id, group in self.data.groupby('household_id'):
-            if len(group) >= 2:  # At least 2 voters
-                religions = group['religion'].unique()
-
-                if len(religions) > 1:  # Multiple religions in same household
-                    religion_breakdown = group['religion'].value_counts().to_dict()
-
-                    # Extract house address and house name for display
-                    house_address = group['house_address'].iloc[0] if len(group) > 0 else 'Unknown'
-                    if 'House Name' in group.columns:
-                        house_name = group['House Name'].mode()[0] if len(group['House Name'].mode()) > 0 else 'N/A'
-                        display_address = f"{house_address} ({house_name})"
-                    else:
-                        display_address = house_address
-
-                    mixed_households.append({
-                        'type': 'mixed_faith_household',
-                        'category': 'household_religion',
-                        'house_address': display_address,
-                        'total_voters': len(group),
-                        'religions': list(religions),
-                        'breakdown': religion_breakdown,
-                        'description': f'Mixed-faith household at {display_address}: {len(group)} voters, {len(religions)} religions',
-                        'severity': 'medium',
-                        'implication': 'Potential swing household - requires inclusive messaging'
-                    })
+        if self.total_voters == 0:
+            return []
+
+        # Encode households and religions as integer codes (a missing religion gets its own code)
+        household_codes = self.data['household_id'].cat.codes.to_numpy().astype(np.int64)
+        household_labels = self.data['household_id'].cat.categories
+        religion_codes, religion_labels = pd.factorize(self.data['religion'], use_na_sentinel=False)
+        n_religions = len(religion_labels)
+
+        # Voters without a household (code -1) belong to no household, as in a groupby
+        has_household = household_codes >= 0
+
+        # Count voters per (household, religion) pair; np.unique sorts pairs by household
+        pair_keys, pair_first_rows, pair_counts = np.unique(
+            household_codes[has_household] * n_religions + religion_codes[has_household],
+            return_index=True, return_counts=True
+        )
+        pair_households = pair_keys // n_religions
+        pair_religions = pair_keys % n_religions
+
+        # Households with more than one distinct religion, plus where their pairs start/end
+        religions_per_household = np.bincount(pair_households, minlength=len(household_labels))
+        mixed_codes = np.flatnonzero(religions_per_household > 1)
+        pair_starts = np.searchsorted(pair_households, mixed_codes, side='left')
+        pair_ends = np.searchsorted(pair_households, mixed_codes, side='right')
+
+        for code, start, end in zip(mixed_codes, pair_starts, pair_ends):
+            household_id = household_labels[code]
+            counts = pair_counts[start:end]
+            first_rows = pair_first_rows[start:end]
+            labels = religion_labels[pair_religions[start:end]]
+            total_voters = int(counts.sum())
+
+            # Religions in order of appearance; breakdown by count (ties by appearance), like value_counts
+            appearance = np.argsort(first_rows, kind='stable')
+            religions = list(labels[appearance])
+            by_count = appearance[np.argsort(-counts[appearance], kind='stable')]
+            religion_breakdown = {labels[i]: int(counts[i]) for i in by_count if pd.notna(labels[i])}
+
+            display_address = self._display_addresses[household_id]
+
+            mixed_households.append({
+                'type': 'mixed_faith_household',
+                'category': 'household_religion',
+                'house_address': display_address,
+                'total_voters': total_voters,
+                'religions': religions,
+                'breakdown': religion_breakdown,
+                'description': f'Mixed-faith household at {display_address}: {total_voters} voters, {len(religions)} religions',
+                'severity': 'medium',
+                'implication': 'Potential swing household - requires inclusive messaging'
+            })
 
         # Summarize if many mixed households
         if len(mixed_households) > 0:
             summary = {
                 'type': 'mixed_faith_summary',
                 'category': 'pattern',
-                'description': f'Found {len(mixed_households)} mixed-faith households ({len(mixed_households)/len(self.data.groupby("household_id"))*100:.1f}% of all households)',
+                'description': f'Found {len(mixed_households)} mixed-faith households ({len(mixed_households)/len(self._household_sizes)*100:.1f}% of all households)',
                 'severity': 'high' if len(mixed_households) > 10 else 'medium',
                 'implication': 'Significant interfaith mixing indicates openness to cross-community appeal',
                 'details': mixed_households[:10]  # Include top 10
@@ -237,7 +305,7 @@ class PatternDetector:
 
         anomalies = []
 
-        gender_counts = self.data['Gender'].value_counts()
+        gender_counts = self._gender_counts
 
         if 'M' in gender_counts and 'F' in gender_counts:
             male_count = gender_counts['M']
@@ -260,22 +328,30 @@ class PatternDetector:
 
             # Check by age group for gender imbalances
             if 'Age' in self.data.columns:
-                for age_range in [(18, 35), (35, 50), (50, 100)]:
-                    age_data = self.data[(self.data['Age'] >= age_range[0]) & (self.data['Age'] < age_range[1])]
-                    if len(age_data) > 50:
-                        age_gender = age_data['Gender'].value_counts()
-                        if 'M' in age_gender and 'F' in age_gender:
-                            age_male_pct = age_gender['M'] / len(age_data) * 100
-                            age_female_pct = age_gender['F'] / len(age_data) * 100
-
-                            if abs(age_male_pct - age_female_pct) > 20:
-                                anomalies.append({
-                                    'type': 'age_gender_imbalance',
-                                    'category': 'gender',
-                                    'description': f'Gender imbalance in {age_range[0]}-{age_range[1]} age group: {age_male_pct:.1f}% M vs {age_female_pct:.1f}% F',
-                                    'severity': 'medium',
-                                    'implication': 'Age-specific gender targeting needed'
-                                })
+                # Range totals and per-gender counts by binary search over sorted ages
+                age_edges = [18, 35, 50, 100]
+                ages = self.data['Age']
+                male_ages = np.sort(ages[self.data['Gender'] == 'M'].dropna().to_numpy())
+                female_ages = np.sort(ages[self.data['Gender'] == 'F'].dropna().to_numpy())
+                age_totals = np.diff(np.searchsorted(self._sorted_ages, age_edges))
+                male_counts = np.diff(np.searchsorted(male_ages, age_edges))
+                female_counts = np.diff(np.searchsorted(female_ages, age_edges))
+
+                for age_range, age_total, male_count, female_count in zip(
+                    zip(age_edges[:-1], age_edges[1:]), age_totals, male_counts, female_counts
+                ):
+                    if age_total > 50 and male_count > 0 and female_count > 0:
+                        age_male_pct = male_count / age_total * 100
+                        age_female_pct = female_count / age_total * 100
+
+                        if abs(age_male_pct - age_female_pct) > 20:
+                            anomalies.append({
+                                'type': 'age_gender_imbalance',
+                                'category': 'gender',
+                                'description': f'Gender imbalance in {age_range[0]}-{age_range[1]} age group: {age_male_pct:.1f}% M vs {age_female_pct:.1f}% F',
+                                'severity': 'medium',
+                                'implication': 'Age-specific gender targeting needed'
+                            })
 
         return anomalies
 
@@ -291,28 +367,27 @@ class PatternDetector:
 
         patterns = []
 
-        overall_mean_age = self.data['Age'].mean()
-
-        for religion in self.data['religion'].unique():
-            religion_data = self.data[self.data['religion'] == religion]
-
-            if len(religion_data) >= 20:  # Minimum sample size
-                religion_mean_age = religion_data['Age'].mean()
-                age_diff = religion_mean_age - overall_mean_age
-
-                # Significant difference (>5 years)
-                if abs(age_diff) > 5:
-                    patterns.append({
-                        'type': 'age_religion_correlation',
-                        'category': 'cross_demographic',
-                        'religion': religion,
-                        'mean_age': round(religion_mean_age, 1),
-                        'overall_mean': round(overall_mean_age, 1),
-                        'difference': round(age_diff, 1),
-                        'description': f'{religion} voters are {"younger" if age_diff < 0 else "older"} than average (mean age {religion_mean_age:.1f} vs {overall_mean_age:.1f})',
-                        'severity': 'medium',
-                        'implication': f'Generational messaging for {religion} voters should be adjusted'
-                    })
+        overall_mean_age = self._age_stats['mean']
+
+        # Mean age and voter count for every religion in one grouped pass
+        religion_stats = self.data.groupby('religion', sort=False)['Age'].agg(['mean', 'size'])
+        religion_stats['diff'] = religion_stats['mean'] - overall_mean_age
+
+        # Minimum sample size and significant difference (>5 years)
+        significant = religion_stats[(religion_stats['size'] >= 20) & (religion_stats['diff'].abs() > 5)]
+
+        for religion, religion_mean_age, age_diff in zip(significant.index, significant['mean'], significant['diff']):
+            patterns.append({
+                'type': 'age_religion_correlation',
+                'category': 'cross_demographic',
+                'religion': religion,
+                'mean_age': round(religion_mean_age, 1),
+                'overall_mean': round(overall_mean_age, 1),
+                'difference': round(age_diff, 1),
+                'description': f'{religion} voters are {"younger" if age_diff < 0 else "older"} than average (mean age {religion_mean_age:.1f} vs {overall_mean_age:.1f})',
+                'severity': 'medium',
+                'implication': f'Generational messaging for {religion} voters should be adjusted'
+            })
 
         return patterns
 
@@ -323,41 +398,61 @@ class PatternDetector:
         Returns:
             Dict with all detected patterns and anomalies
         """
-        return {
-            'age_anomalies': self.detect_age_anomalies(),
-            'household_anomalies': self.detect_household_anomalies(),
-            'religious_patterns': self.detect_religious_patterns(),
-            'mixed_faith_households': self.detect_mixed_faith_households(),
-            'gender_imbalances': self.detect_gender_imbalances(),
-            'age_religion_correlations': self.detect_age_religion_correlations(),
-            'summary': self._generate_summary()
+        detectors = {
+            'age_anomalies': self.detect_age_anomalies,
+            'household_anomalies': self.detect_household_anomalies,
+            'religious_patterns': self.detect_religious_patterns,
+            'mixed_faith_households': self.detect_mixed_faith_households,
+            'gender_imbalances': self.detect_gender_imbalances,
+            'age_religion_correlations': self.detect_age_religion_correlations
         }
 
-    def _generate_summary(self) -> Dict:
-        """Generate summary of all detected patterns"""
+        # Detectors only read the shared state built in __init__, so they can run side by side
+        with ThreadPoolExecutor(max_workers=len(detectors)) as executor:
+            futures = {name: executor.submit(detector) for name, detector in detectors.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        results['summary'] = self._generate_summary(results)
+
+        return results
+
+    def _generate_summary(self, results: Dict[str, List[Dict]]) -> Dict:
+        """Generate summary of all detected patterns from the detector results"""
         all_patterns = []
 
-        all_patterns.extend(self.detect_age_anomalies())
-        all_patterns.extend(self.detect_household_anomalies())
-        all_patterns.extend(self.detect_religious_patterns())
-        all_patterns.extend(self.detect_mixed_faith_households())
-        all_patterns.extend(self.detect_gender_imbalances())
-        all_patterns.extend(self.detect_age_religion_correlations())
+        for patterns in results.values():
+            all_patterns.extend(patterns)
 
         # Filter out errors
         valid_patterns = [p for p in all_patterns if 'error' not in p]
 
+        # Score every pattern once: 3 = high, 2 = medium, 1 = low, 0 = unrated
+        severity_scores = {'high': 3, 'medium': 2, 'low': 1}
+        scores = np.fromiter(
+            (severity_scores.get(p.get('severity'), 0) for p in valid_patterns),
+            dtype=np.int8, count=len(valid_patterns)
+        )
+
         # Count by severity
-        high_severity = len([p for p in valid_patterns if p.get('severity') == 'high'])
-        medium_severity = len([p for p in valid_patterns if p.get('severity') == 'medium'])
-        low_severity = len([p for p in valid_patterns if p.get('severity') == 'low'])
+        severity_counts = np.bincount(scores, minlength=4)
+
+        # Top 5 by severity without a full sort: partition out the 5th best score,
+        # then keep everything above it plus the earliest ties, in stable order
+        top_5_critical = []
+        if len(scores) > 0:
+            k = min(5, len(scores)) - 1
+            cutoff = -np.partition(-scores, k)[k]
+            above = np.flatnonzero(scores > cutoff)
+            ties = np.flatnonzero(scores == cutoff)[:k + 1 - len(above)]
+            top = np.concatenate([above, ties])
+            top = top[np.argsort(-scores[top], kind='stable')]
+            top_5_critical = [valid_patterns[i] for i in top]
 
         return {
             'total_patterns_detected': len(valid_patterns),
-            'high_severity': high_severity,
-            'medium_severity': medium_severity,
-            'low_severity': low_severity,
-            'top_5_critical': sorted(valid_patterns, key=lambda x: {'high': 3, 'medium': 2, 'low': 1}.get(x.get('severity'), 0), reverse=True)[:5]
+            'high_severity': int(severity_counts[3]),
+            'medium_severity': int(severity_counts[2]),
+            'low_severity': int(severity_counts[1]),
+            'top_5_critical': top_5_critical
         }
 
 
@@ -9,6 +9,11 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
 class HierarchyParser:
     """Parse and manage ward-polling station hierarchy"""
 
@@ -16,14 +21,19 @@ class HierarchyParser:
         self.hierarchy_file = hierarchy_file
         self.data_dir = data_dir
         self.hierarchy = {}
+        self._station_index = {}
         self.station_to_file_map = {}
         self.load_hierarchy()
         self.map_csv_files()
 
     def load_hierarchy(self):
         """Load ward-polling station hierarchy from JSON"""
-        with open(self.hierarchy_file, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(self.hierarchy_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(self.hierarchy_file, 'r') as f:
+                data = json.load(f)
 
         # Parse hierarchy structure
         for ward in data['wards']:
@@ -51,38 +61,48 @@ class HierarchyParser:
                     'full_text': station_text
                 })
 
+        # Index stations by number per ward for O(1) file matching
+        self._station_index = {
+            ward_key: {station['number']: station for station in ward['stations']}
+            for ward_key, ward in self.hierarchy.items()
+        }
+
     def map_csv_files(self):
         """Map CSV files to polling stations based on naming patterns"""
-        csv_files = list(Path(self.data_dir).rglob('*.csv'))
-
-        for csv_file in csv_files:
-            # Extract ward and polling station from file path
-            # Format: output_with_religion/041_-_BHARANIKKAVU/003_-_Bhaskaranunni_Library_Building_Vanjikovil.csv
-            parts = csv_file.parts
-
-            if len(parts) >= 2:
-                ward_folder = parts[-2]  # e.g., "041_-_BHARANIKKAVU"
-                station_file = parts[-1]  # e.g., "003_-_Bhaskaranunni_Library_Building_Vanjikovil.csv"
+        # Layout: output_with_religion/041_-_BHARANIKKAVU/003_-_Bhaskaranunni_Library_Building_Vanjikovil.csv
+        # Walk ward directories then station files with scandir (no per-file Path/stat)
+        with os.scandir(self.data_dir) as ward_entries:
+            for ward_entry in ward_entries:
+                if not ward_entry.is_dir():
+                    continue
 
                 # Parse ward info
+                ward_folder = ward_entry.name  # e.g., "041_-_BHARANIKKAVU"
                 ward_parts = ward_folder.split('_-_')
-                if len(ward_parts) == 2:
-                    ward_code = ward_parts[0]
-                    ward_name_raw = ward_parts[1]
-                    # Replace underscores with spaces to match hierarchy format
-                    ward_name = ward_name_raw.replace('_', ' ')
-                    ward_key = f"{ward_code}_{ward_name}"
-
-                    # Parse station info
-                    station_num = station_file.split('_-_')[0] if '_-_' in station_file else None
-
-                    if ward_key in self.hierarchy and station_num:
-                        # Find matching station
-                        for station in self.hierarchy[ward_key]['stations']:
-                            if station['number'] == station_num:
-                                station_key = f"{ward_key}/{station_num}"
-                                self.station_to_file_map[station_key] = str(csv_file)
-                                break
+                if len(ward_parts) != 2:
+                    continue
+
+                ward_code = ward_parts[0]
+                ward_name_raw = ward_parts[1]
+                # Replace underscores with spaces to match hierarchy format
+                ward_name = ward_name_raw.replace('_', ' ')
+                ward_key = f"{ward_code}_{ward_name}"
+
+                ward_stations = self._station_index.get(ward_key)
+                if ward_stations is None:
+                    continue
+
+                with os.scandir(ward_entry.path) as station_entries:
+                    for station_entry in station_entries:
+                        station_file = station_entry.name  # e.g., "003_-_Bhaskaranunni_Library_Building_Vanjikovil.csv"
+                        if not station_file.endswith('.csv'):
+                            continue
+
+                        # Parse station info
+                        station_num = station_file.split('_-_')[0] if '_-_' in station_file else None
+
+                        if station_num in ward_stations:
+                            self.station_to_file_map[f"{ward_key}/{station_num}"] = station_entry.path
 
     def get_hierarchy_stats(self) -> Dict:
         """Get statistics about the hierarchy"""
@@ -116,8 +136,12 @@ class HierarchyParser:
             'stats': self.get_hierarchy_stats()
         }
 
-        with open(output_file, 'w') as f:
-            json.dump(output, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(output, f, indent=2)
 
         return output
 
@@ -4,43 +4,195 @@ Orchestrates analysis and generates comprehensive reports for each polling stati
 """
 
 import os
+import gc
+import csv
 import json
+import pickle
+import hashlib
+import functools
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import warnings
-warnings.filterwarnings('ignore')
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:  # optional: fall back to pandas' C parser
+    CSV_ENGINE = 'c'
 
 # Import analysis modules
 from analysis.core.demographics import DemographicAnalyzer
 from analysis.core.family_analysis import FamilyAnalyzer
 
+# Batch workers read each CSV once, so only the most recent frame is kept (and pinned) per process
+@functools.lru_cache(maxsize=1)
+def _read_csv_cached(csv_path: str, mtime: float, columns: Tuple[str, ...]) -> pd.DataFrame:
+    """Parse a station CSV once per (path, mtime); callers must copy before mutating"""
+    # The pyarrow engine needs an explicit column list, so resolve it from the header first
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [col for col in header if col in columns]
+    return pd.read_csv(csv_path, usecols=usecols, engine=CSV_ENGINE)
+
+
+# Characters that are unsafe in a station directory name
+_PATH_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_', ':': '_'})
+
+
+def safe_station_name(station_name: str) -> str:
+    """Filesystem-safe station directory name, truncated to 50 characters"""
+    return station_name.translate(_PATH_TRANS)[:50].rstrip('_')
+
+
+# Directories already created by this process, so each ward directory is only stat'd once
+_created_dirs = set()
+
+
+def _ensure_dir(path: Path):
+    """mkdir -p, skipping directories this process has already created"""
+    if path in _created_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _created_dirs.add(path)
+
+
 class PollingStationAnalyzer:
     """Complete analysis pipeline for a polling station"""
 
-    def __init__(self, ward_code: str, ward_name: str, station_num: str, station_name: str, csv_path: str):
+    # Columns read by the analyzers and quality checks; everything else in the CSV is skipped at parse time
+    REQUIRED_COLS = ('Name', "Guardian's Name", 'House Name', 'Gender / Age', 'Gender', 'Age',
+                     'religion', 'New SEC ID No.')
+
+    # Religions checked for dominance (>75%) or scarcity (<5%): (name, percentage key)
+    RELIGION_KEYS = (('Hindu', 'hindu_percentage'),
+                     ('Christian', 'christian_percentage'),
+                     ('Muslim', 'muslim_percentage'))
+
+    # Rules for _identify_unique_characteristics, grouped by the results dict they read:
+    # (path to that dict, ((value key, condition, characteristic key, message), ...))
+    UNIQUE_CHARACTERISTIC_RULES = (
+        (('demographics', 'basic_stats', 'religion_distribution', 'percentages'), tuple(
+            rule
+            for name, key in RELIGION_KEYS
+            for rule in ((key, lambda pct: pct > 75, 'religion_dominance', f"{name} dominated ({{}}%)"),
+                         (key, lambda pct: pct < 5, f'low_{name.lower()}', f"Very few {name} voters ({{}}%)"))
+        )),
+        (('demographics', 'basic_stats', 'age_statistics'), (
+            ('mean_age', lambda age: age < 35, 'young_population', "Young demographic (avg age: {})"),
+            ('mean_age', lambda age: age > 50, 'aging_population', "Aging demographic (avg age: {})"),
+        )),
+        (('demographics', 'basic_stats', 'age_statistics', 'age_group_percentages'), (
+            ('youth_18_30', lambda pct: pct > 40, 'youth_concentration', "High youth concentration ({}%)"),
+        )),
+        (('demographics', 'basic_stats', 'gender_distribution'), (
+            ('gender_ratio', lambda ratio: ratio > 1100, 'female_majority', "Strong female majority (ratio: {})"),
+            ('gender_ratio', lambda ratio: ratio < 900, 'male_majority', "Male majority (ratio: {})"),
+        )),
+        (('family_analysis', 'household_analysis'), (
+            ('average_household_size', lambda size: size > 5, 'large_families', "Large family sizes (avg: {})"),
+            ('average_household_size', lambda size: size < 2.5, 'small_families', "Small household sizes (avg: {})"),
+            ('multi_family_houses', lambda count: count > 10, 'multi_family_housing', "{} multi-family houses"),
+        )),
+        (('family_analysis', 'inter_religious_families'), (
+            ('total_inter_religious_houses', lambda count: count > 5, 'religious_integration',
+             "{} inter-religious households"),
+        )),
+    )
+
+    # Bump when analyzer output changes so stale cached results are not reused
+    ANALYZER_VERSION = '2'
+
+    # Cached results kept on disk; least recently used entries beyond this are evicted
+    CACHE_MAX_ENTRIES = 1024
+
+    def __init__(self, ward_code: str, ward_name: str, station_num: str, station_name: str, csv_path: str,
+                 cache_dir: Optional[str] = None):
         self.ward_code = ward_code
         self.ward_name = ward_name
         self.station_num = station_num
         self.station_name = station_name
         self.csv_path = csv_path
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(__file__).resolve().parent.parent / 'data' / 'cache' / 'analysis'
         self.data = None
         self.analysis_results = {}
 
     def load_data(self) -> bool:
         """Load and validate CSV data"""
         try:
-            self.data = pd.read_csv(self.csv_path)
+            # The analyzers only add or replace whole columns, so a shallow copy keeps the cached frame intact
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                cached = _read_csv_cached(self.csv_path, os.path.getmtime(self.csv_path), self.REQUIRED_COLS)
+            self.data = cached.copy(deep=False)
             print(f"Loaded {len(self.data)} records from {self.station_name}")
             return True
         except Exception as e:
             print(f"Error loading data for {self.station_name}: {e}")
             return False
 
-    def run_analysis(self) -> Dict:
-        """Run complete analysis pipeline"""
+    def _cache_path(self) -> Path:
+        """Cache file for this station, keyed by the CSV's identity, mtime, size and analyzer version"""
+        stat = os.stat(self.csv_path)
+        key_source = (f"{self.csv_path}|{stat.st_mtime}|{stat.st_size}|{self.ANALYZER_VERSION}|"
+                      f"{self.ward_code}|{self.ward_name}|{self.station_num}|{self.station_name}")
+        key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.pkl"
+
+    def _load_cached_results(self, cache_path: Path) -> Optional[Dict]:
+        """Return cached analysis results, or None on a miss"""
+        try:
+            with open(cache_path, 'rb') as f:
+                results = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        os.utime(cache_path)
+        return results
+
+    def _store_cached_results(self, cache_path: Path):
+        """Atomically write analysis results to the cache, then evict old entries"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self.analysis_results, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            self._evict_cache()
+        except OSError as e:
+            print(f"  Could not cache results for {self.station_name}: {e}")
+
+    def _evict_cache(self):
+        """Drop least recently used cache entries beyond CACHE_MAX_ENTRIES"""
+        entries = list(self.cache_dir.glob('*.pkl'))
+        if len(entries) <= self.CACHE_MAX_ENTRIES:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.CACHE_MAX_ENTRIES]:
+            entry.unlink(missing_ok=True)
+
+    def run_analysis(self, return_results: bool = True) -> Optional[Dict]:
+        """Run complete analysis pipeline (results stay on self.analysis_results if return_results is False)"""
+        # Reuse results from a previous run on the same input
+        try:
+            cache_path = self._cache_path()
+        except OSError:
+            cache_path = None
+
+        cached = self._load_cached_results(cache_path) if cache_path else None
+        if cached is not None:
+            print(f"Using cached analysis for {self.ward_name} - {self.station_name}")
+            self.analysis_results = cached
+            return self.analysis_results if return_results else None
+
         if self.data is None:
             if not self.load_data():
                 return {'error': 'Failed to load data'}
@@ -58,236 +210,211 @@ class PollingStationAnalyzer:
             'data_file': self.csv_path
         }
 
-        # Demographic Analysis
-        print("  Running demographic analysis...")
-        demo_analyzer = DemographicAnalyzer(self.data)
-        self.analysis_results['demographics'] = {
-            'basic_stats': demo_analyzer.get_basic_stats(),
-            'cross_tabulations': demo_analyzer.get_cross_tabulations(),
-            'population_pyramid': demo_analyzer.get_population_pyramid_data(),
-            'electoral_insights': demo_analyzer.get_electoral_insights()
-        }
-
-        # Family Analysis
-        print("  Running family structure analysis...")
-        family_analyzer = FamilyAnalyzer(self.data)
-        self.analysis_results['family_analysis'] = family_analyzer.get_family_statistics()
-        self.analysis_results['kinship_networks'] = family_analyzer.get_kinship_networks()
+        # Silence pandas chatter from the analyzers without changing global warning filters
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            # Demographic Analysis
+            print("  Running demographic analysis...")
+            demo_analyzer = DemographicAnalyzer(self.data)
+            self.analysis_results['demographics'] = {
+                'basic_stats': demo_analyzer.get_basic_stats(),
+                'cross_tabulations': demo_analyzer.get_cross_tabulations(),
+                'population_pyramid': demo_analyzer.get_population_pyramid_data(),
+                'electoral_insights': demo_analyzer.get_electoral_insights()
+            }
+
+            # Family Analysis
+            print("  Running family structure analysis...")
+            family_analyzer = FamilyAnalyzer(self.data)
+            self.analysis_results['family_analysis'] = family_analyzer.get_family_statistics()
+            self.analysis_results['kinship_networks'] = family_analyzer.get_kinship_networks()
+
+        # Data Quality is the last step that reads the raw frame; release it afterwards
+        data_quality = self._assess_data_quality()
+        del demo_analyzer, family_analyzer
+        self.data = None
+        if os.environ.get('AGGRESSIVE_GC'):
+            gc.collect()
 
         # Unique Characteristics
         print("  Identifying unique characteristics...")
         self.analysis_results['unique_characteristics'] = self._identify_unique_characteristics()
 
         # Data Quality
-        self.analysis_results['data_quality'] = self._assess_data_quality()
+        self.analysis_results['data_quality'] = data_quality
+
+        if cache_path:
+            self._store_cached_results(cache_path)
 
-        return self.analysis_results
+        return self.analysis_results if return_results else None
 
     def _identify_unique_characteristics(self) -> Dict:
         """Identify unique characteristics of this polling station"""
         characteristics = {}
+        results = self.analysis_results
+        lookup = self._lookup
 
-        # Check for unusual demographics
-        if 'demographics' in self.analysis_results:
-            demo = self.analysis_results['demographics']['basic_stats']
-
-            # Religion dominance
-            if 'religion_distribution' in demo:
-                religion = demo['religion_distribution']
-                if 'percentages' in religion:
-                    for rel_name, rel_key in [('Hindu', 'hindu_percentage'),
-                                             ('Christian', 'christian_percentage'),
-                                             ('Muslim', 'muslim_percentage')]:
-                        if rel_key in religion['percentages']:
-                            pct = religion['percentages'][rel_key]
-                            if pct > 75:
-                                characteristics['religion_dominance'] = f"{rel_name} dominated ({pct}%)"
-                            elif pct < 5:
-                                characteristics[f'low_{rel_name.lower()}'] = f"Very few {rel_name} voters ({pct}%)"
-
-            # Age characteristics
-            if 'age_statistics' in demo:
-                age_stats = demo['age_statistics']
-                if 'mean_age' in age_stats:
-                    mean_age = age_stats['mean_age']
-                    if mean_age < 35:
-                        characteristics['young_population'] = f"Young demographic (avg age: {mean_age})"
-                    elif mean_age > 50:
-                        characteristics['aging_population'] = f"Aging demographic (avg age: {mean_age})"
-
-                if 'age_group_percentages' in age_stats:
-                    youth_pct = age_stats['age_group_percentages'].get('youth_18_30', 0)
-                    if youth_pct > 40:
-                        characteristics['youth_concentration'] = f"High youth concentration ({youth_pct}%)"
-
-            # Gender characteristics
-            if 'gender_distribution' in demo:
-                gender = demo['gender_distribution']
-                if 'gender_ratio' in gender:
-                    ratio = gender['gender_ratio']
-                    if ratio > 1100:
-                        characteristics['female_majority'] = f"Strong female majority (ratio: {ratio})"
-                    elif ratio < 900:
-                        characteristics['male_majority'] = f"Male majority (ratio: {ratio})"
-
-        # Family characteristics
-        if 'family_analysis' in self.analysis_results:
-            family = self.analysis_results['family_analysis']
-            if 'household_analysis' in family:
-                households = family['household_analysis']
-                if 'average_household_size' in households:
-                    avg_size = households['average_household_size']
-                    if avg_size > 5:
-                        characteristics['large_families'] = f"Large family sizes (avg: {avg_size})"
-                    elif avg_size < 2.5:
-                        characteristics['small_families'] = f"Small household sizes (avg: {avg_size})"
-
-                if 'multi_family_houses' in households:
-                    multi = households['multi_family_houses']
-                    if multi > 10:
-                        characteristics['multi_family_housing'] = f"{multi} multi-family houses"
-
-            if 'inter_religious_families' in family:
-                inter_rel = family['inter_religious_families']
-                if 'total_inter_religious_houses' in inter_rel:
-                    count = inter_rel['total_inter_religious_houses']
-                    if count > 5:
-                        characteristics['religious_integration'] = f"{count} inter-religious households"
+        for path, rules in self.UNIQUE_CHARACTERISTIC_RULES:
+            # Resolve each section once, then check all of its values
+            section = lookup(results, path)
+            if not isinstance(section, dict):
+                continue
+
+            for value_key, condition, key, message in rules:
+                value = section.get(value_key)
+                if value is not None and condition(value):
+                    characteristics[key] = message.format(value)
 
         return characteristics
 
+    @staticmethod
+    def _lookup(results: Dict, path: Tuple[str, ...]):
+        """Follow a key path through nested result dicts, or None if any step is missing"""
+        value = results
+        for key in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
     def _assess_data_quality(self) -> Dict:
         """Assess data quality and completeness"""
-        quality = {
-            'total_records': len(self.data),
-            'completeness': {},
-            'issues': []
-        }
+        data = self.data
+        n = len(data)
+        columns = data.columns
+        issues = []
 
-        # Check completeness of each column
-        for col in self.data.columns:
-            null_count = self.data[col].isnull().sum()
-            completeness = round((1 - null_count / len(self.data)) * 100, 2)
-            quality['completeness'][col] = completeness
+        # Check completeness of every column in one vectorized pass
+        null_counts = data.isna().sum(axis=0).to_numpy()
+        completeness = np.round((1 - null_counts / n) * 100, 2)
+        has_nulls = null_counts > 0
 
-            if completeness < 95:
-                quality['issues'].append(f"{col}: {completeness}% complete")
+        incomplete = completeness < 95
+        issues.extend(
+            f"{col}: {pct}% complete" for col, pct in zip(columns[incomplete], completeness[incomplete].tolist())
+        )
 
         # Check for data anomalies
-        if 'Age' in self.data.columns:
-            age_anomalies = self.data[(self.data['Age'] < 18) | (self.data['Age'] > 120)]['Age'].count()
+        if 'Age' in columns:
+            ages = data['Age'].to_numpy(dtype=float, na_value=np.nan)
+            age_anomalies = int(((ages < 18) | (ages > 120)).sum())
             if age_anomalies > 0:
-                quality['issues'].append(f"{age_anomalies} age anomalies detected")
+                issues.append(f"{age_anomalies} age anomalies detected")
 
         # Check for duplicate records
-        if 'New SEC ID No.' in self.data.columns:
-            duplicates = self.data['New SEC ID No.'].duplicated().sum()
-            if duplicates > 0:
-                quality['issues'].append(f"{duplicates} duplicate SEC IDs")
-
-        quality['quality_score'] = round(100 - len(quality['issues']) * 5, 0)
-        quality['quality_grade'] = 'Excellent' if quality['quality_score'] >= 95 else \
-                                  'Good' if quality['quality_score'] >= 85 else \
-                                  'Fair' if quality['quality_score'] >= 75 else 'Poor'
-
-        return quality
+        if 'New SEC ID No.' in columns:
+            sec_ids = data['New SEC ID No.']
+            # Uniqueness check is a single hash pass; only count duplicates when there are some
+            if not sec_ids.is_unique:
+                duplicates = sec_ids.duplicated().sum()
+                issues.append(f"{duplicates} duplicate SEC IDs")
+
+        quality_score = round(100 - len(issues) * 5, 0)
+        quality_grade = 'Excellent' if quality_score >= 95 else \
+                        'Good' if quality_score >= 85 else \
+                        'Fair' if quality_score >= 75 else 'Poor'
+
+        return {
+            'total_records': n,
+            # Only columns with missing values are listed; the rest are just counted
+            'completeness': dict(zip(columns[has_nulls], completeness[has_nulls].tolist())),
+            'columns_fully_complete': int((~has_nulls).sum()),
+            'issues': issues,
+            'quality_score': quality_score,
+            'quality_grade': quality_grade
+        }
 
     def save_results(self, output_dir: str):
         """Save analysis results to files"""
         # Create output directory
-        station_dir = Path(output_dir) / f"{self.ward_code}_{self.ward_name}" / f"{self.station_num}_{self.station_name.replace(' ', '_')[:50]}"
-        station_dir.mkdir(parents=True, exist_ok=True)
+        station_dir = Path(output_dir) / f"{self.ward_code}_{self.ward_name}" / f"{self.station_num}_{safe_station_name(self.station_name)}"
+        _ensure_dir(station_dir.parent)
+        station_dir.mkdir(exist_ok=True)
 
         # Save JSON results
         json_path = station_dir / "analysis_results.json"
-        with open(json_path, 'w') as f:
-            json.dump(self.analysis_results, f, indent=2, default=str)
+        if orjson is not None:
+            with open(json_path, 'wb', buffering=1 << 20) as f:
+                self._stream_dump(f)
+        else:
+            with open(json_path, 'w') as f:
+                json.dump(self._to_native(self.analysis_results), f, indent=2, default=str)
 
         # Save summary CSV
-        summary_df = self._create_summary_dataframe()
+        categories, values = self._create_summary_rows()
         csv_path = station_dir / "summary_statistics.csv"
-        summary_df.to_csv(csv_path, index=False)
+        with csv_path.open('w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(['Category', 'Value'])
+            writer.writerows(zip(categories, values))
 
         print(f"  Results saved to {station_dir}")
         return station_dir
 
-    def _create_summary_dataframe(self) -> pd.DataFrame:
-        """Create summary statistics dataframe"""
-        summary = []
+    @classmethod
+    def _to_native(cls, obj):
+        """Convert NumPy scalars in nested results to Python numbers in one pass"""
+        if isinstance(obj, dict):
+            return {key: cls._to_native(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [cls._to_native(value) for value in obj]
+        if isinstance(obj, np.generic):
+            return obj.item()
+        return obj
+
+    def _stream_dump(self, f):
+        """Encode analysis results one top-level section at a time so only one section is buffered"""
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+        f.write(b'{')
+        for i, (key, value) in enumerate(self.analysis_results.items()):
+            f.write(b',\n  ' if i else b'\n  ')
+            f.write(orjson.dumps(str(key)))
+            f.write(b': ')
+            # Shift the section's own indentation one level in to nest it under its key
+            f.write(orjson.dumps(value, default=str, option=option).replace(b'\n', b'\n  '))
+        f.write(b'\n}' if self.analysis_results else b'}')
+
+    def _create_summary_rows(self) -> Tuple[List[str], List]:
+        """Create summary statistics as parallel category and value lists"""
+        categories = []
+        values = []
+
+        def add(category, value):
+            categories.append(category)
+            values.append(value)
 
         # Basic demographics
-        if 'demographics' in self.analysis_results:
-            demo = self.analysis_results['demographics']['basic_stats']
-            summary.append({
-                'Category': 'Total Voters',
-                'Value': demo.get('total_voters', 'N/A')
-            })
-
-            if 'gender_distribution' in demo:
-                gender = demo['gender_distribution']
-                summary.append({
-                    'Category': 'Male Voters',
-                    'Value': f"{gender.get('male_count', 0)} ({gender.get('male_percentage', 0)}%)"
-                })
-                summary.append({
-                    'Category': 'Female Voters',
-                    'Value': f"{gender.get('female_count', 0)} ({gender.get('female_percentage', 0)}%)"
-                })
-                summary.append({
-                    'Category': 'Gender Ratio (F per 1000 M)',
-                    'Value': gender.get('gender_ratio', 'N/A')
-                })
-
-            if 'age_statistics' in demo:
-                age = demo['age_statistics']
-                summary.append({
-                    'Category': 'Average Age',
-                    'Value': age.get('mean_age', 'N/A')
-                })
-                if 'age_group_percentages' in age:
-                    age_groups = age['age_group_percentages']
-                    summary.append({
-                        'Category': 'Youth (18-30)',
-                        'Value': f"{age_groups.get('youth_18_30', 0)}%"
-                    })
-                    summary.append({
-                        'Category': 'Middle Age (31-60)',
-                        'Value': f"{age_groups.get('middle_31_60', 0)}%"
-                    })
-                    summary.append({
-                        'Category': 'Senior (60+)',
-                        'Value': f"{age_groups.get('senior_60_plus', 0)}%"
-                    })
-
-            if 'religion_distribution' in demo:
-                religion = demo['religion_distribution']
-                if 'percentages' in religion:
-                    percentages = religion['percentages']
-                    summary.append({
-                        'Category': 'Hindu',
-                        'Value': f"{percentages.get('hindu_percentage', 0)}%"
-                    })
-                    summary.append({
-                        'Category': 'Christian',
-                        'Value': f"{percentages.get('christian_percentage', 0)}%"
-                    })
-                    summary.append({
-                        'Category': 'Muslim',
-                        'Value': f"{percentages.get('muslim_percentage', 0)}%"
-                    })
+        demo = self.analysis_results.get('demographics', {}).get('basic_stats')
+        if demo is not None:
+            add('Total Voters', demo.get('total_voters', 'N/A'))
+
+            gender = demo.get('gender_distribution')
+            if gender is not None:
+                add('Male Voters', f"{gender.get('male_count', 0)} ({gender.get('male_percentage', 0)}%)")
+                add('Female Voters', f"{gender.get('female_count', 0)} ({gender.get('female_percentage', 0)}%)")
+                add('Gender Ratio (F per 1000 M)', gender.get('gender_ratio', 'N/A'))
+
+            age = demo.get('age_statistics')
+            if age is not None:
+                add('Average Age', age.get('mean_age', 'N/A'))
+                age_groups = age.get('age_group_percentages')
+                if age_groups is not None:
+                    add('Youth (18-30)', f"{age_groups.get('youth_18_30', 0)}%")
+                    add('Middle Age (31-60)', f"{age_groups.get('middle_31_60', 0)}%")
+                    add('Senior (60+)', f"{age_groups.get('senior_60_plus', 0)}%")
+
+            percentages = demo.get('religion_distribution', {}).get('percentages')
+            if percentages is not None:
+                add('Hindu', f"{percentages.get('hindu_percentage', 0)}%")
+                add('Christian', f"{percentages.get('christian_percentage', 0)}%")
+                add('Muslim', f"{percentages.get('muslim_percentage', 0)}%")
 
         # Family statistics
-        if 'family_analysis' in self.analysis_results:
-            family = self.analysis_results['family_analysis']
-            if 'household_analysis' in family:
-                households = family['household_analysis']
-                summary.append({
-                    'Category': 'Total Houses',
-                    'Value': households.get('total_houses', 'N/A')
-                })
-                summary.append({
-                    'Category': 'Avg Household Size',
-                    'Value': households.get('average_household_size', 'N/A')
-                })
-
-        return pd.DataFrame(summary)
\ No newline at end of file
+        households = self.analysis_results.get('family_analysis', {}).get('household_analysis')
+        if households is not None:
+            add('Total Houses', households.get('total_houses', 'N/A'))
+            add('Avg Household Size', households.get('average_household_size', 'N/A'))
+
+        return categories, values
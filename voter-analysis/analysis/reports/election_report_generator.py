@@ -4,1256 +4,1370 @@ Generates professional campaign reports matching the Bharanikkav format
 """
 
 import pandas as pd
+import numpy as np
 import json
+import functools
+import gzip
 from datetime import datetime
+from html import escape
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import os
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
 from ..core.household_analyzer import HouseholdAnalyzer
 from ..core.election_insights import ElectionInsights
 from ..core.cross_demographics import CrossDemographicAnalyzer
 from ..core.geographic_analyzer import GeographicAnalyzer
 from ..core.pattern_detector import PatternDetector
-from ..core.ai_insights import AIInsightsGenerator
 
 
-class ElectionReportGenerator:
-    """Generate comprehensive election insights reports"""
+# Static document shell shared by every report, assembled once at import
+_HTML_DOCTYPE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+"""
 
-    def __init__(self, data: pd.DataFrame, station_name: str, ward_name: str, enable_ai: bool = False):
-        self.data = data
-        self.station_name = station_name
-        self.ward_name = ward_name
-        self.total_voters = len(data)
-        self.enable_ai = enable_ai
+_HTML_HEAD = """    <style>
+        body {
+            font-family: 'Segoe UI', Arial, sans-serif;
+            line-height: 1.6;
+            max-width: 1000px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #fff;
+            color: #333;
+        }
 
-        # Initialize core analyzers
-        self.household_analyzer = HouseholdAnalyzer(data)
-        self.election_insights = ElectionInsights(data)
-
-        # Initialize new analyzers
-        self.cross_demographics = CrossDemographicAnalyzer(data)
-        self.geographic_analyzer = GeographicAnalyzer(data)
-        self.pattern_detector = PatternDetector(data)
-
-        # Initialize AI insights (optional)
-        self.ai_generator = None
-        if self.enable_ai:
-            try:
-                self.ai_generator = AIInsightsGenerator()
-                print(f"    ✓ AI Insights enabled for {station_name}")
-            except Exception as e:
-                print(f"    ⚠ AI Insights disabled: {str(e)}")
-                self.enable_ai = False
+        .report-header {
+            text-align: center;
+            border-bottom: 3px solid #2c3e50;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
 
-    def generate_full_report(self) -> str:
-        """Generate complete HTML report with enhanced analysis"""
+        .report-title {
+            font-size: 32px;
+            font-weight: bold;
+            color: #2c3e50;
+            margin: 10px 0;
+        }
 
-        # Generate all sections (original)
-        classification = self.election_insights.classify_polling_station()
-        executive_summary = self._generate_executive_summary(classification)
-        religious_demographics = self._generate_religious_demographics()
-        age_analysis = self._generate_age_analysis()
-        gender_analysis = self._generate_gender_analysis()
-        household_analysis = self._generate_household_analysis()
-
-        # Generate NEW enhanced sections
-        cross_demographic_analysis = self._generate_cross_demographic_analysis()
-        geographic_analysis = self._generate_geographic_analysis()
-        pattern_analysis = self._generate_pattern_analysis()
-
-        # Original sections (continued)
-        winning_strategy = self._generate_winning_strategy()
-        priority_demographics = self._generate_priority_demographics()
-        final_recommendations = self._generate_final_recommendations()
+        .station-info {
+            font-size: 18px;
+            color: #666;
+            margin: 5px 0;
+        }
 
-        # Build complete HTML with all sections
-        html = self._build_html_template(
-            classification,
-            executive_summary,
-            religious_demographics,
-            age_analysis,
-            gender_analysis,
-            household_analysis,
-            cross_demographic_analysis,
-            geographic_analysis,
-            pattern_analysis,
-            winning_strategy,
-            priority_demographics,
-            final_recommendations
-        )
+        .executive-summary {
+            background: #f8f9fa;
+            border-left: 4px solid #e74c3c;
+            padding: 20px;
+            margin: 20px 0;
+        }
 
-        return html
+        .critical-finding {
+            background: #ffe4e1;
+            border-left: 4px solid #e74c3c;
+            padding: 15px;
+            margin: 15px 0;
+        }
 
-    def _generate_executive_summary(self, classification: Dict) -> str:
-        """Generate executive summary section"""
-        age_stats = self.election_insights.get_age_distribution_analysis()
+        .classification-badge {
+            display: inline-block;
+            padding: 5px 15px;
+            border-radius: 3px;
+            font-weight: bold;
+            color: white;
+            margin: 5px 0;
+        }
 
-        avg_age = age_stats.get('mean_age', 'N/A')
-        median_age = age_stats.get('median_age', 'N/A')
+        .section {
+            margin: 30px 0;
+        }
 
-        # Get classification details
-        class_type = classification.get('type', 'UNCLASSIFIED')
-        description = classification.get('description', 'No classification available')
+        .section-title {
+            font-size: 24px;
+            font-weight: bold;
+            color: #2c3e50;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 10px;
+            margin: 25px 0 15px 0;
+        }
 
-        # Determine color based on classification
-        class_color = {
-            'SAFE BASE': '#27ae60',
-            'COMPETITIVE': '#f39c12',
-            'SWING': '#e74c3c',
-            'CONTESTED': '#e74c3c'
-        }.get(class_type, '#95a5a6')
+        .subsection-title {
+            font-size: 18px;
+            font-weight: bold;
+            color: #34495e;
+            margin: 20px 0 10px 0;
+        }
 
-        html = f"""
-        <div class="executive-summary">
-            <h2 class="section-title">EXECUTIVE SUMMARY</h2>
+        .strategic-insight {
+            background: #e8f4f8;
+            border-left: 4px solid #3498db;
+            padding: 15px;
+            margin: 15px 0;
+        }
 
-            <div class="metric-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{self.total_voters:,}</div>
-                    <div class="metric-label">Total Voters</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{avg_age}</div>
-                    <div class="metric-label">Average Age (years)</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{median_age}</div>
-                    <div class="metric-label">Median Age (years)</div>
-                </div>
-            </div>
+        .insight-title {
+            font-weight: bold;
+            color: #2980b9;
+            margin-bottom: 5px;
+        }
 
-            <div class="critical-finding">
-                <h3>Critical Finding</h3>
-                <p><span class="classification-badge" style="background: {class_color};">{class_type}</span></p>
-                <p>{description}</p>
-            </div>
-        </div>
-        """
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 15px 0;
+        }
 
-        return html
+        th {
+            background: #34495e;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            font-weight: bold;
+        }
 
-    def _generate_religious_demographics(self) -> str:
-        """Generate religious demographics section"""
-        if 'religion' not in self.data.columns:
-            return '<p>Religion data not available</p>'
+        td {
+            padding: 10px 12px;
+            border-bottom: 1px solid #ddd;
+        }
 
-        religion_counts = self.data['religion'].value_counts()
-        total = religion_counts.sum()
+        tr:nth-child(even) {
+            background: #f8f9fa;
+        }
 
-        # Build table
-        table_rows = ""
-        for religion, count in religion_counts.items():
-            pct = round(count / total * 100, 1)
-            table_rows += f"""
-            <tr>
-                <td>{religion}</td>
-                <td>{count:,}</td>
-                <td>{pct}%</td>
-            </tr>
-            """
+        tr:hover {
+            background: #ecf0f1;
+        }
 
-        # Age profiles by religion
-        age_profile_rows = ""
-        if 'Age' in self.data.columns:
-            for religion in religion_counts.index[:3]:  # Top 3 religions
-                religion_data = self.data[self.data['religion'] == religion]
+        .priority-high {
+            color: #e74c3c;
+            font-weight: bold;
+        }
 
-                young = ((religion_data['Age'] >= 18) & (religion_data['Age'] <= 35)).sum()
-                middle = ((religion_data['Age'] >= 36) & (religion_data['Age'] <= 55)).sum()
-                senior = (religion_data['Age'] >= 56).sum()
+        .priority-medium {
+            color: #f39c12;
+            font-weight: bold;
+        }
 
-                total_rel = len(religion_data)
-                avg_age = round(religion_data['Age'].mean(), 1)
+        .priority-low {
+            color: #95a5a6;
+        }
 
-                young_pct = round(young / total_rel * 100, 1) if total_rel > 0 else 0
-                middle_pct = round(middle / total_rel * 100, 1) if total_rel > 0 else 0
-                senior_pct = round(senior / total_rel * 100, 1) if total_rel > 0 else 0
+        .recommendation-box {
+            background: #fff3cd;
+            border-left: 4px solid #ffc107;
+            padding: 15px;
+            margin: 15px 0;
+        }
 
-                age_profile_rows += f"""
-                <tr>
-                    <td>{religion}</td>
-                    <td>{avg_age} yrs</td>
-                    <td>{young} ({young_pct}%)</td>
-                    <td>{middle} ({middle_pct}%)</td>
-                    <td>{senior} ({senior_pct}%)</td>
-                </tr>
-                """
+        .action-list {
+            background: #d4edda;
+            border-left: 4px solid #28a745;
+            padding: 15px;
+            margin: 15px 0;
+        }
 
-        html = f"""
-        <div class="section">
-            <h2 class="section-title">1. RELIGIOUS DEMOGRAPHICS & STRATEGIC IMPLICATIONS</h2>
+        .action-list li {
+            margin: 8px 0;
+            font-weight: 500;
+        }
 
-            <h3 class="subsection-title">1.1 Religious Composition</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Religion</th>
-                        <th>Total Voters</th>
-                        <th>Percentage</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {table_rows}
-                </tbody>
-            </table>
+        .metric-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin: 20px 0;
+        }
 
-            <div class="strategic-insight">
-                <div class="insight-title">Strategic Insight:</div>
-                <p>{self._get_religious_strategic_insight(religion_counts)}</p>
-            </div>
+        .metric-card {
+            background: #fff;
+            border: 2px solid #e0e0e0;
+            border-radius: 5px;
+            padding: 15px;
+            text-align: center;
+        }
 
-            <h3 class="subsection-title">1.2 Age Profiles by Religion</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Religion</th>
-                        <th>Avg Age</th>
-                        <th>Young (≤35)</th>
-                        <th>Middle (36-55)</th>
-                        <th>Senior (56+)</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {age_profile_rows}
-                </tbody>
-            </table>
-        </div>
-        """
+        .metric-value {
+            font-size: 32px;
+            font-weight: bold;
+            color: #2c3e50;
+        }
 
-        return html
+        .metric-label {
+            color: #666;
+            font-size: 14px;
+            margin-top: 5px;
+        }
 
-    def _get_religious_strategic_insight(self, religion_counts: pd.Series) -> str:
-        """Generate strategic insight based on religious composition"""
-        if len(religion_counts) == 0:
-            return "Insufficient data for strategic analysis."
+        .family-card {
+            border: 1px solid #ddd;
+            border-radius: 5px;
+            margin: 10px 0;
+            overflow: hidden;
+        }
 
-        total = religion_counts.sum()
-        dominant = religion_counts.index[0]
-        dominant_pct = round(religion_counts.iloc[0] / total * 100, 1)
+        .family-header {
+            background: #f8f9fa;
+            padding: 15px;
+            cursor: pointer;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }
 
-        if dominant_pct >= 70:
-            return f"Strong {dominant} base ({dominant_pct}%) provides solid foundation. Focus on maintaining unity and high turnout."
-        elif dominant_pct >= 60:
-            return f"{dominant} majority ({dominant_pct}%) ensures baseline support. Coalition-building with minorities recommended for decisive victory."
-        elif dominant_pct >= 50:
-            return f"{dominant} has advantage ({dominant_pct}%) but victory requires strong minority outreach and avoiding polarization."
-        else:
-            return f"Balanced demographics with {dominant} plurality ({dominant_pct}%). Success depends on building cross-community coalition."
+        .family-header:hover {
+            background: #e9ecef;
+        }
 
-    def _generate_age_analysis(self) -> str:
-        """Generate age-based analysis section"""
-        age_data = self.election_insights.get_age_distribution_analysis()
+        .family-members {
+            max-height: 0;
+            overflow: hidden;
+            transition: max-height 0.3s ease;
+        }
 
-        if 'error' in age_data:
-            return '<p>Age data not available</p>'
+        .family-members.expanded {
+            max-height: 2000px;
+        }
 
-        distribution = age_data['distribution']
+        .expand-icon {
+            transition: transform 0.3s ease;
+            font-size: 18px;
+        }
 
-        # Build table
-        table_rows = ""
-        for age_group, data in distribution.items():
-            priority_class = {
-                'HIGHEST': 'priority-high',
-                'HIGH': 'priority-high',
-                'MEDIUM': 'priority-medium',
-                'LOW': 'priority-low'
-            }.get(data['priority'], '')
-
-            table_rows += f"""
-            <tr>
-                <td>{age_group}</td>
-                <td>{data['label']}</td>
-                <td>{data['count']:,}</td>
-                <td>{data['percentage']}%</td>
-                <td class="{priority_class}">{data['priority']}</td>
-            </tr>
-            """
+        .expand-icon.rotated {
+            transform: rotate(180deg);
+        }
 
-        primary_target = age_data.get('primary_target', {})
-        first_time = age_data.get('first_time_voters', 0)
-        first_time_pct = round(first_time / self.total_voters * 100, 1)
+        .member-item {
+            padding: 5px 0;
+            border-bottom: 1px solid #e0e0e0;
+        }
 
-        html = f"""
-        <div class="section">
-            <h2 class="section-title">2. AGE-BASED ANALYSIS & GENERATIONAL STRATEGY</h2>
+        .member-item:last-child {
+            border-bottom: none;
+        }
 
-            <h3 class="subsection-title">2.1 Age Distribution</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Age Group</th>
-                        <th>Category</th>
-                        <th>Total</th>
-                        <th>Percentage</th>
-                        <th>Strategic Priority</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {table_rows}
-                </tbody>
-            </table>
+        @media (max-width: 768px) {
+            body {
+                padding: 10px;
+            }
 
-            <div class="strategic-insight">
-                <div class="insight-title">Critical Insight:</div>
-                <p>{primary_target.get('strategy', 'Focus on primary demographic groups')}</p>
-                <p><strong>First-time voters (18-21):</strong> {first_time:,} ({first_time_pct}% of electorate)</p>
-            </div>
-        </div>
-        """
+            .report-title {
+                font-size: 24px;
+            }
 
-        return html
+            .section-title {
+                font-size: 20px;
+            }
 
-    def _generate_gender_analysis(self) -> str:
-        """Generate gender analysis section"""
-        gender_data = self.election_insights.get_gender_analysis()
+            table {
+                font-size: 14px;
+            }
 
-        if 'error' in gender_data:
-            return '<p>Gender data not available</p>'
+            th, td {
+                padding: 8px 6px;
+            }
 
-        overall = gender_data['overall']
-        middle_women = gender_data.get('middle_aged_women', {})
+            .metric-grid {
+                grid-template-columns: 1fr;
+            }
+        }
 
-        html = f"""
+        @media print {
+            .family-members {
+                max-height: none !important;
+            }
+        }
+
+        /* New styles for enhanced sections */
+        .ai-insight-box {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            border-radius: 8px;
+            padding: 15px;
+            margin: 20px 0;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+
+        .ai-insight-title {
+            font-weight: bold;
+            font-size: 16px;
+            margin-bottom: 8px;
+        }
+
+        .pattern-card {
+            border-left: 4px solid #95a5a6;
+            background: #f8f9fa;
+            padding: 12px;
+            margin: 10px 0;
+            border-radius: 4px;
+        }
+
+        .pattern-card.severity-high {
+            border-left-color: #e74c3c;
+            background: #ffe4e1;
+        }
+
+        .pattern-card.severity-medium {
+            border-left-color: #f39c12;
+            background: #fff3cd;
+        }
+
+        .pattern-card.severity-low {
+            border-left-color: #3498db;
+            background: #e8f4f8;
+        }
+
+        .pattern-header {
+            display: flex;
+            align-items: center;
+            gap: 10px;
+            margin-bottom: 5px;
+        }
+
+        .severity-badge {
+            background: #e74c3c;
+            color: white;
+            padding: 2px 8px;
+            border-radius: 3px;
+            font-size: 11px;
+            font-weight: bold;
+        }
+
+        .pattern-card.severity-medium .severity-badge {
+            background: #f39c12;
+        }
+
+        .pattern-card.severity-low .severity-badge {
+            background: #3498db;
+        }
+
+        .pattern-implication {
+            color: #555;
+            font-size: 14px;
+            margin: 5px 0 0 0;
+        }
+
+        .enclave-card {
+            background: #e8f4f8;
+            border-left: 4px solid #3498db;
+            padding: 10px 15px;
+            margin: 8px 0;
+            border-radius: 4px;
+        }
+
+        .mixed-area-card {
+            background: #fff3cd;
+            border-left: 4px solid #f39c12;
+            padding: 10px 15px;
+            margin: 8px 0;
+            border-radius: 4px;
+        }
+    </style>
+</head>
+<body>"""
+
+_HTML_TAIL = """
+
+    <script>
+        function toggleFamily(id) {
+            const element = document.getElementById(id);
+            const icon = document.getElementById('icon' + id.replace('family', ''));
+
+            if (element.classList.contains('expanded')) {
+                element.classList.remove('expanded');
+                icon.classList.remove('rotated');
+            } else {
+                element.classList.add('expanded');
+                icon.classList.add('rotated');
+            }
+        }
+    </script>
+</body>
+</html>"""
+
+# Fixed markup of the geographic (6) and pattern (7) sections; only the computed parts are filled in
+_GEOGRAPHIC_SECTION = """
         <div class="section">
-            <h2 class="section-title">3. GENDER ANALYSIS - THE WOMEN VOTE</h2>
+            <h2 class="section-title">6. GEOGRAPHIC & REGIONAL ANALYSIS</h2>
 
-            <h3 class="subsection-title">3.1 Overall Gender Split</h3>
+            <h3 class="subsection-title">6.1 Regional Demographics by House Numbers</h3>
             <table>
                 <thead>
                     <tr>
-                        <th>Gender</th>
-                        <th>Count</th>
-                        <th>Percentage</th>
+                        <th>Region</th>
+                        <th>House Range</th>
+                        <th>Voters</th>
+                        <th>% Total</th>
+                        <th>Dominant Group</th>
                     </tr>
                 </thead>
                 <tbody>
-                    <tr>
-                        <td>Male Voters</td>
-                        <td>{overall['male_voters']:,}</td>
-                        <td>{overall['male_percentage']}%</td>
-                    </tr>
-                    <tr>
-                        <td>Female Voters</td>
-                        <td>{overall['female_voters']:,}</td>
-                        <td>{overall['female_percentage']}%</td>
-                    </tr>
+                    {region_rows}
                 </tbody>
             </table>
 
-            <div class="strategic-insight">
-                <div class="insight-title">Gender Gap Analysis:</div>
-                <p>Female voters {"outnumber" if overall['gender_gap'] > 0 else "trail"} male voters by {abs(overall['gender_gap']):,} votes
-                ({abs(round(overall['gender_gap'] / self.total_voters * 100, 1))}% margin).</p>
-            </div>
+            <h3 class="subsection-title">6.2 Religious Enclaves (70%+ Concentration)</h3>
+            {enclaves_html}
 
-            <h3 class="subsection-title">3.2 The Critical Demographic: Middle-Aged Women (30-50 years)</h3>
-            <div class="action-list">
-                <p><strong>Total middle-aged women:</strong> {middle_women.get('total', 0):,}
-                ({middle_women.get('percentage_of_electorate', 0)}% of entire electorate)</p>
+            <h3 class="subsection-title">6.3 Mixed/Swing Areas (High Diversity)</h3>
+            {mixed_html}
 
-                <p><strong>STRATEGIC IMPERATIVE:</strong> This group represents 1 in {round(100/middle_women.get('percentage_of_electorate', 1))} voters. They are:</p>
-                <ul>
-                    <li>Primary household decision-makers</li>
-                    <li>Concerned about healthcare, education, safety</li>
-                    <li>Influenced by welfare schemes (ration, pension, housing)</li>
-                    <li>Often decide how the entire family votes</li>
-                </ul>
+            {ai_insight_html}
 
-                <p><strong>Campaign Priority:</strong></p>
+            <div class="recommendation-box">
+                <h4>Geographic Strategy:</h4>
                 <ul>
-                    {''.join(f'<li>{priority}</li>' for priority in middle_women.get('campaign_priorities', []))}
+                    <li>Target mixed areas with inclusive, cross-community messaging</li>
+                    <li>In enclaves, focus on mobilization and turnout rather than persuasion</li>
+                    <li>Use house number clustering for efficient door-to-door campaigns</li>
                 </ul>
             </div>
         </div>
         """
 
-        return html
-
-    def _generate_household_analysis(self) -> str:
-        """Generate household and family voting blocs section"""
-
-        # Get household statistics
-        stats = self.household_analyzer.get_household_statistics()
-
-        # Get top 20 influential families
-        top_families = self.household_analyzer.get_top_influential_households(top_n=20)
+_PATTERN_SECTION = """
+        <div class="section">
+            <h2 class="section-title">7. PATTERN DETECTION & ANOMALIES</h2>
 
-        # Build influential families section with expandable members
-        families_html = ""
-        for i, family in enumerate(top_families, 1):
-            # Build member list
-            members_html = ""
-            for member in family['members']:
-                house_name_html = f"<br><em style='color: #666; font-size: 13px;'>🏠 {member['house_name']}</em>" if member.get('house_name') and member['house_name'] != 'N/A' else ""
-                members_html += f"""
-                <div class="member-item">
-                    <strong>{member['serial_no']}</strong> - {member['name']}
-                    ({member['gender']}, {member['age']}) - {member['relationship']}{house_name_html}
+            <div class="metric-grid">
+                <div class="metric-card">
+                    <div class="metric-value">{total_patterns}</div>
+                    <div class="metric-label">Patterns Detected</div>
                 </div>
-                """
-
-            # Religious composition
-            religion_text = ", ".join([f"{k}: {v}" for k, v in family['religious_composition'].items()])
-
-            # Format house display with name
-            house_display = f"{family['house_address']} ({family['house_name']})" if family.get('house_name') and family['house_name'] != 'N/A' else family['house_address']
-
-            families_html += f"""
-            <div class="family-card">
-                <div class="family-header" onclick="toggleFamily('family{i}')">
-                    <div>
-                        <strong>#{i}. {family['head_of_household']}</strong> - {house_display}
-                        <br>
-                        <span style="font-size: 13px; color: #2563eb;">📍 {family['region_label']}</span>
-                        <br>
-                        <span style="font-size: 14px; color: #666;">
-                            {family['total_members']} members | {family['voting_power_percentage']}% voting power |
-                            {family['household_type']}
-                        </span>
-                    </div>
-                    <span class="expand-icon" id="icon{i}">▼</span>
+                <div class="metric-card">
+                    <div class="metric-value">{high_severity}</div>
+                    <div class="metric-label">High Priority</div>
                 </div>
-                <div class="family-members" id="family{i}">
-                    <div style="padding: 15px; background: #f8f9fa;">
-                        <p><strong>Religious Composition:</strong> {religion_text}</p>
-                        <p><strong>Strategy:</strong> {family['strategy']}</p>
-                        <hr style="margin: 10px 0;">
-                        <p><strong>Family Members:</strong></p>
-                        {members_html}
-                    </div>
+                <div class="metric-card">
+                    <div class="metric-value">{medium_severity}</div>
+                    <div class="metric-label">Medium Priority</div>
                 </div>
             </div>
-            """
 
-        html = f"""
-        <div class="section">
-            <h2 class="section-title">4. HOUSEHOLD & FAMILY VOTING BLOCS</h2>
+            <h3 class="subsection-title">7.1 Critical Patterns & Anomalies</h3>
+            {critical_html}
 
-            <h3 class="subsection-title">4.1 Household Size Analysis</h3>
-            <p><strong>Total Unique Households:</strong> {stats['total_households']:,}</p>
-            <p><strong>Average Voters per Household:</strong> {stats['average_household_size']}</p>
-            <p><strong>Large Households (5+ voters):</strong> {stats['household_size_distribution']['large_6_10'] + stats['household_size_distribution']['very_large_10_plus']:,}</p>
-            <p><strong>Very Large Households (8+ voters):</strong> {stats['household_size_distribution']['very_large_10_plus']:,}</p>
+            {mixed_faith_html}
 
-            <div class="strategic-insight">
-                <div class="insight-title">Strategic Gold Mine:</div>
-                <p>Large households contain significant voting power.
-                <strong>Winning one influential family member = winning {stats['average_household_size']} votes</strong></p>
-            </div>
+            {ai_insight_html}
 
-            <h3 class="subsection-title">4.2 Top 20 Influential Family Blocs</h3>
-            <p style="margin-bottom: 15px;"><em>Click on each family to view all members with serial numbers and house names</em></p>
-            {families_html}
+            <div class="action-list">
+                <h4>Action Items from Pattern Analysis:</h4>
+                <ol>
+                    <li>Review high-severity patterns and adjust strategy accordingly</li>
+                    <li>Address identified demographic gaps or imbalances</li>
+                    <li>Leverage unusual patterns as strategic opportunities</li>
+                    <li>Monitor mixed-faith households for swing potential</li>
+                </ol>
+            </div>
         </div>
         """
 
-        return html
+# One critical-pattern card in section 7; filled per pattern with str.format
+_PATTERN_CARD = """
+            <div class="pattern-card severity-{severity}">
+                <div class="pattern-header">
+                    <span class="severity-badge">{severity_label}</span>
+                    <strong>{description}</strong>
+                </div>
+                <p class="pattern-implication"><em>Implication:</em> {implication}</p>
+            </div>
+            """
 
-    def _generate_winning_strategy(self) -> str:
-        """Generate winning strategy section"""
-        scenarios = self.election_insights.calculate_winning_scenarios()
 
-        if 'error' in scenarios:
-            return '<p>Insufficient data for strategy calculation</p>'
-
-        primary = scenarios.get('primary_strategy', {})
-
-        # Build requirements section
-        requirements_html = ""
-        for key, req in primary.get('requirements', {}).items():
-            requirements_html += f"""
-            <li><strong>{key.replace('_', ' ').title()}:</strong> {req['total']:,} voters
-            (need {req['needed_percentage']}% = {req['expected_votes']:,} votes)</li>
-            """
+class ElectionReportGenerator:
+    """Generate comprehensive election insights reports"""
 
-        # Key actions
-        key_actions = self.election_insights.generate_key_actions()
-        actions_html = "".join([f"<li>{action}</li>" for action in key_actions])
+    # Executive summary color per station classification
+    CLASSIFICATION_COLORS = {
+        'SAFE BASE': '#27ae60',
+        'COMPETITIVE': '#f39c12',
+        'SWING': '#e74c3c',
+        'CONTESTED': '#e74c3c'
+    }
+
+    # CSS class per age group priority
+    PRIORITY_CLASSES = {
+        'HIGHEST': 'priority-high',
+        'HIGH': 'priority-high',
+        'MEDIUM': 'priority-medium',
+        'LOW': 'priority-low'
+    }
 
-        html = f"""
-        <div class="section">
-            <h2 class="section-title">8. WINNING STRATEGY FOR THIS DISTRICT</h2>
+    def __init__(self, data: pd.DataFrame, station_name: str, ward_name: str, enable_ai: bool = False):
+        self.data = data
+        self.station_name = station_name
+        self.ward_name = ward_name
+        self.total_voters = len(data)
+        self._pct_factor = (100.0 / self.total_voters) if self.total_voters else 0.0
+        self.enable_ai = enable_ai
 
-            <h3 class="subsection-title">Scenario: {primary.get('name', 'Primary Strategy')}</h3>
-            <p><strong>Formula:</strong> {primary.get('formula', 'N/A')}</p>
+        # "<insight>: <error>" for every AI insight that failed (list.append is safe across the section threads)
+        self.ai_failures = []
+
+        # Without AI every insight box is empty, so sections get a no-op instead of the checked helper
+        if not enable_ai:
+            self._ai_insight_html = lambda insight, build_data: ""
+
+        # Stamped once so the header and footer agree and renders don't re-read the clock
+        generated = datetime.now()
+        self._generated_at = generated.strftime('%Y-%m-%d %H:%M')
+        self._generated_date = generated.strftime('%Y-%m-%d')
+        self._total_voters_fmt = f"{self.total_voters:,}"
+
+    # Analyzers and the AI generator are created on first use, so callers that only need
+    # some of them (e.g. the influential households) don't pay for the rest
+    @functools.cached_property
+    def _core_analyzers(self) -> Tuple[HouseholdAnalyzer, ElectionInsights]:
+        """Household and election analyzers, built together in this order since both add derived columns to the frame"""
+        return HouseholdAnalyzer(self.data), ElectionInsights(self.data)
+
+    @property
+    def household_analyzer(self) -> HouseholdAnalyzer:
+        return self._core_analyzers[0]
+
+    @property
+    def election_insights(self) -> ElectionInsights:
+        return self._core_analyzers[1]
+
+    # The newer analyzers read the derived house/age/gender columns, so the core analyzers are built first
+    @functools.cached_property
+    def cross_demographics(self) -> CrossDemographicAnalyzer:
+        self._core_analyzers
+        return CrossDemographicAnalyzer(self.data)
+
+    @functools.cached_property
+    def geographic_analyzer(self) -> GeographicAnalyzer:
+        self._core_analyzers
+        return GeographicAnalyzer(self.data)
+
+    @functools.cached_property
+    def pattern_detector(self) -> PatternDetector:
+        self._core_analyzers
+        return PatternDetector(self.data)
+
+    @functools.cached_property
+    def ai_generator(self):
+        """AI insights generator (optional), or None when AI is disabled or unavailable"""
+        if not self.enable_ai:
+            return None
+
+        try:
+            # Imported here so the OpenAI client is only loaded when AI insights are requested
+            from ..core.ai_insights import AIInsightsGenerator
+            ai_generator = AIInsightsGenerator()
+            print(f"    ✓ AI Insights enabled for {self.station_name}")
+            return ai_generator
+        except Exception as e:
+            print(f"    ⚠ AI Insights disabled: {str(e)}")
+            self.enable_ai = False
+            return None
+
+    def _ai_insight_html(self, insight: str, build_data: Callable[[], object]) -> str:
+        """AI insight box from generate_<insight>_insight, or "" when AI is off or the call fails (recorded in ai_failures)"""
+        if not (self.enable_ai and self.ai_generator):
+            return ""
+
+        try:
+            ai_insight = getattr(self.ai_generator, f"generate_{insight}_insight")(build_data())
+        except Exception as e:
+            print(f"    ⚠ AI {insight} insight failed for {self.station_name}: {str(e)}")
+            self.ai_failures.append(f"{insight}: {str(e)}")
+            return ""
+
+        return f"""
+                <div class="ai-insight-box">
+                    <div class="ai-insight-title">🤖 AI Insight:</div>
+                    <p>{escape(ai_insight)}</p>
+                </div>
+                """
 
-            <div class="recommendation-box">
-                <h4>Requirements:</h4>
-                <ul>
-                    {requirements_html}
-                </ul>
-                <p><strong>Expected Total:</strong> {primary.get('total_expected', 0):,} votes ({primary.get('vote_share', 0)}% vote share)</p>
-                <p><strong>Margin of Victory:</strong> {primary.get('margin', 0):,} votes</p>
-            </div>
+    # Results shared by several report sections, computed once per report
+    @functools.cached_property
+    def _age_distribution(self) -> Dict:
+        return self.election_insights.get_age_distribution_analysis()
 
-            <div class="action-list">
-                <h4>Key Actions:</h4>
-                <ol>
-                    {actions_html}
-                </ol>
-            </div>
-        </div>
-        """
+    @functools.cached_property
+    def _key_actions(self) -> List[str]:
+        return self.election_insights.generate_key_actions()
 
-        return html
+    @functools.cached_property
+    def _all_patterns(self) -> Dict:
+        return self.pattern_detector.get_all_anomalies_and_patterns()
 
-    def _generate_priority_demographics(self) -> str:
-        """Generate priority target demographics section"""
-        priorities = self.election_insights.identify_priority_demographics()
+    def generate_full_report(self) -> str:
+        """Generate complete HTML report with enhanced analysis"""
+        return "".join(self._generate_report_parts())
 
-        # Add large households as priority #2
-        stats = self.household_analyzer.get_household_statistics()
-        large_house_count = stats['household_size_distribution']['large_6_10'] + stats['household_size_distribution']['very_large_10_plus']
+    def _generate_report_parts(self) -> List[str]:
+        """Generate the report as a list of HTML fragments in document order"""
+        # Nothing to analyze: skip every analyzer and emit just the header and a notice
+        if self.total_voters == 0:
+            return self._build_html_template(self._generate_empty_notice())
 
-        # Insert large households at position 2
-        if len(priorities) >= 2:
-            priorities.insert(1, {
-                'rank': 2,
-                'demographic': 'Large households (5+ voters)',
-                'count': large_house_count,
-                'percentage': round(large_house_count / stats['total_households'] * 100, 1) if stats['total_households'] > 0 else 0,
-                'why': 'One converted family = 5-8 votes',
-                'how': 'Personal visits, respected community member introductions'
-            })
+        classification = self.election_insights.classify_polling_station()
 
-        # Re-rank
-        for i, p in enumerate(priorities, 1):
-            p['rank'] = i
+        # Create the analyzers and the inputs shared by several sections up front so the threads don't race to fill them
+        for shared in ('cross_demographics', 'geographic_analyzer', 'pattern_detector', 'ai_generator',
+                       '_age_distribution', '_key_actions'):
+            getattr(self, shared)
+
+        section_builders = [
+            # Original sections
+            functools.partial(self._generate_executive_summary, classification),
+            self._generate_religious_demographics,
+            self._generate_age_analysis,
+            self._generate_gender_analysis,
+            self._generate_household_analysis,
+
+            # NEW enhanced sections
+            self._generate_cross_demographic_analysis,
+            self._generate_geographic_analysis,
+            self._generate_pattern_analysis,
+
+            # Original sections (continued)
+            self._generate_winning_strategy,
+            self._generate_priority_demographics,
+            self._generate_final_recommendations
+        ]
+
+        # Sections only read the shared frame and analyzers, and both pandas aggregations and the
+        # sections' AI requests release the GIL, so build them side by side (map keeps the report order)
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            sections = list(executor.map(lambda build: build(), section_builders))
 
-        # Build table
-        rows_html = ""
-        for p in priorities[:5]:  # Top 5
-            rows_html += f"""
-            <tr>
-                <td><strong>{p['rank']}</strong></td>
-                <td>{p['demographic']}</td>
-                <td>{p['count']:,} ({p['percentage']}%)</td>
-                <td>{p['why']}</td>
-                <td>{p['how']}</td>
-            </tr>
-            """
+        # Build complete HTML with all sections
+        return self._build_html_template(*sections)
 
-        html = f"""
+    def _generate_empty_notice(self) -> str:
+        """Generate the notice shown instead of the analysis sections when there are no voters"""
+        return """
         <div class="section">
-            <h2 class="section-title">9. PRIORITY TARGET DEMOGRAPHICS (Rank Ordered)</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Rank</th>
-                        <th>Demographic</th>
-                        <th>Count</th>
-                        <th>Why Important</th>
-                        <th>How to Reach</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {rows_html}
-                </tbody>
-            </table>
+            <h2 class="section-title">NO VOTER DATA</h2>
+            <p>No voter records were found for this polling station, so no analysis was generated.</p>
         </div>
         """
 
-        return html
-
-    def _generate_final_recommendations(self) -> str:
-        """Generate final recommendations section"""
-        metrics = self.election_insights.generate_success_metrics()
+    def _generate_executive_summary(self, classification: Dict) -> str:
+        """Generate executive summary section"""
+        age_stats = self._age_distribution
 
-        # Top 5 actions
-        actions = self.election_insights.generate_key_actions()
-        actions_html = "".join([f"<li><strong>Action {i+1}:</strong> {action}</li>" for i, action in enumerate(actions[:5])])
+        avg_age = age_stats.get('mean_age', 'N/A')
+        median_age = age_stats.get('median_age', 'N/A')
 
-        # Success metrics
-        metrics_html = ""
-        for key, value in metrics.get('coverage_targets', {}).items():
-            metrics_html += f"<li>{value}</li>"
+        # Get classification details
+        class_type = classification.get('type', 'UNCLASSIFIED')
+        description = classification.get('description', 'No classification available')
 
-        turnout = metrics.get('turnout_targets', {})
+        # Determine color based on classification
+        class_color = self.CLASSIFICATION_COLORS.get(class_type, '#95a5a6')
 
         html = f"""
-        <div class="section">
-            <h2 class="section-title">10. FINAL RECOMMENDATIONS</h2>
+        <div class="executive-summary">
+            <h2 class="section-title">EXECUTIVE SUMMARY</h2>
 
-            <div class="action-list">
-                <h3 class="subsection-title">Top 5 Actions for {self.station_name}</h3>
-                <ol>
-                    {actions_html}
-                </ol>
+            <div class="metric-grid">
+                <div class="metric-card">
+                    <div class="metric-value">{self._total_voters_fmt}</div>
+                    <div class="metric-label">Total Voters</div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-value">{avg_age}</div>
+                    <div class="metric-label">Average Age (years)</div>
+                </div>
+                <div class="metric-card">
+                    <div class="metric-value">{median_age}</div>
+                    <div class="metric-label">Median Age (years)</div>
+                </div>
             </div>
 
-            <div class="recommendation-box">
-                <h3 class="subsection-title">Success Metrics</h3>
-                <ul>
-                    {metrics_html}
-                </ul>
-
-                <h4 style="margin-top: 15px;">Turnout Targets:</h4>
-                <ul>
-                    <li><strong>Minimum required:</strong> {turnout.get('minimum', {}).get('percentage', 0)}% ({turnout.get('minimum', {}).get('voters', 0):,} voters)</li>
-                    <li><strong>Target:</strong> {turnout.get('target', {}).get('percentage', 0)}% ({turnout.get('target', {}).get('voters', 0):,} voters)</li>
-                    <li><strong>Stretch goal:</strong> {turnout.get('stretch', {}).get('percentage', 0)}% ({turnout.get('stretch', {}).get('voters', 0):,} voters)</li>
-                </ul>
+            <div class="critical-finding">
+                <h3>Critical Finding</h3>
+                <p><span class="classification-badge" style="background: {class_color};">{class_type}</span></p>
+                <p>{description}</p>
             </div>
         </div>
-
-        <div style="text-align: center; margin-top: 40px; padding: 20px; border-top: 3px solid #2c3e50;">
-            <h3>Report End</h3>
-            <p><strong>{self.station_name}:</strong> {self.total_voters:,} voters | Generated {datetime.now().strftime('%Y-%m-%d')}</p>
-        </div>
         """
 
         return html
 
-    def _generate_cross_demographic_analysis(self) -> str:
-        """Generate cross-demographic analysis section (NEW)"""
-        clusters = self.cross_demographics.identify_demographic_clusters()
+    def _generate_religious_demographics(self) -> str:
+        """Generate religious demographics section"""
+        if 'religion' not in self.data.columns:
+            return '<p>Religion data not available</p>'
 
-        # Build top 10 clusters table
-        cluster_rows = ""
-        for i, cluster in enumerate(clusters[:10], 1):
-            cluster_rows += f"""
+        religion_counts = self.data['religion'].value_counts()
+        total = religion_counts.sum()
+
+        # Build table (counts and percentages formatted column-wise, so the rows only splice strings)
+        count_labels = religion_counts.map('{:,}'.format)
+        pct_labels = (religion_counts / total * 100).round(1).astype(str) + '%'
+        table_rows_parts = []
+        for religion, count_label, pct_label in zip(religion_counts.index, count_labels, pct_labels):
+            table_rows_parts.append(f"""
             <tr>
-                <td>{i}</td>
-                <td>{cluster['label']}</td>
-                <td>{cluster['count']:,}</td>
-                <td>{cluster['percentage_of_electorate']}%</td>
-                <td>{cluster['average_age']}</td>
+                <td>{religion}</td>
+                <td>{count_label}</td>
+                <td>{pct_label}</td>
             </tr>
-            """
+            """)
+        table_rows = "".join(table_rows_parts)
 
-        # Get AI insight if enabled
-        ai_insight_html = ""
-        if self.enable_ai and self.ai_generator:
-            try:
-                cross_data = self.cross_demographics.analyze_age_gender_by_religion()
-                ai_insight = self.ai_generator.generate_cross_demographic_insight(cross_data)
-                ai_insight_html = f"""
-                <div class="ai-insight-box">
-                    <div class="ai-insight-title">🤖 AI Insight:</div>
-                    <p>{ai_insight}</p>
-                </div>
-                """
-            except:
-                pass
+        # Age profiles by religion
+        age_profile_rows_parts = []
+        if 'Age' in self.data.columns:
+            # Row positions of every religion from one hashed pass, and the ages as a plain array
+            religion_rows = self.data.groupby('religion', sort=False).indices
+            ages = self.data['Age'].to_numpy(dtype=float, na_value=np.nan)
+
+            for religion in religion_counts.index[:3]:  # Top 3 religions
+                religion_ages = ages[religion_rows[religion]]
+                known_ages = religion_ages[~np.isnan(religion_ages)]
+
+                young = np.count_nonzero((religion_ages >= 18) & (religion_ages <= 35))
+                middle = np.count_nonzero((religion_ages >= 36) & (religion_ages <= 55))
+                senior = np.count_nonzero(religion_ages >= 56)
+
+                total_rel = religion_counts[religion]
+                avg_age = round(known_ages.mean(), 1) if len(known_ages) > 0 else np.nan
+
+                rel_factor = 100.0 / total_rel if total_rel > 0 else 0.0
+                young_pct = round(young * rel_factor, 1)
+                middle_pct = round(middle * rel_factor, 1)
+                senior_pct = round(senior * rel_factor, 1)
+
+                age_profile_rows_parts.append(f"""
+                <tr>
+                    <td>{religion}</td>
+                    <td>{avg_age} yrs</td>
+                    <td>{young} ({young_pct}%)</td>
+                    <td>{middle} ({middle_pct}%)</td>
+                    <td>{senior} ({senior_pct}%)</td>
+                </tr>
+                """)
+        age_profile_rows = "".join(age_profile_rows_parts)
 
         html = f"""
         <div class="section">
-            <h2 class="section-title">5. CROSS-DEMOGRAPHIC ANALYSIS</h2>
-
-            <h3 class="subsection-title">5.1 Strategic Demographic Clusters</h3>
-            <p>Multi-dimensional demographic segments ranked by strategic value:</p>
+            <h2 class="section-title">1. RELIGIOUS DEMOGRAPHICS & STRATEGIC IMPLICATIONS</h2>
 
+            <h3 class="subsection-title">1.1 Religious Composition</h3>
             <table>
                 <thead>
                     <tr>
-                        <th>Rank</th>
-                        <th>Demographic Cluster</th>
-                        <th>Voters</th>
-                        <th>% of Electorate</th>
-                        <th>Avg Age</th>
+                        <th>Religion</th>
+                        <th>Total Voters</th>
+                        <th>Percentage</th>
                     </tr>
                 </thead>
                 <tbody>
-                    {cluster_rows}
+                    {table_rows}
                 </tbody>
             </table>
 
-            {ai_insight_html}
-
             <div class="strategic-insight">
-                <div class="insight-title">Strategic Application:</div>
-                <p>These clusters represent the most effective ways to segment your outreach. Focus on the top 3-5 clusters for maximum efficiency. Each cluster requires tailored messaging that speaks to their specific demographic identity.</p>
+                <div class="insight-title">Strategic Insight:</div>
+                <p>{self._get_religious_strategic_insight(religion_counts)}</p>
             </div>
+
+            <h3 class="subsection-title">1.2 Age Profiles by Religion</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Religion</th>
+                        <th>Avg Age</th>
+                        <th>Young (≤35)</th>
+                        <th>Middle (36-55)</th>
+                        <th>Senior (56+)</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {age_profile_rows}
+                </tbody>
+            </table>
         </div>
         """
 
         return html
 
-    def _generate_geographic_analysis(self) -> str:
-        """Generate geographic/regional analysis section (NEW)"""
-        regional_data = self.geographic_analyzer.analyze_regional_demographics()
-        enclaves = self.geographic_analyzer.identify_religious_enclaves()
-        mixed_areas = self.geographic_analyzer.analyze_mixed_areas()
+    def _get_religious_strategic_insight(self, religion_counts: pd.Series) -> str:
+        """Generate strategic insight based on religious composition"""
+        if len(religion_counts) == 0:
+            return "Insufficient data for strategic analysis."
 
-        # Build regional breakdown table
-        region_rows = ""
-        if 'regions' in regional_data:
-            for region, data in regional_data['regions'].items():
-                region_rows += f"""
-                <tr>
-                    <td>{region}</td>
-                    <td>{data['house_range']}</td>
-                    <td>{data['total_voters']:,}</td>
-                    <td>{data['percentage_of_total']}%</td>
-                    <td>{data['dominant_religion']} ({data['dominant_religion_percentage']}%)</td>
-                </tr>
-                """
+        total = religion_counts.sum()
+        dominant = religion_counts.index[0]
+        dominant_pct = round(religion_counts.iloc[0] / total * 100, 1)
 
-        # Build enclaves list
-        enclaves_html = ""
-        for enclave in enclaves[:5]:
-            if 'error' not in enclave:
-                enclaves_html += f"""
-                <div class="enclave-card">
-                    <strong>Houses {enclave['house_range']}</strong>: {enclave['religion']} stronghold
-                    ({enclave['dominance_percentage']}% - {enclave['total_voters']} voters)
-                </div>
-                """
+        if dominant_pct >= 70:
+            return f"Strong {dominant} base ({dominant_pct}%) provides solid foundation. Focus on maintaining unity and high turnout."
+        elif dominant_pct >= 60:
+            return f"{dominant} majority ({dominant_pct}%) ensures baseline support. Coalition-building with minorities recommended for decisive victory."
+        elif dominant_pct >= 50:
+            return f"{dominant} has advantage ({dominant_pct}%) but victory requires strong minority outreach and avoiding polarization."
+        else:
+            return f"Balanced demographics with {dominant} plurality ({dominant_pct}%). Success depends on building cross-community coalition."
 
-        # Build mixed areas list
-        mixed_html = ""
-        for area in mixed_areas[:3]:
-            if 'error' not in area:
-                religions = ', '.join([f"{r}: {d['percentage']}%" for r, d in area['religion_breakdown'].items()])
-                mixed_html += f"""
-                <div class="mixed-area-card">
-                    <strong>Houses {area['house_range']}</strong>: Diverse area
-                    <br><span style="font-size: 14px;">{religions}</span>
-                    <br><em>{area['strategic_importance']}</em>
-                </div>
-                """
+    def _generate_age_analysis(self) -> str:
+        """Generate age-based analysis section"""
+        age_data = self._age_distribution
 
-        # Get AI insight if enabled
-        ai_insight_html = ""
-        if self.enable_ai and self.ai_generator:
-            try:
-                geographic_summary = self.geographic_analyzer.get_geographic_summary()
-                ai_insight = self.ai_generator.generate_geographic_insight(geographic_summary)
-                ai_insight_html = f"""
-                <div class="ai-insight-box">
-                    <div class="ai-insight-title">🤖 AI Insight:</div>
-                    <p>{ai_insight}</p>
-                </div>
-                """
-            except:
-                pass
+        if 'error' in age_data:
+            return '<p>Age data not available</p>'
+
+        distribution = age_data['distribution']
+
+        # Build table
+        table_rows_parts = []
+        for age_group, data in distribution.items():
+            priority_class = self.PRIORITY_CLASSES.get(data['priority'], '')
+
+            table_rows_parts.append(f"""
+            <tr>
+                <td>{age_group}</td>
+                <td>{data['label']}</td>
+                <td>{data['count']:,}</td>
+                <td>{data['percentage']}%</td>
+                <td class="{priority_class}">{data['priority']}</td>
+            </tr>
+            """)
+        table_rows = "".join(table_rows_parts)
+
+        primary_target = age_data.get('primary_target', {})
+        first_time = age_data.get('first_time_voters', 0)
+        first_time_pct = round(first_time * self._pct_factor, 1)
 
         html = f"""
         <div class="section">
-            <h2 class="section-title">6. GEOGRAPHIC & REGIONAL ANALYSIS</h2>
+            <h2 class="section-title">2. AGE-BASED ANALYSIS & GENERATIONAL STRATEGY</h2>
 
-            <h3 class="subsection-title">6.1 Regional Demographics by House Numbers</h3>
+            <h3 class="subsection-title">2.1 Age Distribution</h3>
             <table>
                 <thead>
                     <tr>
-                        <th>Region</th>
-                        <th>House Range</th>
-                        <th>Voters</th>
-                        <th>% Total</th>
-                        <th>Dominant Group</th>
+                        <th>Age Group</th>
+                        <th>Category</th>
+                        <th>Total</th>
+                        <th>Percentage</th>
+                        <th>Strategic Priority</th>
                     </tr>
                 </thead>
                 <tbody>
-                    {region_rows}
+                    {table_rows}
                 </tbody>
             </table>
 
-            <h3 class="subsection-title">6.2 Religious Enclaves (70%+ Concentration)</h3>
-            {enclaves_html if enclaves_html else '<p>No strong religious enclaves identified (healthy diversity)</p>'}
-
-            <h3 class="subsection-title">6.3 Mixed/Swing Areas (High Diversity)</h3>
-            {mixed_html if mixed_html else '<p>No highly mixed areas identified</p>'}
-
-            {ai_insight_html}
-
-            <div class="recommendation-box">
-                <h4>Geographic Strategy:</h4>
-                <ul>
-                    <li>Target mixed areas with inclusive, cross-community messaging</li>
-                    <li>In enclaves, focus on mobilization and turnout rather than persuasion</li>
-                    <li>Use house number clustering for efficient door-to-door campaigns</li>
-                </ul>
+            <div class="strategic-insight">
+                <div class="insight-title">Critical Insight:</div>
+                <p>{primary_target.get('strategy', 'Focus on primary demographic groups')}</p>
+                <p><strong>First-time voters (18-21):</strong> {first_time:,} ({first_time_pct}% of electorate)</p>
             </div>
         </div>
         """
 
         return html
 
-    def _generate_pattern_analysis(self) -> str:
-        """Generate pattern detection and anomaly analysis section (NEW)"""
-        all_patterns = self.pattern_detector.get_all_anomalies_and_patterns()
-        summary = all_patterns['summary']
-
-        # Build critical patterns list
-        critical_html = ""
-        for i, pattern in enumerate(summary['top_5_critical'], 1):
-            severity_class = f"severity-{pattern.get('severity', 'low')}"
-            critical_html += f"""
-            <div class="pattern-card {severity_class}">
-                <div class="pattern-header">
-                    <span class="severity-badge">{pattern.get('severity', 'N/A').upper()}</span>
-                    <strong>{pattern.get('description', 'N/A')}</strong>
-                </div>
-                <p class="pattern-implication"><em>Implication:</em> {pattern.get('implication', 'N/A')}</p>
-            </div>
-            """
+    def _generate_gender_analysis(self) -> str:
+        """Generate gender analysis section"""
+        gender_data = self.election_insights.get_gender_analysis()
 
-        # Get mixed faith households
-        mixed_faith = all_patterns.get('mixed_faith_households', [])
-        mixed_faith_html = ""
-        if mixed_faith and len(mixed_faith) > 0 and 'details' in mixed_faith[0]:
-            mixed_faith_html = f"""
-            <h3 class="subsection-title">7.2 Mixed-Faith Households</h3>
-            <p>Found {mixed_faith[0].get('description', 'mixed-faith households')}</p>
-            <div class="strategic-insight">
-                <div class="insight-title">Strategic Importance:</div>
-                <p>{mixed_faith[0].get('implication', 'These households require inclusive messaging')}</p>
-            </div>
-            """
+        if 'error' in gender_data:
+            return '<p>Gender data not available</p>'
 
-        # Get AI insight if enabled
-        ai_insight_html = ""
-        if self.enable_ai and self.ai_generator:
-            try:
-                anomalies = summary['top_5_critical']
-                ai_insight = self.ai_generator.generate_anomaly_insight(anomalies)
-                ai_insight_html = f"""
-                <div class="ai-insight-box">
-                    <div class="ai-insight-title">🤖 AI Insight:</div>
-                    <p>{ai_insight}</p>
-                </div>
-                """
-            except:
-                pass
+        overall = gender_data['overall']
+        middle_women = gender_data.get('middle_aged_women', {})
 
         html = f"""
         <div class="section">
-            <h2 class="section-title">7. PATTERN DETECTION & ANOMALIES</h2>
+            <h2 class="section-title">3. GENDER ANALYSIS - THE WOMEN VOTE</h2>
 
-            <div class="metric-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{summary['total_patterns_detected']}</div>
-                    <div class="metric-label">Patterns Detected</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{summary['high_severity']}</div>
-                    <div class="metric-label">High Priority</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{summary['medium_severity']}</div>
-                    <div class="metric-label">Medium Priority</div>
-                </div>
-            </div>
+            <h3 class="subsection-title">3.1 Overall Gender Split</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Gender</th>
+                        <th>Count</th>
+                        <th>Percentage</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr>
+                        <td>Male Voters</td>
+                        <td>{overall['male_voters']:,}</td>
+                        <td>{overall['male_percentage']}%</td>
+                    </tr>
+                    <tr>
+                        <td>Female Voters</td>
+                        <td>{overall['female_voters']:,}</td>
+                        <td>{overall['female_percentage']}%</td>
+                    </tr>
+                </tbody>
+            </table>
 
-            <h3 class="subsection-title">7.1 Critical Patterns & Anomalies</h3>
-            {critical_html if critical_html else '<p>No critical patterns detected</p>'}
+            <div class="strategic-insight">
+                <div class="insight-title">Gender Gap Analysis:</div>
+                <p>Female voters {"outnumber" if overall['gender_gap'] > 0 else "trail"} male voters by {abs(overall['gender_gap']):,} votes
+                ({abs(round(overall['gender_gap'] * self._pct_factor, 1))}% margin).</p>
+            </div>
 
-            {mixed_faith_html}
+            <h3 class="subsection-title">3.2 The Critical Demographic: Middle-Aged Women (30-50 years)</h3>
+            <div class="action-list">
+                <p><strong>Total middle-aged women:</strong> {middle_women.get('total', 0):,}
+                ({middle_women.get('percentage_of_electorate', 0)}% of entire electorate)</p>
 
-            {ai_insight_html}
+                <p><strong>STRATEGIC IMPERATIVE:</strong> This group represents 1 in {round(100/middle_women.get('percentage_of_electorate', 1))} voters. They are:</p>
+                <ul>
+                    <li>Primary household decision-makers</li>
+                    <li>Concerned about healthcare, education, safety</li>
+                    <li>Influenced by welfare schemes (ration, pension, housing)</li>
+                    <li>Often decide how the entire family votes</li>
+                </ul>
 
-            <div class="action-list">
-                <h4>Action Items from Pattern Analysis:</h4>
-                <ol>
-                    <li>Review high-severity patterns and adjust strategy accordingly</li>
-                    <li>Address identified demographic gaps or imbalances</li>
-                    <li>Leverage unusual patterns as strategic opportunities</li>
-                    <li>Monitor mixed-faith households for swing potential</li>
-                </ol>
+                <p><strong>Campaign Priority:</strong></p>
+                <ul>
+                    {''.join(f'<li>{priority}</li>' for priority in middle_women.get('campaign_priorities', []))}
+                </ul>
             </div>
         </div>
         """
 
         return html
 
-    def _build_html_template(self, classification, *sections) -> str:
-        """Build complete HTML document with all sections"""
+    def _generate_household_analysis(self) -> str:
+        """Generate household and family voting blocs section"""
 
-        class_type = classification.get('type', 'UNCLASSIFIED')
+        # Get household statistics
+        stats = self.household_analyzer.get_household_statistics()
 
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Election Insights Report - {self.station_name}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Arial, sans-serif;
-            line-height: 1.6;
-            max-width: 1000px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #fff;
-            color: #333;
-        }}
+        # Get top 20 influential families
+        top_families = self.household_analyzer.get_top_influential_households(top_n=20)
 
-        .report-header {{
-            text-align: center;
-            border-bottom: 3px solid #2c3e50;
-            padding-bottom: 20px;
-            margin-bottom: 30px;
-        }}
+        # Build influential families section with expandable members
+        families_html_parts = []
+        for i, family in enumerate(top_families, 1):
+            # Build member list in one pass
+            members_html = "".join([f"""
+                <div class="member-item">
+                    <strong>{member['serial_no']}</strong> - {member['name']}
+                    ({member['gender']}, {member['age']}) - {member['relationship']}{f"<br><em style='color: #666; font-size: 13px;'>🏠 {member['house_name']}</em>" if member.get('house_name') and member['house_name'] != 'N/A' else ""}
+                </div>
+                """ for member in family['members']])
 
-        .report-title {{
-            font-size: 32px;
-            font-weight: bold;
-            color: #2c3e50;
-            margin: 10px 0;
-        }}
+            # Religious composition
+            religion_text = ", ".join([f"{k}: {v}" for k, v in family['religious_composition'].items()])
 
-        .station-info {{
-            font-size: 18px;
-            color: #666;
-            margin: 5px 0;
-        }}
+            # Format house display with name
+            house_display = f"{family['house_address']} ({family['house_name']})" if family.get('house_name') and family['house_name'] != 'N/A' else family['house_address']
 
-        .executive-summary {{
-            background: #f8f9fa;
-            border-left: 4px solid #e74c3c;
-            padding: 20px;
-            margin: 20px 0;
-        }}
+            families_html_parts.append(f"""
+            <div class="family-card">
+                <div class="family-header" onclick="toggleFamily('family{i}')">
+                    <div>
+                        <strong>#{i}. {family['head_of_household']}</strong> - {house_display}
+                        <br>
+                        <span style="font-size: 13px; color: #2563eb;">📍 {family['region_label']}</span>
+                        <br>
+                        <span style="font-size: 14px; color: #666;">
+                            {family['total_members']} members | {family['voting_power_percentage']}% voting power |
+                            {family['household_type']}
+                        </span>
+                    </div>
+                    <span class="expand-icon" id="icon{i}">▼</span>
+                </div>
+                <div class="family-members" id="family{i}">
+                    <div style="padding: 15px; background: #f8f9fa;">
+                        <p><strong>Religious Composition:</strong> {religion_text}</p>
+                        <p><strong>Strategy:</strong> {family['strategy']}</p>
+                        <hr style="margin: 10px 0;">
+                        <p><strong>Family Members:</strong></p>
+                        {members_html}
+                    </div>
+                </div>
+            </div>
+            """)
+        families_html = "".join(families_html_parts)
 
-        .critical-finding {{
-            background: #ffe4e1;
-            border-left: 4px solid #e74c3c;
-            padding: 15px;
-            margin: 15px 0;
-        }}
+        html = f"""
+        <div class="section">
+            <h2 class="section-title">4. HOUSEHOLD & FAMILY VOTING BLOCS</h2>
 
-        .classification-badge {{
-            display: inline-block;
-            padding: 5px 15px;
-            border-radius: 3px;
-            font-weight: bold;
-            color: white;
-            margin: 5px 0;
-        }}
+            <h3 class="subsection-title">4.1 Household Size Analysis</h3>
+            <p><strong>Total Unique Households:</strong> {stats['total_households']:,}</p>
+            <p><strong>Average Voters per Household:</strong> {stats['average_household_size']}</p>
+            <p><strong>Large Households (5+ voters):</strong> {stats['household_size_distribution']['large_6_10'] + stats['household_size_distribution']['very_large_10_plus']:,}</p>
+            <p><strong>Very Large Households (8+ voters):</strong> {stats['household_size_distribution']['very_large_10_plus']:,}</p>
 
-        .section {{
-            margin: 30px 0;
-        }}
+            <div class="strategic-insight">
+                <div class="insight-title">Strategic Gold Mine:</div>
+                <p>Large households contain significant voting power.
+                <strong>Winning one influential family member = winning {stats['average_household_size']} votes</strong></p>
+            </div>
 
-        .section-title {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-            margin: 25px 0 15px 0;
-        }}
+            <h3 class="subsection-title">4.2 Top 20 Influential Family Blocs</h3>
+            <p style="margin-bottom: 15px;"><em>Click on each family to view all members with serial numbers and house names</em></p>
+            {families_html}
+        </div>
+        """
 
-        .subsection-title {{
-            font-size: 18px;
-            font-weight: bold;
-            color: #34495e;
-            margin: 20px 0 10px 0;
-        }}
+        return html
 
-        .strategic-insight {{
-            background: #e8f4f8;
-            border-left: 4px solid #3498db;
-            padding: 15px;
-            margin: 15px 0;
-        }}
+    def _generate_winning_strategy(self) -> str:
+        """Generate winning strategy section"""
+        scenarios = self.election_insights.calculate_winning_scenarios()
 
-        .insight-title {{
-            font-weight: bold;
-            color: #2980b9;
-            margin-bottom: 5px;
-        }}
+        if 'error' in scenarios:
+            return '<p>Insufficient data for strategy calculation</p>'
 
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 15px 0;
-        }}
+        primary = scenarios.get('primary_strategy', {})
 
-        th {{
-            background: #34495e;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: bold;
-        }}
+        # Build requirements section
+        requirements_html_parts = []
+        for key, req in primary.get('requirements', {}).items():
+            requirements_html_parts.append(f"""
+            <li><strong>{key.replace('_', ' ').title()}:</strong> {req['total']:,} voters
+            (need {req['needed_percentage']}% = {req['expected_votes']:,} votes)</li>
+            """)
+        requirements_html = "".join(requirements_html_parts)
 
-        td {{
-            padding: 10px 12px;
-            border-bottom: 1px solid #ddd;
-        }}
+        # Key actions
+        key_actions = self._key_actions
+        actions_html = "".join([f"<li>{action}</li>" for action in key_actions])
 
-        tr:nth-child(even) {{
-            background: #f8f9fa;
-        }}
+        html = f"""
+        <div class="section">
+            <h2 class="section-title">8. WINNING STRATEGY FOR THIS DISTRICT</h2>
 
-        tr:hover {{
-            background: #ecf0f1;
-        }}
+            <h3 class="subsection-title">Scenario: {primary.get('name', 'Primary Strategy')}</h3>
+            <p><strong>Formula:</strong> {primary.get('formula', 'N/A')}</p>
 
-        .priority-high {{
-            color: #e74c3c;
-            font-weight: bold;
-        }}
+            <div class="recommendation-box">
+                <h4>Requirements:</h4>
+                <ul>
+                    {requirements_html}
+                </ul>
+                <p><strong>Expected Total:</strong> {primary.get('total_expected', 0):,} votes ({primary.get('vote_share', 0)}% vote share)</p>
+                <p><strong>Margin of Victory:</strong> {primary.get('margin', 0):,} votes</p>
+            </div>
 
-        .priority-medium {{
-            color: #f39c12;
-            font-weight: bold;
-        }}
+            <div class="action-list">
+                <h4>Key Actions:</h4>
+                <ol>
+                    {actions_html}
+                </ol>
+            </div>
+        </div>
+        """
 
-        .priority-low {{
-            color: #95a5a6;
-        }}
+        return html
 
-        .recommendation-box {{
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 15px;
-            margin: 15px 0;
-        }}
+    def _generate_priority_demographics(self) -> str:
+        """Generate priority target demographics section"""
+        priorities = self.election_insights.identify_priority_demographics()
 
-        .action-list {{
-            background: #d4edda;
-            border-left: 4px solid #28a745;
-            padding: 15px;
-            margin: 15px 0;
-        }}
+        # Add large households as priority #2
+        stats = self.household_analyzer.get_household_statistics()
+        large_house_count = stats['household_size_distribution']['large_6_10'] + stats['household_size_distribution']['very_large_10_plus']
 
-        .action-list li {{
-            margin: 8px 0;
-            font-weight: 500;
-        }}
+        # Insert large households at position 2
+        if len(priorities) >= 2:
+            priorities.insert(1, {
+                'rank': 2,
+                'demographic': 'Large households (5+ voters)',
+                'count': large_house_count,
+                'percentage': round(large_house_count / stats['total_households'] * 100, 1) if stats['total_households'] > 0 else 0,
+                'why': 'One converted family = 5-8 votes',
+                'how': 'Personal visits, respected community member introductions'
+            })
 
-        .metric-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }}
+        # Re-rank
+        for i, p in enumerate(priorities, 1):
+            p['rank'] = i
 
-        .metric-card {{
-            background: #fff;
-            border: 2px solid #e0e0e0;
-            border-radius: 5px;
-            padding: 15px;
-            text-align: center;
-        }}
+        # Build table
+        rows_html_parts = []
+        for p in priorities[:5]:  # Top 5
+            rows_html_parts.append(f"""
+            <tr>
+                <td><strong>{p['rank']}</strong></td>
+                <td>{p['demographic']}</td>
+                <td>{p['count']:,} ({p['percentage']}%)</td>
+                <td>{p['why']}</td>
+                <td>{p['how']}</td>
+            </tr>
+            """)
+        rows_html = "".join(rows_html_parts)
 
-        .metric-value {{
-            font-size: 32px;
-            font-weight: bold;
-            color: #2c3e50;
-        }}
+        html = f"""
+        <div class="section">
+            <h2 class="section-title">9. PRIORITY TARGET DEMOGRAPHICS (Rank Ordered)</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Rank</th>
+                        <th>Demographic</th>
+                        <th>Count</th>
+                        <th>Why Important</th>
+                        <th>How to Reach</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {rows_html}
+                </tbody>
+            </table>
+        </div>
+        """
 
-        .metric-label {{
-            color: #666;
-            font-size: 14px;
-            margin-top: 5px;
-        }}
+        return html
 
-        .family-card {{
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            margin: 10px 0;
-            overflow: hidden;
-        }}
+    def _generate_final_recommendations(self) -> str:
+        """Generate final recommendations section"""
+        metrics = self.election_insights.generate_success_metrics()
 
-        .family-header {{
-            background: #f8f9fa;
-            padding: 15px;
-            cursor: pointer;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
+        # Top 5 actions
+        actions = self._key_actions
+        actions_html = "".join([f"<li><strong>Action {i+1}:</strong> {action}</li>" for i, action in enumerate(actions[:5])])
 
-        .family-header:hover {{
-            background: #e9ecef;
-        }}
+        # Success metrics
+        metrics_html_parts = []
+        for key, value in metrics.get('coverage_targets', {}).items():
+            metrics_html_parts.append(f"<li>{value}</li>")
+        metrics_html = "".join(metrics_html_parts)
 
-        .family-members {{
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.3s ease;
-        }}
+        turnout = metrics.get('turnout_targets', {})
 
-        .family-members.expanded {{
-            max-height: 2000px;
-        }}
+        html = f"""
+        <div class="section">
+            <h2 class="section-title">10. FINAL RECOMMENDATIONS</h2>
 
-        .expand-icon {{
-            transition: transform 0.3s ease;
-            font-size: 18px;
-        }}
+            <div class="action-list">
+                <h3 class="subsection-title">Top 5 Actions for {self.station_name}</h3>
+                <ol>
+                    {actions_html}
+                </ol>
+            </div>
 
-        .expand-icon.rotated {{
-            transform: rotate(180deg);
-        }}
+            <div class="recommendation-box">
+                <h3 class="subsection-title">Success Metrics</h3>
+                <ul>
+                    {metrics_html}
+                </ul>
 
-        .member-item {{
-            padding: 5px 0;
-            border-bottom: 1px solid #e0e0e0;
-        }}
+                <h4 style="margin-top: 15px;">Turnout Targets:</h4>
+                <ul>
+                    <li><strong>Minimum required:</strong> {turnout.get('minimum', {}).get('percentage', 0)}% ({turnout.get('minimum', {}).get('voters', 0):,} voters)</li>
+                    <li><strong>Target:</strong> {turnout.get('target', {}).get('percentage', 0)}% ({turnout.get('target', {}).get('voters', 0):,} voters)</li>
+                    <li><strong>Stretch goal:</strong> {turnout.get('stretch', {}).get('percentage', 0)}% ({turnout.get('stretch', {}).get('voters', 0):,} voters)</li>
+                </ul>
+            </div>
+        </div>
 
-        .member-item:last-child {{
-            border-bottom: none;
-        }}
+        <div style="text-align: center; margin-top: 40px; padding: 20px; border-top: 3px solid #2c3e50;">
+            <h3>Report End</h3>
+            <p><strong>{self.station_name}:</strong> {self._total_voters_fmt} voters | Generated {self._generated_date}</p>
+        </div>
+        """
 
-        @media (max-width: 768px) {{
-            body {{
-                padding: 10px;
-            }}
+        return html
 
-            .report-title {{
-                font-size: 24px;
-            }}
+    def _generate_cross_demographic_analysis(self) -> str:
+        """Generate cross-demographic analysis section (NEW)"""
+        clusters = self.cross_demographics.identify_demographic_clusters()
 
-            .section-title {{
-                font-size: 20px;
-            }}
+        # Build top 10 clusters table
+        cluster_rows_parts = []
+        for i, cluster in enumerate(clusters[:10], 1):
+            cluster_rows_parts.append(f"""
+            <tr>
+                <td>{i}</td>
+                <td>{cluster['label']}</td>
+                <td>{cluster['count']:,}</td>
+                <td>{cluster['percentage_of_electorate']}%</td>
+                <td>{cluster['average_age']}</td>
+            </tr>
+            """)
+        cluster_rows = "".join(cluster_rows_parts)
 
-            table {{
-                font-size: 14px;
-            }}
+        # Get AI insight if enabled
+        ai_insight_html = self._ai_insight_html('cross_demographic', self.cross_demographics.analyze_age_gender_by_religion)
 
-            th, td {{
-                padding: 8px 6px;
-            }}
+        html = f"""
+        <div class="section">
+            <h2 class="section-title">5. CROSS-DEMOGRAPHIC ANALYSIS</h2>
 
-            .metric-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
+            <h3 class="subsection-title">5.1 Strategic Demographic Clusters</h3>
+            <p>Multi-dimensional demographic segments ranked by strategic value:</p>
 
-        @media print {{
-            .family-members {{
-                max-height: none !important;
-            }}
-        }}
+            <table>
+                <thead>
+                    <tr>
+                        <th>Rank</th>
+                        <th>Demographic Cluster</th>
+                        <th>Voters</th>
+                        <th>% of Electorate</th>
+                        <th>Avg Age</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {cluster_rows}
+                </tbody>
+            </table>
 
-        /* New styles for enhanced sections */
-        .ai-insight-box {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 20px 0;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
+            {ai_insight_html}
 
-        .ai-insight-title {{
-            font-weight: bold;
-            font-size: 16px;
-            margin-bottom: 8px;
-        }}
+            <div class="strategic-insight">
+                <div class="insight-title">Strategic Application:</div>
+                <p>These clusters represent the most effective ways to segment your outreach. Focus on the top 3-5 clusters for maximum efficiency. Each cluster requires tailored messaging that speaks to their specific demographic identity.</p>
+            </div>
+        </div>
+        """
 
-        .pattern-card {{
-            border-left: 4px solid #95a5a6;
-            background: #f8f9fa;
-            padding: 12px;
-            margin: 10px 0;
-            border-radius: 4px;
-        }}
+        return html
 
-        .pattern-card.severity-high {{
-            border-left-color: #e74c3c;
-            background: #ffe4e1;
-        }}
+    def _generate_geographic_analysis(self) -> str:
+        """Generate geographic/regional analysis section (NEW)"""
+        regional_data = self.geographic_analyzer.analyze_regional_demographics()
+        enclaves = self.geographic_analyzer.identify_religious_enclaves()
+        mixed_areas = self.geographic_analyzer.analyze_mixed_areas()
 
-        .pattern-card.severity-medium {{
-            border-left-color: #f39c12;
-            background: #fff3cd;
-        }}
+        # Build regional breakdown table
+        region_rows = "".join(f"""
+                <tr>
+                    <td>{region}</td>
+                    <td>{data['house_range']}</td>
+                    <td>{data['total_voters']:,}</td>
+                    <td>{data['percentage_of_total']}%</td>
+                    <td>{data['dominant_religion']} ({data['dominant_religion_percentage']}%)</td>
+                </tr>
+                """ for region, data in regional_data.get('regions', {}).items())
 
-        .pattern-card.severity-low {{
-            border-left-color: #3498db;
-            background: #e8f4f8;
-        }}
+        # Build enclaves list
+        enclaves_html = "".join(f"""
+                <div class="enclave-card">
+                    <strong>Houses {enclave['house_range']}</strong>: {enclave['religion']} stronghold
+                    ({enclave['dominance_percentage']}% - {enclave['total_voters']} voters)
+                </div>
+                """ for enclave in enclaves[:5] if 'error' not in enclave)
 
-        .pattern-header {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin-bottom: 5px;
-        }}
+        # Build mixed areas list
+        mixed_html_parts = []
+        for area in mixed_areas[:3]:
+            if 'error' not in area:
+                religions = ', '.join([f"{r}: {d['percentage']}%" for r, d in area['religion_breakdown'].items()])
+                mixed_html_parts.append(f"""
+                <div class="mixed-area-card">
+                    <strong>Houses {area['house_range']}</strong>: Diverse area
+                    <br><span style="font-size: 14px;">{religions}</span>
+                    <br><em>{area['strategic_importance']}</em>
+                </div>
+                """)
+        mixed_html = "".join(mixed_html_parts)
 
-        .severity-badge {{
-            background: #e74c3c;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 3px;
-            font-size: 11px;
-            font-weight: bold;
-        }}
+        # Get AI insight if enabled
+        ai_insight_html = self._ai_insight_html('geographic', self.geographic_analyzer.get_geographic_summary)
 
-        .pattern-card.severity-medium .severity-badge {{
-            background: #f39c12;
-        }}
+        return _GEOGRAPHIC_SECTION.format(
+            region_rows=region_rows,
+            enclaves_html=enclaves_html or '<p>No strong religious enclaves identified (healthy diversity)</p>',
+            mixed_html=mixed_html or '<p>No highly mixed areas identified</p>',
+            ai_insight_html=ai_insight_html
+        )
 
-        .pattern-card.severity-low .severity-badge {{
-            background: #3498db;
-        }}
+    def _generate_pattern_analysis(self) -> str:
+        """Generate pattern detection and anomaly analysis section (NEW)"""
+        all_patterns = self._all_patterns
+        summary = all_patterns['summary']
+        top_critical = summary['top_5_critical']
 
-        .pattern-implication {{
-            color: #555;
-            font-size: 14px;
-            margin: 5px 0 0 0;
-        }}
+        # Build critical patterns list
+        critical_html_parts = []
+        for pattern in top_critical:
+            critical_html_parts.append(_PATTERN_CARD.format(
+                severity=pattern.get('severity', 'low'),
+                severity_label=pattern.get('severity', 'N/A').upper(),
+                description=escape(pattern.get('description', 'N/A')),
+                implication=escape(pattern.get('implication', 'N/A'))
+            ))
+        critical_html = "".join(critical_html_parts)
+
+        # Get mixed faith households (the detector reports them as a single pattern)
+        mixed_faith = (all_patterns.get('mixed_faith_households') or [{}])[0]
+        mixed_faith_html = ""
+        if 'details' in mixed_faith:
+            mixed_faith_html = f"""
+            <h3 class="subsection-title">7.2 Mixed-Faith Households</h3>
+            <p>Found {escape(mixed_faith.get('description', 'mixed-faith households'))}</p>
+            <div class="strategic-insight">
+                <div class="insight-title">Strategic Importance:</div>
+                <p>{escape(mixed_faith.get('implication', 'These households require inclusive messaging'))}</p>
+            </div>
+            """
 
-        .enclave-card {{
-            background: #e8f4f8;
-            border-left: 4px solid #3498db;
-            padding: 10px 15px;
-            margin: 8px 0;
-            border-radius: 4px;
-        }}
+        # Get AI insight if enabled
+        ai_insight_html = self._ai_insight_html('anomaly', lambda: top_critical)
+
+        return _PATTERN_SECTION.format(
+            total_patterns=summary['total_patterns_detected'],
+            high_severity=summary['high_severity'],
+            medium_severity=summary['medium_severity'],
+            critical_html=critical_html or '<p>No critical patterns detected</p>',
+            mixed_faith_html=mixed_faith_html,
+            ai_insight_html=ai_insight_html
+        )
 
-        .mixed-area-card {{
-            background: #fff3cd;
-            border-left: 4px solid #f39c12;
-            padding: 10px 15px;
-            margin: 8px 0;
-            border-radius: 4px;
-        }}
-    </style>
-</head>
-<body>
+    def _build_html_template(self, *sections: str) -> List[str]:
+        """Build complete HTML document with all sections, as fragments to join or write in order"""
+        title = f"""    <title>Election Insights Report - {self.station_name}</title>
+"""
+        report_header = f"""
     <div class="report-header">
         <div class="report-title">ELECTION INSIGHTS REPORT</div>
         <div class="station-info">{self.station_name}</div>
         <div class="station-info">Pattathanam Assembly Constituency, Kollam District, Kerala</div>
-        <div class="station-info">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}</div>
-        <div class="station-info">Total Voters Analyzed: {self.total_voters:,} | Polling Area: {self.station_name}</div>
+        <div class="station-info">Generated: {self._generated_at}</div>
+        <div class="station-info">Total Voters Analyzed: {self._total_voters_fmt} | Polling Area: {self.station_name}</div>
     </div>
 
-    {''.join(sections)}
-
-    <script>
-        function toggleFamily(id) {{
-            const element = document.getElementById(id);
-            const icon = document.getElementById('icon' + id.replace('family', ''));
-
-            if (element.classList.contains('expanded')) {{
-                element.classList.remove('expanded');
-                icon.classList.remove('rotated');
-            }} else {{
-                element.classList.add('expanded');
-                icon.classList.add('rotated');
-            }}
-        }}
-    </script>
-</body>
-</html>"""
+    """
 
-        return html
+        # Only the station-specific pieces are formatted per report; the shell is static
+        return [_HTML_DOCTYPE, title, _HTML_HEAD, report_header, *sections, _HTML_TAIL]
 
-    def save_report(self, output_path: Path):
+    def save_report(self, output_path: Path) -> Path:
         """Generate and save the report"""
-        html = self.generate_full_report()
+        html_parts = self._generate_report_parts()
 
         # Create directory if it doesn't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save HTML
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        # Save HTML, writing the fragments straight out instead of joining them into one string;
+        # the 1 MB buffer holds a whole report, so it reaches the OS in a single write
+        if output_path.suffix == '.gz':
+            # Compressed report (e.g. election_report.html.gz) for hosts that serve it pre-gzipped
+            with gzip.open(output_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+                f.writelines(html_parts)
+        else:
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(html_parts)
 
         # Also save influential households data as JSON
-        top_families = self.household_analyzer.get_top_influential_households(top_n=10)
+        top_families = self.household_analyzer.get_top_influential_households(top_n=10) if self.total_voters > 0 else []
         json_path = output_path.parent / 'influential_households.json'
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(top_families, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(top_families, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(top_families, f, indent=2, ensure_ascii=False)
 
         return output_path
\ No newline at end of file
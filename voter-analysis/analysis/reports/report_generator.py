@@ -3,212 +3,278 @@ HTML Report Generator for Polling Station Analysis
 Creates comprehensive, formatted HTML reports with charts and tables
 """
 
+import os
 import json
+import hashlib
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
-class ReportGenerator:
-    """Generate HTML reports for polling station analysis"""
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
 
-    def __init__(self, analysis_results: Dict, output_dir: str):
-        self.analysis = analysis_results
-        self.output_dir = Path(output_dir)
-        self.charts = []
-
-    def generate_html_report(self) -> str:
-        """Generate complete HTML report"""
-        # Extract metadata
-        metadata = self.analysis.get('metadata', {})
-        ward_name = metadata.get('ward_name', 'Unknown Ward')
-        station_name = metadata.get('station_name', 'Unknown Station')
-        total_voters = metadata.get('total_voters', 0)
 
-        # Generate charts
-        self._create_all_charts()
-
-        # Build HTML
-        html = f"""
+# Static document shell shared by every report, assembled once at import
+_HTML_DOCTYPE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{ward_name} - {station_name} - Voter Analysis Report</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+"""
+
+_HTML_HEAD = """    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 0;
             padding: 0;
             background: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
-        }}
-        .header h2 {{
+        }
+        .header h2 {
             margin: 10px 0;
             font-size: 1.5em;
             opacity: 0.9;
-        }}
-        .header .stats {{
+        }
+        .header .stats {
             margin-top: 20px;
             display: flex;
             justify-content: center;
             gap: 30px;
-        }}
-        .header .stat {{
+        }
+        .header .stat {
             text-align: center;
-        }}
-        .header .stat-value {{
+        }
+        .header .stat-value {
             font-size: 2em;
             font-weight: bold;
-        }}
-        .header .stat-label {{
+        }
+        .header .stat-label {
             font-size: 0.9em;
             opacity: 0.8;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
-        }}
-        .section {{
+        }
+        .section {
             background: white;
             margin: 20px 0;
             padding: 25px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .section h3 {{
+        }
+        .section h3 {
             color: #333;
             border-bottom: 2px solid #667eea;
             padding-bottom: 10px;
             margin-bottom: 20px;
-        }}
-        .stats-grid {{
+        }
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin: 20px 0;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 5px;
             border-left: 4px solid #667eea;
-        }}
-        .stat-card .label {{
+        }
+        .stat-card .label {
             color: #666;
             font-size: 0.9em;
             margin-bottom: 5px;
-        }}
-        .stat-card .value {{
+        }
+        .stat-card .value {
             color: #333;
             font-size: 1.5em;
             font-weight: bold;
-        }}
-        .chart-container {{
+        }
+        .chart-container {
             margin: 20px 0;
             padding: 15px;
             background: #f8f9fa;
             border-radius: 5px;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
-        }}
-        th {{
+        }
+        th {
             background: #667eea;
             color: white;
             padding: 12px;
             text-align: left;
-        }}
-        td {{
+        }
+        td {
             padding: 10px;
             border-bottom: 1px solid #ddd;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background: #f5f5f5;
-        }}
-        .characteristics {{
+        }
+        .characteristics {
             display: flex;
             flex-wrap: wrap;
             gap: 10px;
             margin: 20px 0;
-        }}
-        .characteristic {{
+        }
+        .characteristic {
             background: #e3f2fd;
             color: #1976d2;
             padding: 8px 15px;
             border-radius: 20px;
             font-size: 0.9em;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             padding: 20px;
             color: #666;
             font-size: 0.9em;
-        }}
-        @media print {{
-            .section {{ page-break-inside: avoid; }}
-        }}
+        }
+        @media print {
+            .section { page-break-inside: avoid; }
+        }
     </style>
 </head>
 <body>
 """
 
-        # Header
-        html += self._generate_header()
-
-        # Main container
-        html += '<div class="container">'
+_HTML_TAIL = """
+</body>
+</html>
+"""
 
-        # Executive Summary
-        html += self._generate_executive_summary()
 
-        # Demographics Section
-        html += self._generate_demographics_section()
+class ReportGenerator:
+    """Generate HTML reports for polling station analysis"""
 
-        # Family Analysis Section
-        html += self._generate_family_section()
+    # Bump when the report markup or charts change so stale cached reports are not reused
+    REPORT_VERSION = '3'
 
-        # Electoral Insights Section
-        html += self._generate_electoral_section()
+    # Cached reports kept on disk; least recently used entries beyond this are evicted
+    CACHE_MAX_ENTRIES = 1024
 
-        # Unique Characteristics
-        html += self._generate_characteristics_section()
+    def __init__(self, analysis_results: Dict, output_dir: str, cache_dir: Optional[str] = None):
+        self.analysis = analysis_results
+        self.output_dir = Path(output_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(__file__).resolve().parents[2] / 'data' / 'cache' / 'reports'
+        self.charts = []
 
-        # Data Quality Section
-        html += self._generate_data_quality_section()
+    def _cache_path(self) -> Optional[Path]:
+        """Cache file for this report, keyed by the analysis content and report version"""
+        # The analysis timestamp changes on every run but is not rendered, so leave it out of the key
+        analysis = dict(self.analysis)
+        if isinstance(analysis.get('metadata'), dict):
+            analysis['metadata'] = {key: value for key, value in analysis['metadata'].items()
+                                    if key != 'analysis_timestamp'}
+
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(analysis, default=str, option=orjson.OPT_SORT_KEYS |
+                                       orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(analysis, sort_keys=True, default=str).encode()
+        except (TypeError, ValueError):
+            # Not serializable with sorted keys (e.g. mixed key types): render without the cache
+            return None
+
+        key = hashlib.blake2b(payload + self.REPORT_VERSION.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.html"
+
+    def _load_cached_report(self, cache_path: Path) -> Optional[str]:
+        """Return a cached report body, or None on a miss"""
+        try:
+            report_html = cache_path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        os.utime(cache_path)
+        return report_html
+
+    def _store_cached_report(self, cache_path: Path, report_html: str):
+        """Atomically write a rendered report body to the cache, then evict old entries"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(report_html, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+            self._evict_cache()
+        except OSError as e:
+            print(f"  Could not cache report: {e}")
+
+    def _evict_cache(self):
+        """Drop least recently used cache entries beyond CACHE_MAX_ENTRIES"""
+        entries = list(self.cache_dir.glob('*.html'))
+        if len(entries) <= self.CACHE_MAX_ENTRIES:
+            return
 
-        # Charts Section
-        html += self._generate_charts_section()
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.CACHE_MAX_ENTRIES]:
+            entry.unlink(missing_ok=True)
 
-        # Close container
-        html += '</div>'
+    def generate_html_report(self) -> str:
+        """Generate complete HTML report, reusing the stored body for identical analysis results"""
+        cache_path = self._cache_path()
+        report_body = self._load_cached_report(cache_path) if cache_path else None
+        if report_body is None:
+            report_body = self._render_report_body()
+            if cache_path:
+                self._store_cached_report(cache_path, report_body)
+
+        # The footer carries the generation time, so it is rendered fresh on every call
+        return report_body + self._generate_footer() + _HTML_TAIL
+
+    def _render_report_body(self) -> str:
+        """Render the HTML report up to the footer"""
+        # Extract metadata
+        metadata = self.analysis.get('metadata', {})
+        ward_name = metadata.get('ward_name', 'Unknown Ward')
+        station_name = metadata.get('station_name', 'Unknown Station')
+        total_voters = metadata.get('total_voters', 0)
 
-        # Footer
-        html += self._generate_footer()
+        # Generate charts
+        self._create_all_charts()
 
-        # Close HTML
-        html += """
-</body>
-</html>
-"""
-        return html
+        # Build HTML: the static shell around the generated sections, joined once
+        html_parts = [
+            _HTML_DOCTYPE,
+            f"    <title>{ward_name} - {station_name} - Voter Analysis Report</title>\n",
+            _HTML_HEAD,
+
+            # Header
+            self._generate_header(),
+
+            # Main container
+            '<div class="container">',
+            self._generate_executive_summary(),
+            self._generate_demographics_section(),
+            self._generate_family_section(),
+            self._generate_electoral_section(),
+            self._generate_characteristics_section(),
+            self._generate_data_quality_section(),
+            self._generate_charts_section(),
+            '</div>'
+        ]
+        return "".join(html_parts)
 
     def _generate_header(self) -> str:
         """Generate report header"""
@@ -312,15 +378,14 @@ class ReportGenerator:
                 <th>Percentage</th>
             </tr>
 """
-                for group, label in [('youth_18_30', 'Youth (18-30)'),
-                                    ('middle_31_60', 'Middle Age (31-60)'),
-                                    ('senior_60_plus', 'Senior (60+)')]:
-                    html += f"""
+                html += "".join(f"""
             <tr>
                 <td>{label}</td>
                 <td>{age_groups.get(group, 0)}%</td>
             </tr>
-"""
+""" for group, label in [('youth_18_30', 'Youth (18-30)'),
+                         ('middle_31_60', 'Middle Age (31-60)'),
+                         ('senior_60_plus', 'Senior (60+)')])
                 html += "</table>"
 
         # Religion Distribution
@@ -336,15 +401,14 @@ class ReportGenerator:
                 <th>Percentage</th>
             </tr>
 """
-                for rel, label in [('hindu_percentage', 'Hindu'),
-                                  ('christian_percentage', 'Christian'),
-                                  ('muslim_percentage', 'Muslim')]:
-                    html += f"""
+                html += "".join(f"""
             <tr>
                 <td>{label}</td>
                 <td>{percentages.get(rel, 0)}%</td>
             </tr>
-"""
+""" for rel, label in [('hindu_percentage', 'Hindu'),
+                       ('christian_percentage', 'Christian'),
+                       ('muslim_percentage', 'Muslim')])
                 html += "</table>"
 
         html += "</div>"
@@ -371,17 +435,16 @@ class ReportGenerator:
                 <th>Percentage</th>
             </tr>
 """
-                for size, label in [('single_person', 'Single Person'),
-                                   ('couple_2', 'Couple (2)'),
-                                   ('small_family_3_4', 'Small Family (3-4)'),
-                                   ('medium_family_5_6', 'Medium Family (5-6)'),
-                                   ('large_family_7_plus', 'Large Family (7+)')]:
-                    html += f"""
+                html += "".join(f"""
             <tr>
                 <td>{label}</td>
                 <td>{sizes.get(size, 0)}%</td>
             </tr>
-"""
+""" for size, label in [('single_person', 'Single Person'),
+                        ('couple_2', 'Couple (2)'),
+                        ('small_family_3_4', 'Small Family (3-4)'),
+                        ('medium_family_5_6', 'Medium Family (5-6)'),
+                        ('large_family_7_plus', 'Large Family (7+)')])
                 html += "</table>"
 
         html += "</div>"
@@ -421,8 +484,8 @@ class ReportGenerator:
             vote_banks = electoral['vote_banks']
             if vote_banks:
                 html += "<h4>Identified Vote Banks</h4><ul>"
-                for vb in vote_banks:
-                    html += f"<li>{vb.get('group')}: {vb.get('size')} voters ({vb.get('percentage')}%)</li>"
+                html += "".join(f"<li>{vb.get('group')}: {vb.get('size')} voters ({vb.get('percentage')}%)</li>"
+                                for vb in vote_banks)
                 html += "</ul>"
 
         html += "</div>"
@@ -440,8 +503,7 @@ class ReportGenerator:
         <h3>Unique Characteristics</h3>
         <div class="characteristics">
 """
-        for key, value in characteristics.items():
-            html += f'<div class="characteristic">{value}</div>'
+        html += "".join(f'<div class="characteristic">{value}</div>' for value in characteristics.values())
 
         html += """
         </div>
@@ -464,8 +526,7 @@ class ReportGenerator:
 
         if 'issues' in quality and quality['issues']:
             html += "<h4>Identified Issues</h4><ul>"
-            for issue in quality['issues']:
-                html += f"<li>{issue}</li>"
+            html += "".join(f"<li>{issue}</li>" for issue in quality['issues'])
             html += "</ul>"
 
         html += "</div>"
@@ -477,15 +538,13 @@ class ReportGenerator:
     <div class="section">
         <h3>Visual Analytics</h3>
 """
-        for i, chart in enumerate(self.charts):
-            html += f'<div id="chart_{i}" class="chart-container"></div>'
+        html += "".join(f'<div id="chart_{i}" class="chart-container"></div>' for i in range(len(self.charts)))
 
         html += "</div>"
 
         # Add chart scripts
         html += "<script>"
-        for i, chart in enumerate(self.charts):
-            html += f"Plotly.newPlot('chart_{i}', {chart});"
+        html += "".join(f"Plotly.newPlot('chart_{i}', {chart});" for i, chart in enumerate(self.charts))
         html += "</script>"
 
         return html
@@ -500,78 +559,77 @@ class ReportGenerator:
 """
 
     def _create_all_charts(self):
-        """Create all charts for the report"""
+        """Create all charts for the report (replacing any from an earlier render)"""
+        demographics = self.analysis.get('demographics', {})
+        basic_stats = demographics.get('basic_stats', {})
+        charts = []
+
         # Population Pyramid
-        pyramid_data = self.analysis.get('demographics', {}).get('population_pyramid', {})
+        pyramid_data = demographics.get('population_pyramid', {})
         if 'age_groups' in pyramid_data:
-            self._create_population_pyramid(pyramid_data)
+            charts.append(self._create_population_pyramid(pyramid_data))
 
         # Religion Pie Chart
-        religion_data = self.analysis.get('demographics', {}).get('basic_stats', {}).get('religion_distribution', {})
+        religion_data = basic_stats.get('religion_distribution', {})
         if 'distribution' in religion_data:
-            self._create_religion_pie_chart(religion_data['distribution'])
+            charts.append(self._create_religion_pie_chart(religion_data['distribution']))
 
         # Age Distribution Histogram
-        age_stats = self.analysis.get('demographics', {}).get('basic_stats', {}).get('age_statistics', {})
+        age_stats = basic_stats.get('age_statistics', {})
         if 'age_groups' in age_stats:
-            self._create_age_histogram(age_stats['age_groups'])
+            charts.append(self._create_age_histogram(age_stats['age_groups']))
 
-    def _create_population_pyramid(self, data: Dict):
-        """Create population pyramid chart"""
-        if 'error' in data:
-            return
+        self.charts = [chart for chart in charts if chart is not None]
 
-        fig = go.Figure()
-
-        # Male bars (negative for pyramid effect)
-        fig.add_trace(go.Bar(
-            y=data['age_groups'],
-            x=[-v for v in data['male']],
-            name='Male',
-            orientation='h',
-            marker=dict(color='lightblue')
-        ))
-
-        # Female bars
-        fig.add_trace(go.Bar(
-            y=data['age_groups'],
-            x=data['female'],
-            name='Female',
-            orientation='h',
-            marker=dict(color='pink')
-        ))
-
-        fig.update_layout(
-            title='Population Pyramid',
-            barmode='relative',
-            bargap=0.1,
-            xaxis=dict(title='Population'),
-            yaxis=dict(title='Age Group'),
-            height=400
-        )
-
-        self.charts.append(fig.to_json())
-
-    def _create_religion_pie_chart(self, data: Dict):
-        """Create religion distribution pie chart"""
+    def _create_population_pyramid(self, data: Dict) -> Optional[str]:
+        """Population pyramid chart JSON, or None if the pyramid could not be built"""
+        if 'error' in data:
+            return None
+
+        fig = {
+            'data': [
+                # Male bars (negative for pyramid effect)
+                {'type': 'bar', 'y': data['age_groups'], 'x': [-v for v in data['male']],
+                 'name': 'Male', 'orientation': 'h', 'marker': {'color': 'lightblue'}},
+
+                # Female bars
+                {'type': 'bar', 'y': data['age_groups'], 'x': data['female'],
+                 'name': 'Female', 'orientation': 'h', 'marker': {'color': 'pink'}}
+            ],
+            'layout': {
+                'title': {'text': 'Population Pyramid'},
+                'barmode': 'relative',
+                'bargap': 0.1,
+                'xaxis': {'title': {'text': 'Population'}},
+                'yaxis': {'title': {'text': 'Age Group'}},
+                'height': 400
+            }
+        }
+
+        return self._chart_json(fig)
+
+    def _create_religion_pie_chart(self, data: Dict) -> str:
+        """Religion distribution pie chart JSON"""
         labels = list(data.keys())
         values = list(data.values())
 
-        fig = go.Figure(data=[go.Pie(
-            labels=[l.capitalize() for l in labels],
-            values=values,
-            hole=0.3
-        )])
-
-        fig.update_layout(
-            title='Religious Distribution',
-            height=400
-        )
-
-        self.charts.append(fig.to_json())
-
-    def _create_age_histogram(self, data: Dict):
-        """Create age distribution histogram"""
+        fig = {
+            'data': [{
+                'type': 'pie',
+                'labels': [l.capitalize() for l in labels],
+                'values': values,
+                'hole': 0.3
+            }],
+            'layout': {
+                'title': {'text': 'Religious Distribution'},
+                'height': 400
+            }
+        }
+
+        return self._chart_json(fig)
+
+    def _create_age_histogram(self, data: Dict) -> str:
+        """Age distribution histogram JSON"""
         categories = []
         values = []
 
@@ -590,20 +648,29 @@ class ReportGenerator:
                 continue
             values.append(value)
 
-        fig = go.Figure(data=[go.Bar(
-            x=categories,
-            y=values,
-            marker_color='#667eea'
-        )])
-
-        fig.update_layout(
-            title='Age Group Distribution',
-            xaxis_title='Age Group',
-            yaxis_title='Number of Voters',
-            height=400
-        )
-
-        self.charts.append(fig.to_json())
+        fig = {
+            'data': [{
+                'type': 'bar',
+                'x': categories,
+                'y': values,
+                'marker': {'color': '#667eea'}
+            }],
+            'layout': {
+                'title': {'text': 'Age Group Distribution'},
+                'xaxis': {'title': {'text': 'Age Group'}},
+                'yaxis': {'title': {'text': 'Number of Voters'}},
+                'height': 400
+            }
+        }
+
+        return self._chart_json(fig)
+
+    @staticmethod
+    def _chart_json(fig: Dict) -> str:
+        """Serialize a Plotly figure spec ({'data': traces, 'layout': layout}) for Plotly.newPlot"""
+        if orjson is not None:
+            return orjson.dumps(fig, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        return json.dumps(fig)
 
     def save_report(self, filename: str = "report.html"):
         """Save HTML report to file"""
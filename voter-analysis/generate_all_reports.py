@@ -13,13 +13,59 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
 import time
+import warnings
 
 # Import modules
 from analysis.hierarchy_parser import HierarchyParser
-from analysis.polling_station_analyzer import PollingStationAnalyzer
+from analysis.polling_station_analyzer import PollingStationAnalyzer, safe_station_name
 from analysis.reports.report_generator import ReportGenerator
 
+def _init_worker():
+    """Silence pandas warnings in each worker process"""
+    warnings.filterwarnings('ignore')
+
+
+def _analyze_station(task):
+    """Analyze one polling station, save its data and HTML report (runs in a worker process)"""
+    ward_code, ward_name, station_num, station_name, csv_path, data_output_base, output_base = task
+
+    try:
+        analyzer = PollingStationAnalyzer(
+            ward_code=ward_code,
+            ward_name=ward_name,
+            station_num=station_num,
+            station_name=station_name,
+            csv_path=csv_path
+        )
+
+        # Run analysis; the full results stay in this worker
+        analyzer.run_analysis(return_results=False)
+        results = analyzer.analysis_results
+
+        # Save analysis results
+        station_dir = analyzer.save_results(data_output_base)
+
+        # Generate HTML report
+        report_gen = ReportGenerator(
+            analysis_results=results,
+            output_dir=f"{output_base}/{ward_code}_{ward_name}/{station_num}_{safe_station_name(station_name)}"
+        )
+        report_gen.save_report()
+
+        # Only send back what the ward summary aggregates, plus where the full results were saved
+        summary = {
+            'metadata': results['metadata'],
+            'demographics': {'basic_stats': results['demographics']['basic_stats']},
+            'results_dir': str(station_dir)
+        }
+        return summary, None
+
+    except Exception as e:
+        return None, str(e)
+
+
 def generate_all_reports():
     """Generate reports for all polling stations"""
     print("="*80)
@@ -45,6 +91,24 @@ def generate_all_reports():
     output_base = '/Users/nikzart/Developer/aislop-server/voter-analysis/reports/by_ward'
     data_output_base = '/Users/nikzart/Developer/aislop-server/voter-analysis/data/processed/by_ward'
 
+    # Analyze every station with a data file in parallel; small per-station chunks keep the
+    # workers balanced when ward sizes are skewed
+    station_tasks = []
+    for ward_key in sorted(parser.hierarchy.keys()):
+        ward_info = parser.hierarchy[ward_key]
+        for station in ward_info['stations']:
+            csv_path = parser.get_station_file(ward_key, station['number'])
+            if csv_path and Path(csv_path).exists():
+                station_tasks.append((ward_info['code'], ward_info['name'], station['number'], station['name'],
+                                      csv_path, data_output_base, output_base))
+
+    print(f"Analyzing {len(station_tasks)} polling stations...")
+    with ProcessPoolExecutor(initializer=_init_worker) as executor:
+        station_results = dict(zip(
+            (task[4] for task in station_tasks),
+            executor.map(_analyze_station, station_tasks, chunksize=4)
+        ))
+
     # Statistics tracking
     total_processed = 0
     successful = 0
@@ -79,30 +143,10 @@ def generate_all_reports():
                 ward_failed += 1
                 continue
 
-            try:
-                # Analyze polling station
-                print(f"  Processing {station_num}: {station_name}...")
-                analyzer = PollingStationAnalyzer(
-                    ward_code=ward_code,
-                    ward_name=ward_name,
-                    station_num=station_num,
-                    station_name=station_name,
-                    csv_path=csv_path
-                )
-
-                # Run analysis
-                results = analyzer.run_analysis()
-
-                # Save analysis results
-                station_output_dir = analyzer.save_results(data_output_base)
-
-                # Generate HTML report
-                report_gen = ReportGenerator(
-                    analysis_results=results,
-                    output_dir=f"{output_base}/{ward_code}_{ward_name}/{station_num}_{station_name.replace(' ', '_')[:50]}"
-                )
-                report_path = report_gen.save_report()
+            print(f"  Processing {station_num}: {station_name}...")
+            results, error = station_results[csv_path]
 
+            if error is None:
                 # Track statistics
                 successful += 1
                 ward_successful += 1
@@ -110,9 +154,8 @@ def generate_all_reports():
                 ward_analyses.append(results)
 
                 print(f"    ✓ Analysis complete: {results['metadata']['total_voters']} voters")
-
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
+            else:
+                print(f"    ✗ Error: {error}")
                 failed += 1
                 ward_failed += 1
 
@@ -277,8 +320,8 @@ def generate_ward_summary(ward_code: str, ward_name: str, station_analyses: List
     <table>
         <tr><th>Station Name</th><th>Total Voters</th></tr>
 """
-    for station in ward_summary['stations']:
-        html += f"<tr><td>{station['name']}</td><td>{station['voters']:,}</td></tr>"
+    html += "".join(f"<tr><td>{station['name']}</td><td>{station['voters']:,}</td></tr>"
+                    for station in ward_summary['stations'])
 
     html += """
     </table>
@@ -7,6 +7,8 @@ import pandas as pd
 import json
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import os
 import sys
 
 # Add analysis directory to path
@@ -15,6 +17,37 @@ sys.path.insert(0, str(Path(__file__).parent))
 from analysis.hierarchy_parser import HierarchyParser
 from analysis.reports.election_report_generator import ElectionReportGenerator
 
+# Every worker renders up to three AI sections at once, so the pool is kept small to stay under
+# the Azure OpenAI rate limit; override with ELECTION_REPORT_WORKERS
+DEFAULT_REPORT_WORKERS = 2
+
+
+def _station_output_file(report_dir: Path, ward_code: str, ward_name: str, station_number, station_name: str) -> Path:
+    """Where a station's election report is saved"""
+    output_dir = report_dir / f"{ward_code}_{ward_name}" / f"{station_number}_{station_name.replace('/', '_').replace(' ', '_')}"
+    return output_dir / 'election_report.html'
+
+
+def _generate_station_report(task):
+    """Load one station's voters and save its election report (runs in a worker process)
+
+    Returns (voter count, error, number of AI insights that failed)
+    """
+    csv_file, station_name, ward_name, output_file = task
+
+    try:
+        data = pd.read_csv(csv_file)
+        if len(data) == 0:
+            return 0, None, 0
+
+        # Generate election insights report with AI
+        generator = ElectionReportGenerator(data, station_name, ward_name, enable_ai=True)
+        generator.save_report(output_file)
+        return len(data), None, len(generator.ai_failures)
+
+    except Exception as e:
+        return None, str(e), 0
+
 
 def main():
     """Generate election insights reports for all polling stations"""
@@ -40,9 +73,26 @@ def main():
     print(f"  Total Polling Stations: {total_stations}")
     print(f"  Mapped CSV Files: {len(parser.station_to_file_map)}\n")
 
+    # Generate every mapped station's report in parallel, one station per task
+    tasks = {}
+    for ward_code in sorted(hierarchy.keys()):
+        ward_info = hierarchy[ward_code]
+        for station in ward_info['stations']:
+            full_station_id = f"{ward_code}/{station['number']}"
+            csv_file = parser.station_to_file_map.get(full_station_id)
+            if csv_file:
+                output_file = _station_output_file(report_dir, ward_code, ward_info['name'], station['number'], station['name'])
+                tasks[full_station_id] = (csv_file, station['name'], ward_info['name'], output_file)
+
+    max_workers = int(os.environ.get('ELECTION_REPORT_WORKERS', DEFAULT_REPORT_WORKERS))
+    print(f"Generating {len(tasks)} station reports with {max_workers} workers...")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        station_results = dict(zip(tasks, executor.map(_generate_station_report, tasks.values())))
+
     # Statistics
     total_voters_processed = 0
     reports_generated = 0
+    ai_failures = 0
     failed_stations = []
 
     # Process each ward
@@ -76,46 +126,38 @@ def main():
                 })
                 continue
 
-            try:
-                # Load data
-                data = pd.read_csv(csv_file)
-                voter_count = len(data)
-                print(f"    Loaded {voter_count:,} voters")
-
-                if voter_count == 0:
-                    print(f"    ⚠ Empty dataset - Skipping")
-                    failed_stations.append({
-                        'ward': ward_name,
-                        'station': station_name,
-                        'reason': 'Empty dataset'
-                    })
-                    continue
-
-                # Generate election insights report with AI
-                print(f"    Generating election insights report with AI...")
-                generator = ElectionReportGenerator(data, station_name, ward_name, enable_ai=True)
-
-                # Create output path
-                output_dir = report_dir / f"{ward_code}_{ward_name}" / f"{station_number}_{station_name.replace('/', '_').replace(' ', '_')}"
-                output_file = output_dir / 'election_report.html'
-
-                # Save report
-                generator.save_report(output_file)
-
-                print(f"    ✓ Report saved to {output_file}")
-
-                ward_voters += voter_count
-                ward_reports += 1
-                reports_generated += 1
-                total_voters_processed += voter_count
-
-            except Exception as e:
-                print(f"    ✗ Error: {str(e)}")
+            voter_count, error, station_ai_failures = station_results[full_station_id]
+
+            if error is not None:
+                print(f"    ✗ Error: {error}")
                 failed_stations.append({
                     'ward': ward_name,
                     'station': station_name,
-                    'reason': str(e)
+                    'reason': error
                 })
+                continue
+
+            print(f"    Loaded {voter_count:,} voters")
+
+            if voter_count == 0:
+                print(f"    ⚠ Empty dataset - Skipping")
+                failed_stations.append({
+                    'ward': ward_name,
+                    'station': station_name,
+                    'reason': 'Empty dataset'
+                })
+                continue
+
+            output_file = tasks[full_station_id][3]
+            print(f"    ✓ Report saved to {output_file}")
+            if station_ai_failures:
+                print(f"    ⚠ {station_ai_failures} AI insight(s) failed - report saved without them")
+                ai_failures += station_ai_failures
+
+            ward_voters += voter_count
+            ward_reports += 1
+            reports_generated += 1
+            total_voters_processed += voter_count
 
         print(f"\n  Ward Summary: {ward_reports}/{len(ward_info['stations'])} stations processed")
         print(f"  Total Voters in Ward: {ward_voters:,}")
@@ -129,6 +171,7 @@ def main():
     print(f"Total Reports Generated: {reports_generated}/{total_stations}")
     print(f"Total Voters Analyzed: {total_voters_processed:,}")
     print(f"Failed Stations: {len(failed_stations)}")
+    print(f"Failed AI Insights: {ai_failures}")
 
     # Save master summary
     summary = {
@@ -138,6 +181,7 @@ def main():
         'reports_generated': reports_generated,
         'total_voters_analyzed': total_voters_processed,
         'failed_stations': failed_stations,
+        'failed_ai_insights': ai_failures,
         'ward_breakdown': {}
     }
 
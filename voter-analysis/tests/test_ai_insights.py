@@ -0,0 +1,52 @@
+"""
+Tests for the AIInsightsGenerator insight cache
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add analysis directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis.core.ai_insights import AIInsightsGenerator
+
+
+def _generator(cache_dir) -> AIInsightsGenerator:
+    """Generator whose API client echoes the prompt back as the insight"""
+    generator = AIInsightsGenerator(api_key='test-key', endpoint='https://example.invalid', cache_dir=cache_dir)
+    generator.client = mock.Mock()
+    generator.client.chat.completions.create.side_effect = lambda **request: mock.Mock(
+        choices=[mock.Mock(message=mock.Mock(content=request['messages'][-1]['content']))]
+    )
+    return generator
+
+
+def test_insight_cache_reuses_and_evicts_least_recently_used(tmp_path, monkeypatch):
+    """Repeated prompts skip the API call, and the cache keeps only the most recently used entries"""
+    monkeypatch.setattr(AIInsightsGenerator, 'CACHE_MAX_ENTRIES', 2)
+    generator = _generator(tmp_path)
+
+    assert generator._complete('first') == 'first'
+    assert generator._complete('second') == 'second'
+    assert generator.client.chat.completions.create.call_count == 2
+
+    # Age both entries, then reuse 'first' so 'second' is the least recently used
+    for entry in tmp_path.glob('*.txt'):
+        os.utime(entry, (0, 0))
+    assert generator._complete('first') == 'first'
+    assert generator.client.chat.completions.create.call_count == 2
+
+    generator._complete('third')
+    assert sorted(entry.read_text() for entry in tmp_path.glob('*.txt')) == ['first', 'third']
+
+
+def test_insight_version_is_part_of_the_cache_key(tmp_path, monkeypatch):
+    """Bumping INSIGHT_VERSION stops stale insights from being reused"""
+    generator = _generator(tmp_path)
+    generator._complete('prompt')
+
+    monkeypatch.setattr(AIInsightsGenerator, 'INSIGHT_VERSION', 'next')
+    generator._complete('prompt')
+    assert generator.client.chat.completions.create.call_count == 2
@@ -0,0 +1,79 @@
+"""
+Tests for HouseholdAnalyzer results and households with missing ages
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add analysis directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis.core.household_analyzer import HouseholdAnalyzer
+
+
+def _two_households(age_dtype=None) -> pd.DataFrame:
+    """House 1/1 has no known ages, house 1/2 has two"""
+    data = pd.DataFrame({
+        'OldWard No/ House No.': ['1/1', '1/1', '1/2', '1/2'],
+        'House Name': ['Alpha', 'Alpha', 'Beta', 'Beta'],
+        'Name': ['A', 'B', 'C', 'D'],
+        "Guardian's Name": ['W', 'X', 'Y', 'Z'],
+        'Gender': ['M', 'F', 'M', 'F'],
+        'Age': [np.nan, np.nan, 30, 50],
+        'religion': ['Hindu'] * 4
+    })
+    if age_dtype:
+        data['Age'] = data['Age'].astype(age_dtype)
+    return data
+
+
+@pytest.mark.parametrize('age_dtype', [None, 'Int16'], ids=['float', 'nullable'])
+def test_head_of_household_with_missing_ages(age_dtype):
+    """A household with no known ages has an 'Unknown' head instead of failing the report"""
+    households = HouseholdAnalyzer(_two_households(age_dtype)).get_top_influential_households(top_n=5)
+
+    heads = {household['house_address']: household['head_of_household'] for household in households}
+    assert heads == {'1/1': 'Unknown', '1/2': 'D'}
+
+
+def test_extracted_ages_keep_the_caller_values():
+    """Ages extracted from 'Gender / Age' stay plain numbers in the caller's frame, out-of-range ones included"""
+    data = pd.DataFrame({
+        'OldWard No/ House No.': ['1/1', '1/1', '1/1'],
+        'House Name': ['Alpha'] * 3,
+        'Name': ['A', 'B', 'C'],
+        'Gender / Age': ['M / 200', 'F / 40', 'F'],
+        'religion': ['Hindu'] * 3
+    })
+    HouseholdAnalyzer(data).get_top_influential_households()
+
+    assert data['Age'].dtype == np.float64
+    assert data['Age'].iloc[:2].tolist() == [200, 40]
+    assert pd.isna(data['Age'].iloc[2])
+
+
+def test_repeated_calls_return_equal_results():
+    """Memoized results come back unchanged even if a caller modified an earlier result"""
+    analyzer = HouseholdAnalyzer(_two_households())
+
+    households = analyzer.get_top_influential_households(top_n=5)
+    statistics = analyzer.get_household_statistics()
+    large = analyzer.get_top_large_households(min_size=1)
+    special = analyzer.identify_special_households()
+    expected = (copy.deepcopy(households), copy.deepcopy(statistics), large.copy(), copy.deepcopy(special))
+
+    households[0]['head_of_household'] = 'Changed'
+    households.clear()
+    statistics.clear()
+    large.iloc[:, 0] = None
+    special.clear()
+
+    assert analyzer.get_top_influential_households(top_n=5) == expected[0]
+    assert analyzer.get_household_statistics() == expected[1]
+    pd.testing.assert_frame_equal(analyzer.get_top_large_households(min_size=1), expected[2])
+    assert analyzer.identify_special_households() == expected[3]
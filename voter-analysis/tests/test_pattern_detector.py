@@ -0,0 +1,56 @@
+"""
+Tests for PatternDetector on stations with missing or unusual ages
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add analysis directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis.core.pattern_detector import PatternDetector
+
+
+@pytest.mark.parametrize('ages', [[np.nan] * 25, [40] + [np.nan] * 24], ids=['no_ages', 'single_age'])
+def test_age_anomalies_without_age_spread(ages):
+    """Stations with no measurable age spread skip the age checks instead of failing the report"""
+    data = pd.DataFrame({'Age': ages, 'religion': ['Hindu'] * 25, 'Gender': ['M'] * 25})
+    detector = PatternDetector(data)
+
+    assert detector.detect_age_anomalies() == []
+    assert detector.detect_age_religion_correlations() == []
+    assert 'summary' in detector.get_all_anomalies_and_patterns()
+
+
+def test_fractional_and_out_of_range_ages_are_kept():
+    """Fractional and out-of-range ages keep their values in the age statistics"""
+    ages = [25.5, 200] + [40] * 23
+    data = pd.DataFrame({'Age': ages, 'religion': ['Hindu'] * 25, 'Gender': ['M'] * 25})
+    detector = PatternDetector(data)
+
+    assert detector._age_stats['mean'] == pytest.approx(np.mean(ages))
+    assert detector._age_stats['std'] == pytest.approx(pd.Series(ages).std())
+    assert detector._sorted_ages.tolist() == sorted(ages)
+    assert isinstance(detector.detect_age_anomalies(), list)
+    assert 'summary' in detector.get_all_anomalies_and_patterns()
+
+
+def test_mixed_faith_households_skip_voters_without_household():
+    """Voters with a missing household_id are left out instead of breaking the household counts"""
+    data = pd.DataFrame({
+        'household_id': ['1/1', '1/1', np.nan, '1/2'],
+        'house_address': ['1/1', '1/1', np.nan, '1/2'],
+        'religion': ['Hindu', 'Christian', 'Muslim', 'Hindu'],
+        'Age': [40, 38, 30, 50],
+        'Gender': ['M', 'F', 'M', 'F'],
+    })
+    detector = PatternDetector(data)
+
+    (summary,) = detector.detect_mixed_faith_households()
+    (household,) = summary['details']
+    assert household['total_voters'] == 2
+    assert household['breakdown'] == {'Hindu': 1, 'Christian': 1}
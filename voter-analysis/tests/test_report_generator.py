@@ -0,0 +1,37 @@
+"""
+Tests for the ReportGenerator report cache
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# Add analysis directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis.reports import report_generator
+from analysis.reports.report_generator import ReportGenerator
+
+
+def _analysis(timestamp):
+    return {'metadata': {'ward_name': 'Test Ward', 'station_name': 'Test Station',
+                         'total_voters': 3, 'analysis_timestamp': timestamp}}
+
+
+def test_cached_report_renders_a_fresh_footer(tmp_path):
+    """Re-analysed stations reuse the cached body but show the current generation time"""
+    first = ReportGenerator(_analysis('2024-01-01T10:00:00'), tmp_path / 'out', cache_dir=tmp_path / 'cache')
+    second = ReportGenerator(_analysis('2024-06-01T10:00:00'), tmp_path / 'out', cache_dir=tmp_path / 'cache')
+    assert first._cache_path() == second._cache_path()
+
+    with mock.patch.object(report_generator, 'datetime') as clock:
+        clock.now.return_value = datetime(2024, 1, 1, 10, 0)
+        first_html = first.generate_html_report()
+        clock.now.return_value = datetime(2024, 6, 1, 10, 0)
+        second_html = second.generate_html_report()
+
+    assert len(list((tmp_path / 'cache').glob('*.html'))) == 1
+    assert 'Generated on January 01, 2024' in first_html
+    assert 'Generated on June 01, 2024' in second_html
+    assert 'January' not in second_html